@@ -1,4 +1,12 @@
-__all__ = ["GitAutograderAnswersRecord", "GitAutograderAnswers"]
+__all__ = [
+    "GitAutograderAnswersRecord",
+    "GitAutograderAnswers",
+    "CompiledValidationPlan",
+    "GitAutograderAnswersBatch",
+    "GitAutograderAnswersBatchResult",
+]
 
 from .answers_record import GitAutograderAnswersRecord
 from .answers import GitAutograderAnswers
+from .validation_plan import CompiledValidationPlan
+from .answers_batch import GitAutograderAnswersBatch, GitAutograderAnswersBatchResult
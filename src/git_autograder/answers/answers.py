@@ -4,6 +4,7 @@ from typing import Dict, List, Optional
 from git_autograder.answers.answers_record import GitAutograderAnswersRecord
 from git_autograder.answers.rules.answer_rule import AnswerRule
 from git_autograder.answers.rules.not_empty_rule import NotEmptyRule
+from git_autograder.answers.validation_plan import CompiledValidationPlan
 from git_autograder.exception import (
     GitAutograderInvalidStateException,
     GitAutograderWrongAnswerException,
@@ -71,17 +72,32 @@ class GitAutograderAnswers:
         self.validations[question] += rules
         return self
 
-    def validate(self) -> None:
+    def compile_validations(self) -> CompiledValidationPlan:
+        """
+        Compiles the validations added so far into a plan that can be reused to
+        validate other answers of the same exercise.
+        """
+        return CompiledValidationPlan.compile(self.validations)
+
+    def validate(self, plan: Optional[CompiledValidationPlan] = None) -> None:
+        """
+        Validates the answers against the given plan, or against the validations
+        added to these answers if no plan is given.
+
+        :raises GitAutograderInvalidStateException: if a validated question is not present.
+        :raises GitAutograderWrongAnswerException: if any validation fails.
+        """
+        if plan is None:
+            plan = CompiledValidationPlan(
+                rules={q: tuple(rules) for q, rules in self.validations.items()}
+            )
+
         errors: List[str] = []
 
-        for question, validations in self.validations.items():
-            answer_record = self.question(question)
-            for validation in validations:
-                try:
-                    validation.apply(answer_record)
-                except Exception as e:
-                    errors.append(str(e))
-                    break
+        for question in plan.rules:
+            error = plan.check(self.question(question))
+            if error is not None:
+                errors.append(error)
 
         if errors:
             raise GitAutograderWrongAnswerException(errors)
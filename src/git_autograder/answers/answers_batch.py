@@ -0,0 +1,119 @@
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Union
+
+from git_autograder.answers.answers import GitAutograderAnswers
+from git_autograder.answers.answers_parser import GitAutograderAnswersParser
+from git_autograder.answers.answers_record import GitAutograderAnswersRecord
+from git_autograder.answers.validation_plan import CompiledValidationPlan
+
+
+@dataclass
+class GitAutograderAnswersBatchResult:
+    # Keyed by the answers file path as given, an empty list means all validations passed
+    errors: Dict[str, List[str]] = field(default_factory=dict)
+    # Number of files that gave each answer, keyed by question then answer
+    answer_frequencies: Dict[str, Counter[str]] = field(default_factory=dict)
+
+    @property
+    def passed(self) -> List[str]:
+        return [path for path, errors in self.errors.items() if not errors]
+
+    @property
+    def failed(self) -> List[str]:
+        return [path for path, errors in self.errors.items() if errors]
+
+
+def _parse_answers_file(path: str) -> Union[GitAutograderAnswers, str]:
+    # Module level so that it can be sent to worker processes
+    try:
+        return GitAutograderAnswersParser(path).answers
+    except Exception as e:
+        return str(e)
+
+
+class GitAutograderAnswersBatch:
+    """
+    Validates many answers files against a single compiled validation plan.
+
+    Files are parsed in a process pool and every distinct answer to a question is
+    only validated once, since most submissions in a cohort share the same answers.
+
+    :param plan: Validation plan shared by every answers file.
+    :type plan: CompiledValidationPlan
+    :param max_workers: Number of parsing processes, parses in-process if 1.
+    :type max_workers: Optional[int]
+    """
+
+    def __init__(
+        self, plan: CompiledValidationPlan, max_workers: Optional[int] = None
+    ) -> None:
+        self.plan = plan
+        self.max_workers = max_workers
+
+    def validate(
+        self, paths: Sequence[Union[str, os.PathLike[str]]]
+    ) -> GitAutograderAnswersBatchResult:
+        str_paths = [os.fspath(path) for path in paths]
+        parsed = self.__parse_all(str_paths)
+
+        result = GitAutograderAnswersBatchResult(
+            errors={path: [] for path in str_paths}
+        )
+
+        # Parse failures replace any validation errors for that file
+        parse_errors: Dict[str, str] = {}
+        indices: List[Dict[str, int]] = []
+        for path, answers in zip(str_paths, parsed):
+            if isinstance(answers, str):
+                parse_errors[path] = answers
+                indices.append({})
+                continue
+
+            index: Dict[str, int] = {}
+            for i, (question, answer) in enumerate(
+                zip(answers.questions, answers.answers)
+            ):
+                # Lookups by question always resolve to the first matching record
+                if question in index:
+                    continue
+                index[question] = i
+                result.answer_frequencies.setdefault(question, Counter())[answer] += 1
+            indices.append(index)
+
+        for question in self.plan.rules:
+            groups: Dict[str, List[str]] = {}
+            for path, answers, index in zip(str_paths, parsed, indices):
+                if isinstance(answers, str):
+                    continue
+                if question not in index:
+                    result.errors[path].append(
+                        GitAutograderAnswers.MISSING_QUESTION.format(question=question)
+                    )
+                    continue
+                groups.setdefault(answers.answers[index[question]], []).append(path)
+
+            for answer, group_paths in groups.items():
+                error = self.plan.check(
+                    GitAutograderAnswersRecord(question=question, answer=answer)
+                )
+                if error is None:
+                    continue
+                for path in group_paths:
+                    result.errors[path].append(error)
+
+        for path, error in parse_errors.items():
+            result.errors[path] = [error]
+
+        return result
+
+    def __parse_all(self, paths: List[str]) -> List[Union[GitAutograderAnswers, str]]:
+        if self.max_workers == 1 or len(paths) <= 1:
+            return [_parse_answers_file(path) for path in paths]
+
+        workers = self.max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_parse_answers_file, paths, chunksize=chunksize))
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Iterable, Tuple
 
 from git_autograder.answers.answers_record import GitAutograderAnswersRecord
 
@@ -6,3 +7,21 @@ from git_autograder.answers.answers_record import GitAutograderAnswersRecord
 class AnswerRule(ABC):
     @abstractmethod
     def apply(self, answer: GitAutograderAnswersRecord) -> None: ...
+
+    def compile(self) -> "AnswerRule":
+        """
+        Returns a copy of the rule with its expected values normalized once, so that
+        apply only has to normalize the given answer.
+
+        Rules that are not compiled normalize their current values on every apply.
+        Values changed after compiling are not seen by the compiled copy.
+        """
+        return self
+
+    @staticmethod
+    def _normalize(value: str, lower: bool) -> str:
+        return value.lower() if lower else value
+
+    @staticmethod
+    def _normalize_all(values: Iterable[str], lower: bool) -> Tuple[str, ...]:
+        return tuple(v.lower() for v in values) if lower else tuple(values)
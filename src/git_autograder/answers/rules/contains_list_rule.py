@@ -1,4 +1,5 @@
-from typing import List
+import copy
+from typing import FrozenSet, List, Optional
 
 from git_autograder.answers.answers_record import GitAutograderAnswersRecord
 from git_autograder.answers.rules.answer_rule import AnswerRule
@@ -14,17 +15,20 @@ class ContainsListRule(AnswerRule):
         self.values = values
         self.subset = subset
         self.is_case_sensitive = is_case_sensitive
+        self._expected: Optional[FrozenSet[str]] = None
+
+    def compile(self) -> "ContainsListRule":
+        compiled = copy.copy(self)
+        compiled._expected = self.__expected()
+        return compiled
 
     def apply(self, answer: GitAutograderAnswersRecord) -> None:
-        expected = set(
-            [v.lower() for v in self.values] if self.is_case_sensitive else self.values
-        )
-        given = (
-            [v.lower() for v in answer.answer_as_list()]
-            if self.is_case_sensitive
-            else answer.answer_as_list()
-        )
-        if self.subset and not all([v in expected for v in given]):
+        expected = self._expected if self._expected is not None else self.__expected()
+        given = self._normalize_all(answer.answer_as_list(), self.is_case_sensitive)
+        if self.subset and not expected.issuperset(given):
             raise Exception(self.INVALID_ITEM.format(question=answer.question))
-        elif not any([v in expected for v in given]):
+        elif expected.isdisjoint(given):
             raise Exception(self.ALL_INVALID.format(question=answer.question))
+
+    def __expected(self) -> FrozenSet[str]:
+        return frozenset(self._normalize_all(self.values, self.is_case_sensitive))
@@ -1,3 +1,6 @@
+import copy
+from typing import Optional
+
 from git_autograder.answers.answers_record import GitAutograderAnswersRecord
 from git_autograder.answers.rules.answer_rule import AnswerRule
 
@@ -8,9 +11,17 @@ class ContainsValueRule(AnswerRule):
     def __init__(self, value: str, is_case_sensitive: bool = False) -> None:
         self.value = value
         self.is_case_sensitive = is_case_sensitive
+        self._expected: Optional[str] = None
+
+    def compile(self) -> "ContainsValueRule":
+        compiled = copy.copy(self)
+        compiled._expected = self._normalize(self.value, self.is_case_sensitive)
+        return compiled
 
     def apply(self, answer: GitAutograderAnswersRecord) -> None:
-        expected = self.value.lower() if self.is_case_sensitive else self.value
-        given = answer.answer.lower() if self.is_case_sensitive else answer.answer
+        expected = self._expected
+        if expected is None:
+            expected = self._normalize(self.value, self.is_case_sensitive)
+        given = self._normalize(answer.answer, self.is_case_sensitive)
         if given not in expected:
             raise Exception(self.MISSING_ANSWER.format(question=answer.question))
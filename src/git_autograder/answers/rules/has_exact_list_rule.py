@@ -1,4 +1,5 @@
-from typing import List
+import copy
+from typing import FrozenSet, List, Optional, Tuple
 
 from git_autograder.answers.answers_record import GitAutograderAnswersRecord
 from git_autograder.answers.rules.answer_rule import AnswerRule
@@ -16,19 +17,23 @@ class HasExactListRule(AnswerRule):
         self.values = values
         self.ordered = ordered
         self.is_case_sensitive = is_case_sensitive
+        self._expected: Optional[Tuple[str, ...]] = None
+        self._expected_set: Optional[FrozenSet[str]] = None
+
+    def compile(self) -> "HasExactListRule":
+        compiled = copy.copy(self)
+        compiled._expected = self._normalize_all(self.values, self.is_case_sensitive)
+        compiled._expected_set = frozenset(compiled._expected)
+        return compiled
 
     def apply(self, answer: GitAutograderAnswersRecord) -> None:
-        expected = (
-            [v.lower() for v in self.values] if self.is_case_sensitive else self.values
-        )
-        given = (
-            [v.lower() for v in answer.answer_as_list()]
-            if self.is_case_sensitive
-            else answer.answer_as_list()
-        )
+        expected = self._expected
+        expected_set = self._expected_set
+        if expected is None or expected_set is None:
+            expected = self._normalize_all(self.values, self.is_case_sensitive)
+            expected_set = frozenset(expected)
+        given = self._normalize_all(answer.answer_as_list(), self.is_case_sensitive)
         if self.ordered and expected != given:
             raise Exception(self.INCORRECT_ORDERED.format(question=answer.question))
-        elif not self.ordered and len(set(expected).intersection(set(given))) != len(
-            expected
-        ):
+        elif not self.ordered and not expected_set.issubset(given):
             raise Exception(self.INCORRECT_UNORDERED.format(question=answer.question))
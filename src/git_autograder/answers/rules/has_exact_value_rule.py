@@ -1,3 +1,6 @@
+import copy
+from typing import Optional
+
 from git_autograder.answers.answers_record import GitAutograderAnswersRecord
 from git_autograder.answers.rules.answer_rule import AnswerRule
 
@@ -9,9 +12,17 @@ class HasExactValueRule(AnswerRule):
         super().__init__()
         self.value = value
         self.is_case_sensitive = is_case_sensitive
+        self._expected: Optional[str] = None
+
+    def compile(self) -> "HasExactValueRule":
+        compiled = copy.copy(self)
+        compiled._expected = self._normalize(self.value, self.is_case_sensitive)
+        return compiled
 
     def apply(self, answer: GitAutograderAnswersRecord) -> None:
-        expected = self.value.lower() if self.is_case_sensitive else self.value
-        given = answer.answer.lower() if self.is_case_sensitive else answer.answer
+        expected = self._expected
+        if expected is None:
+            expected = self._normalize(self.value, self.is_case_sensitive)
+        given = self._normalize(answer.answer, self.is_case_sensitive)
         if given != expected:
             raise Exception(self.NOT_EXACT.format(question=answer.question))
@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from git_autograder.answers.answers_record import GitAutograderAnswersRecord
+from git_autograder.answers.rules.answer_rule import AnswerRule
+
+
+@dataclass(frozen=True)
+class CompiledValidationPlan:
+    """
+    Answer validations with their rules compiled ahead of time.
+
+    A plan only depends on the exercise definition, so it can be built once and
+    reused to validate every submission of that exercise.
+    """
+
+    rules: Dict[str, Tuple[AnswerRule, ...]]
+
+    @staticmethod
+    def compile(
+        validations: Dict[str, List[AnswerRule]],
+    ) -> "CompiledValidationPlan":
+        return CompiledValidationPlan(
+            rules={
+                question: tuple(rule.compile() for rule in rules)
+                for question, rules in validations.items()
+            }
+        )
+
+    @property
+    def questions(self) -> List[str]:
+        return list(self.rules.keys())
+
+    def check(self, record: GitAutograderAnswersRecord) -> Optional[str]:
+        """
+        Applies the rules of the record's question in order.
+
+        :returns: Message of the first rule that fails, else None.
+        :rtype: Optional[str]
+        """
+        for rule in self.rules.get(record.question, ()):
+            try:
+                rule.apply(record)
+            except Exception as e:
+                return str(e)
+        return None
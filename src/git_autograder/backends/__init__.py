@@ -0,0 +1,45 @@
+__all__ = [
+    "ObjectBackend",
+    "CommitInfo",
+    "ReflogLine",
+    "GitPythonObjectBackend",
+    "BACKEND_ENV_VAR",
+    "open_backend",
+]
+
+import importlib.util
+import os
+from typing import Optional
+
+from git import Repo
+
+from .object_backend import CommitInfo, ObjectBackend, ReflogLine
+from .gitpython_object_backend import GitPythonObjectBackend
+
+# Name of the backend to use when none is given, one of auto, gitpython or pygit2
+BACKEND_ENV_VAR = "GIT_AUTOGRADER_BACKEND"
+
+
+def open_backend(repo: Repo, name: Optional[str] = None) -> ObjectBackend:
+    """
+    Opens the object backend of a repository.
+
+    When no name is given, it is read from the GIT_AUTOGRADER_BACKEND environment
+    variable, and defaults to gitpython. pygit2 is only used when asked for, either
+    by name or through the auto backend, which uses it when it is installed.
+
+    :raises ValueError: when the backend name is unknown.
+    """
+    name = (name or os.environ.get(BACKEND_ENV_VAR) or "gitpython").lower()
+    if name == "auto":
+        name = (
+            "pygit2" if importlib.util.find_spec("pygit2") is not None else "gitpython"
+        )
+
+    if name == "gitpython":
+        return GitPythonObjectBackend(repo)
+    if name == "pygit2":
+        from .pygit2_object_backend import Pygit2ObjectBackend
+
+        return Pygit2ObjectBackend(os.fspath(repo.git_dir))
+    raise ValueError(f"Unknown backend {name}")
@@ -0,0 +1,93 @@
+from typing import Dict, Iterator, List, Optional
+
+from git import BadName, Commit, GitCommandError, Repo
+from git.util import hex_to_bin
+
+from git_autograder.backends.object_backend import CommitInfo, ObjectBackend, ReflogLine
+
+
+class GitPythonObjectBackend(ObjectBackend):
+    """Backend built on GitPython, which runs git for walks, reflogs and tree diffs."""
+
+    name = "gitpython"
+
+    def __init__(self, repo: Repo) -> None:
+        self.repo = repo
+
+    def head_sha(self) -> Optional[str]:
+        if not self.repo.head.is_valid():
+            return None
+        return self.repo.head.commit.hexsha
+
+    def resolve(self, rev: str) -> Optional[str]:
+        try:
+            return self.repo.commit(rev).hexsha
+        except (BadName, ValueError):
+            return None
+
+    def branch_names(self) -> List[str]:
+        return sorted(head.name for head in self.repo.heads)
+
+    def commit(self, sha: str) -> CommitInfo:
+        commit = Commit(self.repo, hex_to_bin(sha))
+        message = commit.message
+        return CommitInfo(
+            sha=commit.hexsha,
+            tree_sha=commit.tree.hexsha,
+            parents=tuple(parent.hexsha for parent in commit.parents),
+            message=message.decode("utf-8", "replace")
+            if isinstance(message, bytes)
+            else message,
+            author_name=commit.author.name or "",
+            author_email=commit.author.email or "",
+            authored_date=commit.authored_date,
+            committed_date=commit.committed_date,
+        )
+
+    def walk(self, sha: str) -> Iterator[str]:
+        return iter(self.repo.git.rev_list("--date-order", sha).splitlines())
+
+    def is_ancestor(self, ancestor: str, descendant: str) -> bool:
+        return self.repo.is_ancestor(
+            Commit(self.repo, hex_to_bin(ancestor)),
+            Commit(self.repo, hex_to_bin(descendant)),
+        )
+
+    def branches_containing(self, sha: str) -> List[str]:
+        output = self.repo.git.branch(
+            "--contains", sha, "--format=%(refname)", "--sort=refname"
+        )
+        prefix = "refs/heads/"
+        # A detached HEAD is listed too, without a refs/heads/ ref name
+        return [
+            line[len(prefix) :]
+            for line in output.splitlines()
+            if line.startswith(prefix)
+        ]
+
+    def reflog(self, ref: str) -> List[ReflogLine]:
+        try:
+            output = self.repo.git.log("-g", "--format=%H%x00%h%x00%gs", ref, "--")
+        except GitCommandError:
+            return []
+        lines = []
+        for line in output.splitlines():
+            sha, short_sha, message = line.split("\x00", 2)
+            lines.append(ReflogLine(sha=sha, short_sha=short_sha, message=message))
+        return lines
+
+    def read_blob(self, sha: str, file_path: str) -> Optional[bytes]:
+        try:
+            blob = Commit(self.repo, hex_to_bin(sha)).tree / file_path
+        except KeyError:
+            return None
+        if blob.type != "blob":
+            return None
+        return blob.data_stream.read()
+
+    def changed_paths(self, a_sha: str, b_sha: str) -> Dict[str, str]:
+        output = self.repo.git.diff_tree(
+            "-r", "--no-renames", "--name-status", "-z", a_sha, b_sha
+        )
+        parts = output.split("\x00")
+        return {parts[i + 1]: parts[i] for i in range(0, len(parts) - 1, 2) if parts[i]}
@@ -0,0 +1,88 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class CommitInfo:
+    """Fields of a commit object, read without keeping a handle on the commit."""
+
+    sha: str
+    tree_sha: str
+    parents: Tuple[str, ...]
+    message: str
+    author_name: str
+    author_email: str
+    authored_date: int
+    committed_date: int
+
+
+@dataclass(frozen=True)
+class ReflogLine:
+    """Reflog entry as written by git, with the abbreviated sha git reflog shows."""
+
+    sha: str
+    short_sha: str
+    message: str
+
+
+class ObjectBackend(ABC):
+    """
+    Read access to the objects and refs of a repository.
+
+    Results are plain values rather than library objects, so every backend gives the
+    same answers for the same repository.
+    """
+
+    name: str
+
+    @abstractmethod
+    def head_sha(self) -> Optional[str]:
+        """Commit HEAD points to, None when HEAD is unborn."""
+
+    @abstractmethod
+    def resolve(self, rev: str) -> Optional[str]:
+        """Sha of the commit a revision resolves to, None when it does not resolve."""
+
+    @abstractmethod
+    def branch_names(self) -> List[str]:
+        """Names of the local branches, sorted."""
+
+    @abstractmethod
+    def commit(self, sha: str) -> CommitInfo: ...
+
+    @abstractmethod
+    def walk(self, sha: str) -> Iterator[str]:
+        """
+        Shas of the commit and its ancestors like git rev-list --date-order, newest
+        first and never a parent before its children, whatever the commit dates.
+        """
+
+    @abstractmethod
+    def is_ancestor(self, ancestor: str, descendant: str) -> bool:
+        """Whether ancestor is reachable from descendant, a commit being its own."""
+
+    @abstractmethod
+    def branches_containing(self, sha: str) -> List[str]:
+        """
+        Names of the local branches that contain the commit, sorted. A detached
+        HEAD is not a branch and is never listed.
+        """
+
+    @abstractmethod
+    def reflog(self, ref: str) -> List[ReflogLine]:
+        """Reflog of a branch name or HEAD, newest first."""
+
+    @abstractmethod
+    def read_blob(self, sha: str, file_path: str) -> Optional[bytes]:
+        """Contents of a file at a commit, None when it does not exist there."""
+
+    @abstractmethod
+    def changed_paths(self, a_sha: str, b_sha: str) -> Dict[str, str]:
+        """
+        Paths that differ between two commits, mapped to git's change type letter
+        (A, D, M or T). Renames are reported as a deletion and an addition.
+        """
+
+    def close(self) -> None:
+        pass
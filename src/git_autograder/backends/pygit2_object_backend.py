@@ -0,0 +1,158 @@
+import glob
+import os
+import struct
+from typing import Dict, Iterator, List, Optional
+
+import pygit2  # type: ignore[import-not-found, unused-ignore]
+
+from git_autograder.backends.object_backend import CommitInfo, ObjectBackend, ReflogLine
+
+
+class Pygit2ObjectBackend(ObjectBackend):
+    """
+    Backend built on libgit2 through pygit2, which reads objects and refs in process
+    instead of starting git.
+
+    :param repo_path: Path of the repository's working tree or .git folder.
+    :type repo_path: str
+    """
+
+    name = "pygit2"
+
+    # Shortest abbreviation git uses, whatever the size of the repository
+    DEFAULT_ABBREV = 7
+    PACK_INDEX_MAGIC = b"\377tOc"
+
+    def __init__(self, repo_path: str) -> None:
+        self.repository = pygit2.Repository(repo_path)
+        self._abbrev: Optional[int] = None
+
+    def head_sha(self) -> Optional[str]:
+        if self.repository.head_is_unborn:
+            return None
+        return str(self.repository.head.target)
+
+    def resolve(self, rev: str) -> Optional[str]:
+        try:
+            commit = self.repository.revparse_single(rev).peel(pygit2.Commit)
+        except (KeyError, ValueError, pygit2.GitError, pygit2.InvalidSpecError):
+            return None
+        return str(commit.id)
+
+    def branch_names(self) -> List[str]:
+        return sorted(self.repository.branches.local)
+
+    def commit(self, sha: str) -> CommitInfo:
+        commit = self.repository[sha].peel(pygit2.Commit)
+        return CommitInfo(
+            sha=str(commit.id),
+            tree_sha=str(commit.tree_id),
+            parents=tuple(str(parent) for parent in commit.parent_ids),
+            message=commit.message,
+            author_name=commit.author.name,
+            author_email=commit.author.email,
+            authored_date=commit.author.time,
+            committed_date=commit.commit_time,
+        )
+
+    def walk(self, sha: str) -> Iterator[str]:
+        for commit in self.repository.walk(
+            sha, pygit2.enums.SortMode.TOPOLOGICAL | pygit2.enums.SortMode.TIME
+        ):
+            yield str(commit.id)
+
+    def is_ancestor(self, ancestor: str, descendant: str) -> bool:
+        if ancestor == descendant:
+            return True
+        return self.repository.descendant_of(descendant, ancestor)
+
+    def branches_containing(self, sha: str) -> List[str]:
+        branches = []
+        for name in self.branch_names():
+            tip = str(self.repository.branches.local[name].target)
+            if self.is_ancestor(sha, tip):
+                branches.append(name)
+        return branches
+
+    def reflog(self, ref: str) -> List[ReflogLine]:
+        ref_name = (
+            ref if ref == "HEAD" or ref.startswith("refs/") else f"refs/heads/{ref}"
+        )
+        reference = self.repository.references.get(ref_name)
+        if reference is None:
+            return []
+        lines = []
+        for entry in reference.log():
+            sha = str(entry.oid_new)
+            lines.append(
+                ReflogLine(
+                    sha=sha, short_sha=self.__short_sha(sha), message=entry.message
+                )
+            )
+        return lines
+
+    def read_blob(self, sha: str, file_path: str) -> Optional[bytes]:
+        tree = self.repository[sha].peel(pygit2.Commit).tree
+        try:
+            entry = tree[file_path]
+        except KeyError:
+            return None
+        obj = self.repository[entry.id]
+        if not isinstance(obj, pygit2.Blob):
+            return None
+        return obj.data
+
+    def changed_paths(self, a_sha: str, b_sha: str) -> Dict[str, str]:
+        diff = self.repository.diff(a_sha, b_sha)
+        changes = {}
+        for delta in diff.deltas:
+            status = delta.status_char()
+            file_path = delta.old_file.path if status == "D" else delta.new_file.path
+            changes[file_path] = status
+        return changes
+
+    def close(self) -> None:
+        self.repository.free()
+
+    def __short_sha(self, sha: str) -> str:
+        """
+        Abbreviates a sha like git does. libgit2 always starts from 7 characters,
+        while git starts from a length that grows with the number of packed objects.
+        """
+        try:
+            unique = len(self.repository[sha].short_id)
+        except KeyError:
+            unique = self.DEFAULT_ABBREV
+        # A prefix that is unique stays unique when it is made longer
+        return sha[: max(unique, self.__abbrev_length())]
+
+    def __abbrev_length(self) -> int:
+        if self._abbrev is None:
+            try:
+                value = str(self.repository.config["core.abbrev"]).lower()
+            except KeyError:
+                value = "auto"
+            if value in ("no", "false", "off"):
+                self._abbrev = len(str(self.repository.head.target))
+            elif value.isdigit():
+                self._abbrev = int(value)
+            else:
+                self._abbrev = self.__auto_abbrev_length()
+        return self._abbrev
+
+    def __auto_abbrev_length(self) -> int:
+        # Git expects a collision once there are 2^(4 * length / 2) objects, and
+        # only counts packed objects for it
+        count = 0
+        pattern = os.path.join(self.repository.path, "objects", "pack", "*.idx")
+        for index_path in glob.glob(pattern):
+            try:
+                with open(index_path, "rb") as f:
+                    header = f.read(8 + 256 * 4)
+            except OSError:
+                continue
+            # Version 2 indexes start with a magic and a version before the fanout
+            fanout = header[8:] if header[:4] == self.PACK_INDEX_MAGIC else header
+            if len(fanout) >= 256 * 4:
+                count += struct.unpack(">I", fanout[255 * 4 : 256 * 4])[0]
+        return max(self.DEFAULT_ABBREV, (count.bit_length() + 1) // 2)
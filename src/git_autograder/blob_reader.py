@@ -0,0 +1,93 @@
+import codecs
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from git import Blob
+
+
+@dataclass(frozen=True)
+class GitAutograderBlobContent:
+    # None if the blob is binary or too large to be read
+    text: Optional[str]
+    size: int
+    is_binary: bool
+    too_large: bool
+
+
+class BlobReader:
+    """
+    Reads blobs as UTF-8 text without decoding binary or oversized blobs.
+
+    Blobs are treated as binary if a NUL byte appears in their first few KB, the same
+    heuristic git uses, or if they are not valid UTF-8.
+
+    :param max_size: Size in bytes above which blobs are not read, no limit if None.
+    :type max_size: Optional[int]
+    """
+
+    SNIFF_SIZE = 8000
+    CHUNK_SIZE = 64 * 1024
+    DEFAULT_MAX_SIZE = 10 * 1024 * 1024
+
+    def __init__(self, max_size: Optional[int] = DEFAULT_MAX_SIZE) -> None:
+        self.max_size = max_size
+
+    def read(self, blob: Blob) -> GitAutograderBlobContent:
+        size = blob.size
+        if self.max_size is not None and size > self.max_size:
+            return GitAutograderBlobContent(
+                text=None, size=size, is_binary=False, too_large=True
+            )
+
+        try:
+            text = "".join(self.iter_text(blob))
+        except (UnicodeDecodeError, ValueError):
+            return GitAutograderBlobContent(
+                text=None, size=size, is_binary=True, too_large=False
+            )
+        return GitAutograderBlobContent(
+            text=text, size=size, is_binary=False, too_large=False
+        )
+
+    def read_data(self, data: bytes) -> GitAutograderBlobContent:
+        """Same as read, for a blob whose contents were already loaded."""
+        size = len(data)
+        if self.max_size is not None and size > self.max_size:
+            return GitAutograderBlobContent(
+                text=None, size=size, is_binary=False, too_large=True
+            )
+
+        if b"\0" in data[: self.SNIFF_SIZE]:
+            return GitAutograderBlobContent(
+                text=None, size=size, is_binary=True, too_large=False
+            )
+        try:
+            text = data.decode("utf-8")
+        except UnicodeDecodeError:
+            return GitAutograderBlobContent(
+                text=None, size=size, is_binary=True, too_large=False
+            )
+        return GitAutograderBlobContent(
+            text=text, size=size, is_binary=False, too_large=False
+        )
+
+    def iter_text(self, blob: Blob) -> Iterator[str]:
+        """
+        Decodes the blob in chunks so large blobs do not need to be held in memory
+        as both bytes and text.
+
+        :raises ValueError: if the blob is binary.
+        :raises UnicodeDecodeError: if the blob is not valid UTF-8.
+        """
+        stream = blob.data_stream
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        head = stream.read(self.SNIFF_SIZE)
+        if b"\0" in head:
+            raise ValueError(f"Blob {blob.hexsha} is binary.")
+        yield decoder.decode(head)
+        while True:
+            chunk = stream.read(self.CHUNK_SIZE)
+            if not chunk:
+                break
+            yield decoder.decode(chunk)
+        yield decoder.decode(b"", final=True)
@@ -1,7 +1,10 @@
 import re
-from typing import Any, List
+from typing import Any, List, Optional, Sequence
 
-from git import Head
+from git import Commit, Head
+from git.util import hex_to_bin
+
+from git_autograder.backends.object_backend import ObjectBackend
 
 from git_autograder.commit import GitAutograderCommit
 from git_autograder.diff import GitAutograderDiffHelper
@@ -13,8 +16,11 @@ class GitAutograderBranch:
     MISSING_START_COMMIT = "Branch {branch} is missing the Git Mastery start commit"
     MISSING_COMMITS = "Branch {branch} is missing any commits"
 
-    def __init__(self, branch: Head) -> None:
+    REFLOG_MESSAGE_PATTERN = re.compile("^([^:]+): (.+)$")
+
+    def __init__(self, branch: Head, backend: Optional[ObjectBackend] = None) -> None:
         self.branch = branch
+        self.backend = backend
 
     def __eq__(self, value: Any) -> bool:
         if not isinstance(value, GitAutograderBranch):
@@ -27,6 +33,9 @@ class GitAutograderBranch:
 
     @property
     def reflog(self) -> List[GitAutograderReflogEntry]:
+        if self.backend is not None:
+            return self.__backend_reflog(self.backend)
+
         output = self.branch.repo.git.reflog("show", self.name).splitlines()
         # We need to dynamically configure the regex
         regex_str = (
@@ -48,11 +57,38 @@ class GitAutograderBranch:
                 )
         return entries
 
+    def __backend_reflog(
+        self, backend: ObjectBackend
+    ) -> List[GitAutograderReflogEntry]:
+        entries = []
+        for index, line in enumerate(backend.reflog(self.name)):
+            groups = self.REFLOG_MESSAGE_PATTERN.match(line.message)
+            if groups:
+                action, message = groups.groups()
+                entries.append(
+                    GitAutograderReflogEntry(
+                        sha=line.short_sha,
+                        index=index,
+                        action=action,
+                        message=message,
+                    )
+                )
+        return entries
+
     @property
     def commits(self) -> List[GitAutograderCommit]:
         """Retrieve the available commits of a given branch."""
         commits: List[GitAutograderCommit] = []
-        for commit in self.branch.repo.iter_commits(self.branch):
+        if self.backend is not None:
+            repo = self.branch.repo
+            for sha in self.backend.walk(self.branch.commit.hexsha):
+                commit = Commit(repo, hex_to_bin(sha))
+                commits.append(GitAutograderCommit(commit, self.backend))
+            return commits
+
+        # Same order as the backends, which keeps parents after their children even
+        # when commit dates are skewed
+        for commit in self.branch.repo.iter_commits(self.branch, date_order=True):
             commits.append(GitAutograderCommit(commit))
 
         return commits
@@ -88,7 +124,7 @@ class GitAutograderBranch:
                 self.MISSING_START_COMMIT.format(branch=self.name)
             )
 
-        return GitAutograderCommit(start_tag.commit)
+        return GitAutograderCommit(start_tag.commit, self.backend)
 
     @property
     def user_commits(self) -> List[GitAutograderCommit]:
@@ -121,25 +157,36 @@ class GitAutograderBranch:
                 return True
         return False
 
+    def user_diff(
+        self,
+        *,
+        pathspecs: Optional[Sequence[str]] = None,
+        globs: Optional[Sequence[str]] = None,
+    ) -> GitAutograderDiffHelper:
+        """
+        Returns the changes made by the user's commits in a given branch, restricted
+        to the given pathspecs and globs if provided.
+        """
+        return GitAutograderDiffHelper(
+            self.start_commit,
+            self.latest_user_commit,
+            pathspecs=pathspecs,
+            globs=globs,
+        )
+
     def has_edited_file(self, file_path: str) -> bool:
         """Returns if a given file has been edited in a given branch."""
-        diff_helper = GitAutograderDiffHelper(
-            self.start_commit, self.latest_user_commit
+        diff_helper = self.user_diff(
+            pathspecs=[GitAutograderDiffHelper.literal_pathspec(file_path)]
         )
-        for diff in diff_helper.iter_changes("M"):
-            if diff.edited_file_path == file_path:
-                return True
-        return False
+        return diff_helper.has_path_change("M", file_path)
 
     def has_added_file(self, file_path: str) -> bool:
         """Returns if a given file has been added in a given branch."""
-        diff_helper = GitAutograderDiffHelper(
-            self.start_commit, self.latest_user_commit
+        diff_helper = GitAutograderDiffHelper.for_file(
+            self.start_commit, self.latest_user_commit, file_path
         )
-        for diff in diff_helper.iter_changes("A"):
-            if diff.edited_file_path == file_path:
-                return True
-        return False
+        return diff_helper.has_path_change("A", file_path)
 
     def has_at_least_commits(self, n: int, *, user_only: bool = True) -> bool:
         """
@@ -4,12 +4,15 @@ from typing import Any, Iterator, List, Optional, Sequence, TextIO, Union
 
 from git import Commit, Stats
 
+from git_autograder.backends.object_backend import ObjectBackend
+from git_autograder.blob_reader import BlobReader
 from git_autograder.role_marker import RoleMarker
 
 
 class GitAutograderCommit:
-    def __init__(self, commit: Commit) -> None:
+    def __init__(self, commit: Commit, backend: Optional[ObjectBackend] = None) -> None:
         self.commit = commit
+        self.backend = backend
 
     def __eq__(self, value: Any) -> bool:
         if not isinstance(value, GitAutograderCommit):
@@ -26,15 +29,26 @@ class GitAutograderCommit:
 
     @property
     def parents(self) -> Sequence["GitAutograderCommit"]:
-        return [GitAutograderCommit(parent) for parent in self.commit.parents]
+        return [
+            GitAutograderCommit(parent, self.backend) for parent in self.commit.parents
+        ]
 
     @property
     def branches(self) -> List[str]:
         """
         Returns the branches that contain the current commit.
         """
+        if self.backend is not None and not self.__detached_head_contains(self.backend):
+            return self.backend.branches_containing(self.hexsha)
+        # git lists a detached HEAD first, described as in (HEAD detached at 1a2b3c4)
         containing_branches = self.commit.repo.git.branch("--contains", self.hexsha)
-        return [line[2:] for line in containing_branches.split("\n")]
+        return [line[2:] for line in containing_branches.split("\n") if line]
+
+    def __detached_head_contains(self, backend: ObjectBackend) -> bool:
+        if not self.commit.repo.head.is_detached:
+            return False
+        head = backend.head_sha()
+        return head is not None and backend.is_ancestor(self.hexsha, head)
 
     @property
     def message(self) -> str:
@@ -47,6 +61,9 @@ class GitAutograderCommit:
         self.commit.repo.git.checkout(self.commit)
 
     def is_child(self, parent: Union[Commit, "GitAutograderCommit"]) -> bool:
+        if self.backend is not None:
+            return self.backend.is_ancestor(parent.hexsha, self.hexsha)
+
         def _is_child(child: Commit, parent: Commit) -> bool:
             if child == parent:
                 return True
@@ -67,21 +84,25 @@ class GitAutograderCommit:
         return self.stats.files[file_name]["change_type"]
 
     @contextmanager
-    def file(self, file_path: str) -> Iterator[Optional[str]]:
+    def file(
+        self, file_path: str, max_size: Optional[int] = BlobReader.DEFAULT_MAX_SIZE
+    ) -> Iterator[Optional[str]]:
+        """
+        Reads a file at this commit, yielding None if it is missing, binary or larger
+        than max_size bytes.
+        """
         content = None
         try:
-            file_blob = self.commit.tree / file_path
-            content = file_blob.data_stream.read().decode("utf-8")
+            if self.backend is not None:
+                data = self.backend.read_blob(self.hexsha, file_path)
+                if data is not None:
+                    content = BlobReader(max_size).read_data(data).text
+            else:
+                file_blob = self.commit.tree / file_path
+                content = BlobReader(max_size).read(file_blob).text
         except Exception:
             content = None
         yield content
 
     def is_from_user(self) -> bool:
-        message = self.commit.message
-        if isinstance(message, bytes):
-            message = message.decode("utf-8", errors="replace")
-
-        if message:
-            return not RoleMarker.has_role_marker(message)
-        # If there is no message, we can assume it's from a user.
-        return True
+        return RoleMarker.is_user_commit(self.hexsha, lambda: self.message)
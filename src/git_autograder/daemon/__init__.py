@@ -0,0 +1,5 @@
+__all__ = ["ExerciseCache", "GitAutograderServer", "GitAutograderClient"]
+
+from .exercise_cache import ExerciseCache
+from .server import GitAutograderServer
+from .client import GitAutograderClient
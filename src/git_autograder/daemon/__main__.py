@@ -0,0 +1,24 @@
+import argparse
+import importlib
+
+from git_autograder.daemon.server import GitAutograderServer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m git_autograder.daemon",
+        description="Serves gradings of an exercise over a Unix socket.",
+    )
+    parser.add_argument(
+        "grader", help="Grading function of the exercise, as module:function"
+    )
+    parser.add_argument("--socket", required=True, help="Path of the Unix socket")
+    args = parser.parse_args()
+
+    module_name, _, function_name = args.grader.partition(":")
+    grade = getattr(importlib.import_module(module_name), function_name or "grade")
+    GitAutograderServer(grade, args.socket).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
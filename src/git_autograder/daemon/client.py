@@ -0,0 +1,76 @@
+import json
+import os
+import socket
+from datetime import datetime
+from typing import Any, Optional
+
+import pytz
+
+from git_autograder.exception import GitAutograderInvalidStateException
+from git_autograder.output import GitAutograderOutput
+from git_autograder.status import GitAutograderStatus
+
+
+class GitAutograderClient:
+    """
+    Thin client of GitAutograderServer.
+
+    The connection is opened lazily and reused across gradings.
+    """
+
+    def __init__(self, socket_path: str | os.PathLike, timeout: float = 60) -> None:
+        self.socket_path = os.fspath(socket_path)
+        self.timeout = timeout
+        self._socket: Optional[socket.socket] = None
+        self._buffer = b""
+
+    def __enter__(self) -> "GitAutograderClient":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+            self._buffer = b""
+
+    def grade(self, exercise_path: str | os.PathLike) -> GitAutograderOutput:
+        request = json.dumps({"exercise_path": str(exercise_path)}) + "\n"
+        conn = self.__connect()
+        conn.sendall(request.encode("utf-8"))
+        response = json.loads(self.__read_line(conn))
+        if "error" in response:
+            raise GitAutograderInvalidStateException(response["error"])
+        return GitAutograderOutput(
+            status=GitAutograderStatus(response["status"]),
+            started_at=self.__to_datetime(response["started_at"]),
+            completed_at=self.__to_datetime(response["completed_at"]),
+            comments=response["comments"],
+            exercise_name=response["exercise_name"],
+        )
+
+    def __connect(self) -> socket.socket:
+        if self._socket is None:
+            conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            conn.settimeout(self.timeout)
+            conn.connect(self.socket_path)
+            self._socket = conn
+        return self._socket
+
+    def __read_line(self, conn: socket.socket) -> bytes:
+        while b"\n" not in self._buffer:
+            chunk = conn.recv(65536)
+            if not chunk:
+                self.close()
+                raise GitAutograderInvalidStateException(
+                    "Grading server closed the connection."
+                )
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return line
+
+    @staticmethod
+    def __to_datetime(value: Optional[float]) -> Optional[datetime]:
+        return datetime.fromtimestamp(value, tz=pytz.UTC) if value is not None else None
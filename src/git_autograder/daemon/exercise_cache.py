@@ -0,0 +1,80 @@
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from git_autograder.exercise import GitAutograderExercise
+
+Fingerprint = Tuple[Tuple[str, int, int], ...]
+
+
+class ExerciseCache:
+    """
+    Keeps GitAutograderExercise instances warm across gradings, keyed by exercise path.
+
+    An instance is rebuilt whenever the exercise config, the answers file or the
+    repository's refs, reflogs or index change.
+    """
+
+    # Relative to the repository's .git folder
+    WATCHED_GIT_FILES = ["HEAD", "index", "packed-refs", "config", "FETCH_HEAD"]
+    WATCHED_GIT_FOLDERS = ["refs", "logs"]
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, Tuple[Fingerprint, GitAutograderExercise]] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def lock(self, exercise_path: str | os.PathLike) -> threading.Lock:
+        """Lock that must be held while an exercise from this cache is in use."""
+        key = self.__key(exercise_path)
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def get(self, exercise_path: str | os.PathLike) -> GitAutograderExercise:
+        key = self.__key(exercise_path)
+        fingerprint = self.fingerprint(key)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] == fingerprint:
+            return entry[1]
+
+        exercise = GitAutograderExercise(key)
+        with self._lock:
+            self._entries[key] = (fingerprint, exercise)
+        return exercise
+
+    def invalidate(self, exercise_path: Optional[str | os.PathLike] = None) -> None:
+        with self._lock:
+            if exercise_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(self.__key(exercise_path), None)
+
+    def fingerprint(self, exercise_path: str | os.PathLike) -> Fingerprint:
+        root = Path(exercise_path)
+        paths: List[Path] = [root / ".gitmastery-exercise.json", root / "answers.txt"]
+        # The repository folder is named in the config, so every child .git folder
+        # is watched to avoid parsing the config just to compute the fingerprint
+        for child in sorted(root.iterdir()) if root.is_dir() else []:
+            git_dir = child / ".git"
+            if not git_dir.is_dir():
+                continue
+            paths += [git_dir / name for name in self.WATCHED_GIT_FILES]
+            for folder in self.WATCHED_GIT_FOLDERS:
+                for dir_path, dir_names, file_names in os.walk(git_dir / folder):
+                    dir_names.sort()
+                    paths.append(Path(dir_path))
+                    paths += [Path(dir_path) / name for name in sorted(file_names)]
+
+        stamps: List[Tuple[str, int, int]] = []
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            stamps.append((str(path), stat.st_mtime_ns, stat.st_size))
+        return tuple(stamps)
+
+    def __key(self, exercise_path: str | os.PathLike) -> str:
+        return str(Path(exercise_path).resolve())
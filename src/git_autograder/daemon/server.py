@@ -0,0 +1,130 @@
+import os
+import socketserver
+import traceback
+from datetime import datetime
+from typing import Callable, Optional
+
+import pytz
+
+from git_autograder.daemon.exercise_cache import ExerciseCache
+from git_autograder.exception import (
+    GitAutograderException,
+    GitAutograderWrongAnswerException,
+)
+from git_autograder.exercise import GitAutograderExercise
+from git_autograder.output import GitAutograderOutput
+from git_autograder.repo.repo import GitAutograderRepo
+from git_autograder.serialization import dumps, loads
+from git_autograder.status import GitAutograderStatus
+
+Grader = Callable[[GitAutograderExercise], GitAutograderOutput]
+
+
+class GitAutograderServer:
+    """
+    Long-lived grading server listening on a Unix socket.
+
+    Each request is a single line of JSON, ``{"exercise_path": "..."}``, and is
+    answered with a single line of JSON containing the GitAutograderOutput.
+    Exercises are kept warm in an ExerciseCache so that repeated gradings of the
+    same exercise skip loading the config and opening the repository. Cached
+    remote refs are dropped before every grading.
+
+    :param grade: Grading function of the exercise.
+    :type grade: Callable[[GitAutograderExercise], GitAutograderOutput]
+    :param socket_path: Path of the Unix socket to listen on.
+    :type socket_path: str | os.PathLike
+    """
+
+    def __init__(
+        self,
+        grade: Grader,
+        socket_path: str | os.PathLike,
+        cache: Optional[ExerciseCache] = None,
+    ) -> None:
+        self.grade = grade
+        self.socket_path = os.fspath(socket_path)
+        self.cache = cache if cache is not None else ExerciseCache()
+
+        server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                for line in self.rfile:
+                    response = server.handle_request(line)
+                    self.wfile.write(response + b"\n")
+                    self.wfile.flush()
+
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self._server = socketserver.ThreadingUnixStreamServer(self.socket_path, Handler)
+        self._server.daemon_threads = True
+
+    def serve_forever(self) -> None:
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+    def shutdown(self) -> None:
+        self._server.shutdown()
+
+    def handle_request(self, line: bytes) -> bytes:
+        try:
+            request = loads(line)
+            exercise_path = request["exercise_path"]
+        except (ValueError, KeyError, TypeError):
+            return dumps({"error": "Invalid request."})
+
+        output = self.run(exercise_path)
+        return dumps(output.to_dict())
+
+    def run(self, exercise_path: str | os.PathLike) -> GitAutograderOutput:
+        """Grades the exercise at the given path using a warm exercise if possible."""
+        started_at = datetime.now(tz=pytz.UTC)
+        with self.cache.lock(exercise_path):
+            exercise: Optional[GitAutograderExercise] = None
+            try:
+                exercise = self.cache.get(exercise_path)
+                exercise.started_at = started_at
+                if isinstance(exercise.repo, GitAutograderRepo):
+                    # Remotes can change without touching the local repository, so
+                    # a warm exercise must not reuse refs fetched for an earlier run
+                    exercise.repo.remote_refs.invalidate()
+                return self.grade(exercise)
+            except GitAutograderWrongAnswerException as e:
+                return self.__error_output(
+                    exercise, started_at, e.message, GitAutograderStatus.UNSUCCESSFUL
+                )
+            except GitAutograderException as e:
+                return self.__error_output(
+                    exercise, started_at, e.message, GitAutograderStatus.ERROR
+                )
+            except Exception:
+                # Unexpected errors may have left the exercise in a bad state
+                self.cache.invalidate(exercise_path)
+                return self.__error_output(
+                    exercise,
+                    started_at,
+                    traceback.format_exc(),
+                    GitAutograderStatus.ERROR,
+                )
+
+    def __error_output(
+        self,
+        exercise: Optional[GitAutograderExercise],
+        started_at: datetime,
+        message: str | list[str],
+        status: GitAutograderStatus,
+    ) -> GitAutograderOutput:
+        comments = message if isinstance(message, list) else [message]
+        if exercise is not None:
+            return exercise.to_output(comments, status)
+        return GitAutograderOutput(
+            status=status,
+            started_at=started_at,
+            completed_at=datetime.now(tz=pytz.UTC),
+            comments=comments,
+        )
@@ -1,4 +1,15 @@
-__all__ = ["GitAutograderDiff", "GitAutograderDiffHelper"]
+__all__ = [
+    "GitAutograderDiff",
+    "GitAutograderDiffHelper",
+    "LineDiff",
+    "LineDiffBackend",
+    "DifflibLineDiffBackend",
+    "MyersLineDiffBackend",
+]
 
 from .diff import GitAutograderDiff
 from .diff_helper import GitAutograderDiffHelper
+from .line_diff import LineDiff
+from .line_diff_backend import LineDiffBackend
+from .difflib_line_diff_backend import DifflibLineDiffBackend
+from .myers_line_diff_backend import MyersLineDiffBackend
@@ -1,9 +1,14 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Optional
 
-from difflib_parser import DiffCode, DifflibParser
+from difflib_parser import DifflibParser
 from git.diff import Diff, Lit_change_type
 
+from git_autograder.diff.line_diff import LineDiff
+from git_autograder.diff.line_diff_backend import LineDiffBackend
+from git_autograder.diff.myers_line_diff_backend import MyersLineDiffBackend
+
 
 @dataclass
 class GitAutograderDiff:
@@ -13,34 +18,42 @@ class GitAutograderDiff:
     edited_file_path: Optional[str]
     original_file: Optional[str]
     edited_file: Optional[str]
-    diff_parser: Optional[DifflibParser]
+    # Parser given by the caller, see difflib_parser for one parsed on demand
+    diff_parser: Optional[DifflibParser] = field(
+        default=None, repr=False, compare=False
+    )
+    line_diff_backend: LineDiffBackend = field(
+        default_factory=MyersLineDiffBackend, repr=False, compare=False
+    )
+    # Contents are not read if either side is binary or too large
+    is_binary: bool = False
+    too_large: bool = False
+
+    @cached_property
+    def difflib_parser(self) -> Optional[DifflibParser]:
+        """The given diff_parser, otherwise the files parsed on first access."""
+        if self.diff_parser is not None:
+            return self.diff_parser
+        if self.original_file is None or self.edited_file is None:
+            return None
+        return DifflibParser(
+            self.original_file.split("\n"), self.edited_file.split("\n")
+        )
+
+    @cached_property
+    def line_diff(self) -> Optional[LineDiff]:
+        """Line differences of the file, computed on first access."""
+        if self.original_file is None or self.edited_file is None:
+            return None
+        return self.line_diff_backend.diff(
+            self.original_file.split("\n"), self.edited_file.split("\n")
+        )
 
     def has_deleted_line(self) -> bool:
-        if self.diff_parser is None:
-            return False
-
-        for diff in self.diff_parser.iter_diffs():
-            if diff.code == DiffCode.LEFT_ONLY and diff.line.strip() != "":
-                return True
-
-        return False
+        return self.line_diff is not None and self.line_diff.has_deleted_line
 
     def has_added_line(self) -> bool:
-        if self.diff_parser is None:
-            return False
-
-        for diff in self.diff_parser.iter_diffs():
-            if diff.code == DiffCode.RIGHT_ONLY and diff.line.strip() != "":
-                return True
-
-        return False
+        return self.line_diff is not None and self.line_diff.has_added_line
 
     def has_edited_line(self) -> bool:
-        if self.diff_parser is None:
-            return False
-
-        for diff in self.diff_parser.iter_diffs():
-            if diff.code == DiffCode.CHANGED and diff.line.strip() != "":
-                return True
-
-        return False
+        return self.line_diff is not None and self.line_diff.has_edited_line
@@ -1,41 +1,152 @@
-from typing import Iterator, List, Optional, Tuple, Union
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
 
-from difflib_parser import DifflibParser
 from git import Commit, Diff, DiffIndex
 from git.diff import Lit_change_type
 
+from git_autograder.blob_reader import BlobReader
 from git_autograder.commit import GitAutograderCommit
 from git_autograder.diff.diff import GitAutograderDiff
+from git_autograder.diff.line_diff_backend import LineDiffBackend
+from git_autograder.diff.myers_line_diff_backend import MyersLineDiffBackend
 
 
 class GitAutograderDiffHelper:
+    """
+    Changes between two commits.
+
+    Pathspecs and globs restrict the diff within git's tree comparison, so trees
+    outside of them are never read. Renames are only detected when both paths
+    match, otherwise they show up as an added and/or deleted file. Use for_file to
+    diff a single file with its rename source.
+
+    :param pathspecs: Git pathspecs to restrict the diff to, pathspec magic such as
+        ``:(literal)`` is supported.
+    :type pathspecs: Optional[Sequence[str]]
+    :param globs: Glob patterns to restrict the diff to, where ``**`` matches across
+        directories.
+    :type globs: Optional[Sequence[str]]
+    :param max_blob_size: Size in bytes above which file contents are not read.
+    :type max_blob_size: Optional[int]
+    """
+
     def __init__(
         self,
         a: Union[Commit, GitAutograderCommit],
         b: Union[Commit, GitAutograderCommit],
+        line_diff_backend: Optional[LineDiffBackend] = None,
+        *,
+        pathspecs: Optional[Sequence[str]] = None,
+        globs: Optional[Sequence[str]] = None,
+        max_blob_size: Optional[int] = BlobReader.DEFAULT_MAX_SIZE,
     ) -> None:
+        self.blob_reader = BlobReader(max_blob_size)
+        self.line_diff_backend = (
+            line_diff_backend
+            if line_diff_backend is not None
+            else MyersLineDiffBackend()
+        )
         a_commit = self.__get_commit(a)
         b_commit = self.__get_commit(b)
-        self.diff_index: DiffIndex[Diff] = a_commit.diff(b_commit)
+        paths = self.to_pathspecs(pathspecs, globs)
+        self.diff_index: DiffIndex[Diff] = a_commit.diff(b_commit, paths=paths)
 
     def __get_commit(self, commit: Union[Commit, GitAutograderCommit]) -> Commit:
         if isinstance(commit, Commit):
             return commit
         return commit.commit
 
+    @staticmethod
+    def to_pathspecs(
+        pathspecs: Optional[Sequence[str]] = None,
+        globs: Optional[Sequence[str]] = None,
+    ) -> Optional[Tuple[str, ...]]:
+        if pathspecs is None and globs is None:
+            return None
+        return tuple(pathspecs or ()) + tuple(f":(glob){glob}" for glob in globs or ())
+
+    @staticmethod
+    def literal_pathspec(file_path: str) -> str:
+        """Pathspec that only matches the given path, even if it contains wildcards."""
+        return f":(literal){file_path}"
+
+    @staticmethod
+    def for_file(
+        a: Union[Commit, GitAutograderCommit],
+        b: Union[Commit, GitAutograderCommit],
+        file_path: str,
+        line_diff_backend: Optional[LineDiffBackend] = None,
+    ) -> "GitAutograderDiffHelper":
+        """
+        Changes to a single file, detecting renames from paths outside of it.
+
+        An added file may have been renamed from a deleted one, so when the file is
+        added the diff is redone with the deleted files included as rename sources.
+        Listing deleted files only compares the trees that changed, so neither diff
+        depends on the size of the repository.
+        """
+        diff_helper = GitAutograderDiffHelper(
+            a,
+            b,
+            line_diff_backend,
+            pathspecs=[GitAutograderDiffHelper.literal_pathspec(file_path)],
+        )
+        if not diff_helper.has_path_change("A", file_path):
+            return diff_helper
+
+        a_commit, b_commit = diff_helper.__get_commit(a), diff_helper.__get_commit(b)
+        backend = a.backend if isinstance(a, GitAutograderCommit) else None
+        if backend is not None:
+            changes = backend.changed_paths(a_commit.hexsha, b_commit.hexsha)
+            sources = sorted(path for path, change in changes.items() if change == "D")
+        else:
+            deleted = a_commit.repo.git.diff(
+                "--name-only",
+                "-z",
+                "--no-renames",
+                "--diff-filter=D",
+                a_commit.hexsha,
+                b_commit.hexsha,
+            ).split("\x00")
+            sources = [path for path in deleted if path]
+        if not sources:
+            return diff_helper
+        return GitAutograderDiffHelper(
+            a,
+            b,
+            line_diff_backend,
+            pathspecs=[
+                GitAutograderDiffHelper.literal_pathspec(path)
+                for path in [file_path, *sources]
+            ],
+        )
+
+    def has_path_change(self, change_type: Lit_change_type, file_path: str) -> bool:
+        """Returns if the file has the given change type, without reading any blobs."""
+        for change in self.diff_index.iter_change_type(change_type):
+            if change.b_path == file_path:
+                return True
+        return False
+
     @staticmethod
     def get_file_diff(
         a: Union[Commit, GitAutograderCommit],
         b: Union[Commit, GitAutograderCommit],
         file_path: str,
+        line_diff_backend: Optional[LineDiffBackend] = None,
     ) -> Optional[Tuple["GitAutograderDiff", Lit_change_type]]:
         """Returns file difference between two commits across ALL change types."""
         # Based on the expectation that there can only exist one change type per file in a diff
-        diff_helper = GitAutograderDiffHelper(a, b)
+        diff_helper = GitAutograderDiffHelper.for_file(
+            a, b, file_path, line_diff_backend
+        )
         change_types: List[Lit_change_type] = ["A", "D", "R", "M", "T"]
         for change_type in change_types:
             for change in diff_helper.iter_changes(change_type):
-                if change.diff_parser is None or change.edited_file_path != file_path:
+                if (
+                    change.diff.a_blob is None
+                    or change.diff.b_blob is None
+                    or change.edited_file_path != file_path
+                ):
                     continue
                 return change, change_type
         return None
@@ -54,31 +165,28 @@ class GitAutograderDiffHelper:
                 if edited_file_rawpath is not None
                 else None
             )
-            original_file_blob = change.a_blob
-            edited_file_blob = change.b_blob
-            original_file = (
-                original_file_blob.data_stream.read().decode("utf-8")
-                if original_file_blob is not None
-                else None
-            )
-            edited_file = (
-                edited_file_blob.data_stream.read().decode("utf-8")
-                if edited_file_blob is not None
+            original_content = (
+                self.blob_reader.read(change.a_blob)
+                if change.a_blob is not None
                 else None
             )
-
-            diff_parser = (
-                DifflibParser(original_file.split("\n"), edited_file.split("\n"))
-                if original_file is not None and edited_file is not None
+            edited_content = (
+                self.blob_reader.read(change.b_blob)
+                if change.b_blob is not None
                 else None
             )
+            contents = [c for c in (original_content, edited_content) if c is not None]
 
             yield GitAutograderDiff(
                 change_type=change_type,
                 diff=change,
                 original_file_path=original_file_path,
                 edited_file_path=edited_file_path,
-                original_file=original_file,
-                edited_file=edited_file,
-                diff_parser=diff_parser,
+                original_file=(
+                    original_content.text if original_content is not None else None
+                ),
+                edited_file=edited_content.text if edited_content is not None else None,
+                line_diff_backend=self.line_diff_backend,
+                is_binary=any(c.is_binary for c in contents),
+                too_large=any(c.too_large for c in contents),
             )
@@ -0,0 +1,32 @@
+from typing import List
+
+from difflib_parser import DiffCode, DifflibParser
+
+from git_autograder.diff.line_diff import LineDiff
+from git_autograder.diff.line_diff_backend import LineDiffBackend
+
+
+class DifflibLineDiffBackend(LineDiffBackend):
+    """
+    Line diffs computed with difflib's ndiff.
+
+    Lines are only considered edited if they are similar enough to the line they
+    replace. ndiff can be very slow on large or repetitive files.
+    """
+
+    def diff(self, original: List[str], edited: List[str]) -> LineDiff:
+        added_lines: List[str] = []
+        deleted_lines: List[str] = []
+        edited_lines: List[str] = []
+        for diff in DifflibParser(original, edited).iter_diffs():
+            if diff.code == DiffCode.RIGHT_ONLY:
+                added_lines.append(diff.line)
+            elif diff.code == DiffCode.LEFT_ONLY:
+                deleted_lines.append(diff.line)
+            elif diff.code == DiffCode.CHANGED:
+                edited_lines.append(diff.line)
+        return LineDiff(
+            added_lines=tuple(added_lines),
+            deleted_lines=tuple(deleted_lines),
+            edited_lines=tuple(edited_lines),
+        )
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Tuple
+
+
+@dataclass(frozen=True)
+class LineDiff:
+    """Lines that differ between two versions of a file, computed once per file."""
+
+    added_lines: Tuple[str, ...]
+    deleted_lines: Tuple[str, ...]
+    # Original version of lines that were edited in place
+    edited_lines: Tuple[str, ...]
+
+    @cached_property
+    def has_added_line(self) -> bool:
+        return any(line.strip() != "" for line in self.added_lines)
+
+    @cached_property
+    def has_deleted_line(self) -> bool:
+        return any(line.strip() != "" for line in self.deleted_lines)
+
+    @cached_property
+    def has_edited_line(self) -> bool:
+        return any(line.strip() != "" for line in self.edited_lines)
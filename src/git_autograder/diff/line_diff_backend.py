@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from git_autograder.diff.line_diff import LineDiff
+
+
+class LineDiffBackend(ABC):
+    @abstractmethod
+    def diff(self, original: List[str], edited: List[str]) -> LineDiff: ...
@@ -0,0 +1,219 @@
+from difflib import IS_CHARACTER_JUNK, SequenceMatcher
+from typing import Dict, List, Optional, Tuple
+
+from git_autograder.diff.line_diff import LineDiff
+from git_autograder.diff.line_diff_backend import LineDiffBackend
+
+
+class MyersLineDiffBackend(LineDiffBackend):
+    """
+    Line diffs computed with Myers' O((N + M)D) algorithm.
+
+    Runs of deleted and added lines are sorted into edited, deleted and added lines
+    the way ndiff does it, with the same similarity cutoff. The results match
+    DifflibLineDiffBackend whenever both align the unchanged lines the same way.
+    They can differ when lines are moved or repeated, since Myers keeps as many
+    unchanged lines as possible while difflib anchors on the longest unchanged block.
+
+    :param max_edits: Number of edits after which the remaining lines are treated as
+        one replaced block instead of being diffed further.
+    :type max_edits: int
+    :param max_pairs: Deleted times added lines of a run above which lines are only
+        compared in order, instead of searching for the most similar pair.
+    :type max_pairs: int
+    """
+
+    # ndiff pairs lines whose similarity ratio is above 0.74
+    SIMILARITY_CUTOFF = 0.74
+
+    def __init__(self, max_edits: int = 2000, max_pairs: int = 10_000) -> None:
+        self.max_edits = max_edits
+        self.max_pairs = max_pairs
+
+    def diff(self, original: List[str], edited: List[str]) -> LineDiff:
+        added_lines: List[str] = []
+        deleted_lines: List[str] = []
+        edited_lines: List[str] = []
+
+        deleted_run: List[str] = []
+        added_run: List[str] = []
+
+        def flush() -> None:
+            self.__pair(
+                deleted_run, added_run, added_lines, deleted_lines, edited_lines
+            )
+            deleted_run.clear()
+            added_run.clear()
+
+        for op, line in self.__edit_script(original, edited):
+            if op == "-":
+                deleted_run.append(line)
+            elif op == "+":
+                added_run.append(line)
+            else:
+                flush()
+        flush()
+
+        return LineDiff(
+            added_lines=tuple(added_lines),
+            deleted_lines=tuple(deleted_lines),
+            edited_lines=tuple(edited_lines),
+        )
+
+    def __pair(
+        self,
+        deleted: List[str],
+        added: List[str],
+        added_lines: List[str],
+        deleted_lines: List[str],
+        edited_lines: List[str],
+    ) -> None:
+        """
+        Sorts a run of deleted and added lines into edited, deleted and added lines
+        like ndiff: the most similar pair is an edited line, and the lines before and
+        after it are sorted the same way.
+        """
+        if not deleted or not added:
+            deleted_lines.extend(deleted)
+            added_lines.extend(added)
+            return
+        if len(deleted) * len(added) > self.max_pairs:
+            # Too many pairs to compare, so lines are only compared in order
+            for a, b in zip(deleted, added):
+                matcher = SequenceMatcher(IS_CHARACTER_JUNK, a, b)
+                if self.__ratio(matcher, self.SIMILARITY_CUTOFF) is not None:
+                    edited_lines.append(a)
+                else:
+                    deleted_lines.append(a)
+                    added_lines.append(b)
+            deleted_lines.extend(deleted[len(added) :])
+            added_lines.extend(added[len(deleted) :])
+            return
+
+        best_ratio = self.SIMILARITY_CUTOFF
+        best: Optional[Tuple[int, int]] = None
+        identical: Optional[Tuple[int, int]] = None
+        matcher = SequenceMatcher(IS_CHARACTER_JUNK)
+        for j, b in enumerate(added):
+            # The second sequence is indexed once and reused for every deleted line
+            matcher.set_seq2(b)
+            for i, a in enumerate(deleted):
+                if a == b:
+                    identical = identical or (i, j)
+                    continue
+                matcher.set_seq1(a)
+                ratio = self.__ratio(matcher, best_ratio)
+                if ratio is not None:
+                    best_ratio, best = ratio, (i, j)
+
+        # Like ndiff, identical lines are only used when no pair is similar
+        sync = best or identical
+        if sync is None:
+            deleted_lines.extend(deleted)
+            added_lines.extend(added)
+            return
+        i, j = sync
+        self.__pair(deleted[:i], added[:j], added_lines, deleted_lines, edited_lines)
+        if best is not None:
+            edited_lines.append(deleted[i])
+        self.__pair(
+            deleted[i + 1 :], added[j + 1 :], added_lines, deleted_lines, edited_lines
+        )
+
+    @staticmethod
+    def __ratio(matcher: SequenceMatcher[str], best_ratio: float) -> Optional[float]:
+        """Similarity of two lines as ndiff measures it, None unless above best_ratio."""
+        if (
+            matcher.real_quick_ratio() > best_ratio
+            and matcher.quick_ratio() > best_ratio
+            and matcher.ratio() > best_ratio
+        ):
+            return matcher.ratio()
+        return None
+
+    def __edit_script(
+        self, original: List[str], edited: List[str]
+    ) -> List[Tuple[str, str]]:
+        # Common prefixes and suffixes are trimmed first since most edits are local
+        prefix = 0
+        limit = min(len(original), len(edited))
+        while prefix < limit and original[prefix] == edited[prefix]:
+            prefix += 1
+        suffix = 0
+        limit -= prefix
+        while (
+            suffix < limit
+            and original[len(original) - 1 - suffix] == edited[len(edited) - 1 - suffix]
+        ):
+            suffix += 1
+
+        a = original[prefix : len(original) - suffix]
+        b = edited[prefix : len(edited) - suffix]
+
+        script: List[Tuple[str, str]] = [(" ", line) for line in original[:prefix]]
+        script += self.__myers(a, b)
+        script += [(" ", line) for line in original[len(original) - suffix :]]
+        return script
+
+    def __myers(self, a: List[str], b: List[str]) -> List[Tuple[str, str]]:
+        # Lines are interned to integers so that comparisons are cheap
+        ids: Dict[str, int] = {}
+        a_ids = [ids.setdefault(line, len(ids)) for line in a]
+        b_ids = [ids.setdefault(line, len(ids)) for line in b]
+
+        n, m = len(a_ids), len(b_ids)
+        max_d = min(n + m, self.max_edits)
+        offset = max_d + 1
+        v = [0] * (2 * max_d + 3)
+        # trace[d] holds v[-d..d] after step d, which is all that backtracking needs
+        trace: List[List[int]] = []
+
+        for d in range(max_d + 1):
+            for k in range(-d, d + 1, 2):
+                if k == -d or (k != d and v[offset + k - 1] < v[offset + k + 1]):
+                    x = v[offset + k + 1]
+                else:
+                    x = v[offset + k - 1] + 1
+                y = x - k
+                while x < n and y < m and a_ids[x] == b_ids[y]:
+                    x += 1
+                    y += 1
+                v[offset + k] = x
+                if x >= n and y >= m:
+                    trace.append(v[offset - d : offset + d + 1])
+                    return self.__backtrack(a, b, trace)
+            trace.append(v[offset - d : offset + d + 1])
+
+        # Too many edits to diff precisely, treat everything as one replaced block
+        return [("-", line) for line in a] + [("+", line) for line in b]
+
+    def __backtrack(
+        self, a: List[str], b: List[str], trace: List[List[int]]
+    ) -> List[Tuple[str, str]]:
+        script: List[Tuple[str, str]] = []
+        x, y = len(a), len(b)
+        for d in range(len(trace) - 1, 0, -1):
+            prev = trace[d - 1]
+            k = x - y
+            if k == -d or (k != d and prev[k - 1 + d - 1] < prev[k + 1 + d - 1]):
+                prev_k = k + 1
+            else:
+                prev_k = k - 1
+            prev_x = prev[prev_k + d - 1]
+            prev_y = prev_x - prev_k
+            while x > prev_x and y > prev_y:
+                x -= 1
+                y -= 1
+                script.append((" ", a[x]))
+            if x == prev_x:
+                y -= 1
+                script.append(("+", b[y]))
+            else:
+                x -= 1
+                script.append(("-", a[x]))
+        while x > 0 and y > 0:
+            x -= 1
+            y -= 1
+            script.append((" ", a[x]))
+        script.reverse()
+        return script
@@ -1,9 +1,19 @@
-import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import pytz
 from git import InvalidGitRepositoryError, Repo
@@ -14,13 +24,16 @@ from git_autograder.exception import (
     GitAutograderInvalidStateException,
     GitAutograderWrongAnswerException,
 )
-from git_autograder.exercise_config import ExerciseConfig
+from git_autograder.exercise_config_store import ExerciseConfigStore
 from git_autograder.output import GitAutograderOutput
 from git_autograder.repo.null_repo import NullGitAutograderRepo
 from git_autograder.repo.repo import GitAutograderRepo
 from git_autograder.repo.repo_base import GitAutograderRepoBase
 from git_autograder.status import GitAutograderStatus
 
+if TYPE_CHECKING:
+    from git_autograder.output_sinks.output_sink import GitAutograderOutputSink
+
 
 class GitAutograderExercise:
     """This is the central Git-Mastery exercise grading layer. It essentially provides a
@@ -37,11 +50,15 @@ class GitAutograderExercise:
 
     :param exercise_path: Path to a given exercise folder
     :type exercise_path: Union[str, os.PathLike]
+    :param output_sink: Sink that receives emitted comments and saved outputs,
+        output.json in ../output if None
+    :type output_sink: Optional[GitAutograderOutputSink]
     """
 
     def __init__(
         self,
         exercise_path: str | os.PathLike,
+        output_sink: Optional["GitAutograderOutputSink"] = None,
     ) -> None:
         """Constructor method"""
 
@@ -49,6 +66,7 @@ class GitAutograderExercise:
         # we're keeping this because of the exception system
         self.started_at = self.__now()
         self.exercise_path = exercise_path
+        self.output_sink = output_sink
 
         self.exercise_config_path = Path(exercise_path) / ".gitmastery-exercise.json"
         if not self.has_exercise_config(self.exercise_config_path):
@@ -56,7 +74,8 @@ class GitAutograderExercise:
                 "Missing .gitmastery-exercise.json"
             )
 
-        self.config = ExerciseConfig.read_config(self.exercise_config_path)
+        self.config_store = ExerciseConfigStore(self.exercise_config_path)
+        self.config = self.config_store.config()
 
         self.exercise_name = self.config.exercise_name
         try:
@@ -122,23 +141,19 @@ class GitAutograderExercise:
         return datetime.now(tz=pytz.UTC)
 
     def write_config(self, key: str, value: Any) -> None:
-        # TODO: Maybe we should be updating the config object directly so re-reading
-        # won't need to reload? Alternatively, maybe we should make it such that the
-        # config is the config, the written variables are a separate file loaded
-        raw_config = {}
-        with open(self.exercise_config_path, "r") as file:
-            raw_config = json.load(file)
-        raw_config[key] = value
-        with open(self.exercise_config_path, "w") as file:
-            file.write(json.dumps(raw_config))
+        """
+        Writes a value to the exercise config. Use config_store.batch() to flush
+        several writes at once.
+        """
+        self.config_store.write(key, value)
 
     def read_config(self, key: str) -> Optional[Any]:
-        raw_config = {}
-        with open(self.exercise_config_path, "r") as file:
-            raw_config = json.load(file)
-        if key not in raw_config:
-            return None
-        return raw_config[key]
+        return self.config_store.read(key)
+
+    def emit_comment(self, comment: str) -> None:
+        """Reports a comment to the output sink while grading is still in progress."""
+        if self.output_sink is not None:
+            self.output_sink.emit_comment(comment, self.exercise_name)
 
     def to_output(
         self, comments: List[str], status: GitAutograderStatus
@@ -154,11 +169,70 @@ class GitAutograderExercise:
             completed_at=self.__now(),
             comments=comments,
             status=status,
+            sink=self.output_sink,
         )
 
     def wrong_answer(self, comments: List[str]) -> GitAutograderWrongAnswerException:
         return GitAutograderWrongAnswerException(comments)
 
+    def run_checks_concurrently(
+        self,
+        checks: Sequence[Callable[["GitAutograderExercise"], Optional[List[str]]]],
+        max_workers: Optional[int] = None,
+    ) -> GitAutograderOutput:
+        """
+        Runs independent checks on a thread pool and collects their comments into a
+        single output. The repository is switched to thread safe mode first.
+
+        Each check is given this exercise and fails by raising a wrong answer. It may
+        also return comments to include in the output. Comments keep the order of the
+        checks and are emitted to the output sink as soon as they are known, and the
+        output is unsuccessful if any check failed. The Repo and
+        helpers opened by the worker threads are closed once the checks finish.
+
+        :raises Exception: the first exception other than a wrong answer raised by a
+            check, once every check has finished.
+        """
+        if isinstance(self.repo, GitAutograderRepo):
+            self.repo.enable_thread_safety()
+
+        def run(
+            check: Callable[["GitAutograderExercise"], Optional[List[str]]],
+        ) -> Tuple[bool, List[str]]:
+            try:
+                return True, check(self) or []
+            except GitAutograderWrongAnswerException as e:
+                return False, list(e.message)
+
+        comments: List[str] = []
+        has_failed = False
+        error: Optional[BaseException] = None
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(run, check) for check in checks]
+            for future in futures:
+                try:
+                    passed, check_comments = future.result()
+                except Exception as e:
+                    error = error or e
+                    continue
+                has_failed |= not passed
+                comments += check_comments
+                for comment in check_comments:
+                    self.emit_comment(comment)
+        if isinstance(self.repo, GitAutograderRepo):
+            # The pool's threads have exited, so their git processes can be freed
+            self.repo.close_finished_threads()
+
+        if error is not None:
+            raise error
+
+        return self.to_output(
+            comments,
+            GitAutograderStatus.UNSUCCESSFUL
+            if has_failed
+            else GitAutograderStatus.SUCCESSFUL,
+        )
+
     def fetch_pr(self) -> None:
         ignored_repo_types = {"ignore", "local-ignore"}
         if self.config.exercise_repo.repo_type in ignored_repo_types:
@@ -167,7 +241,7 @@ class GitAutograderExercise:
                 "Check that your repo_type is not 'ignore' or 'local-ignore'."
             )
         
-        self.config = ExerciseConfig.read_config(self.exercise_config_path)
+        self.config = self.config_store.config()
         pr_context = GitAutograderRepo.read_pr_context_from_config(config=self.config)
         self.repo = GitAutograderRepo(
             self.config.exercise_name,
@@ -1,7 +1,7 @@
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 
 @dataclass
@@ -39,6 +39,10 @@ class ExerciseConfig:
         raw_config = {}
         with open(path, "r") as config_file:
             raw_config = json.loads(config_file.read())
+        return ExerciseConfig.from_dict(raw_config)
+
+    @staticmethod
+    def from_dict(raw_config: Dict[str, Any]) -> "ExerciseConfig":
         exercise_repo = raw_config["exercise_repo"]
         return ExerciseConfig(
             exercise_name=raw_config["exercise_name"],
@@ -0,0 +1,112 @@
+import copy
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from git_autograder.exercise_config import ExerciseConfig
+
+
+class ExerciseConfigStore:
+    """
+    Cached access to .gitmastery-exercise.json.
+
+    The file is only parsed again if its mtime, size or inode changes. Writes update
+    the cached config and are flushed to disk immediately, or once at the end of a
+    batch, by writing to a temporary file that atomically replaces the config.
+
+    :param path: Path to the exercise config file.
+    :type path: str | os.PathLike
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self.path = Path(path)
+        self._raw: Optional[Dict[str, Any]] = None
+        self._config: Optional[ExerciseConfig] = None
+        self._stamp: Optional[Tuple[int, int, int]] = None
+        self._dirty = False
+        self._batch_depth = 0
+        self._lock = threading.RLock()
+
+    def raw(self) -> Dict[str, Any]:
+        with self._lock:
+            # Pending writes take precedence over changes made by other processes
+            if self._raw is None or (not self._dirty and self.__stamp() != self._stamp):
+                self._raw = self.__load()
+            return self._raw
+
+    def config(self) -> ExerciseConfig:
+        with self._lock:
+            raw = self.raw()
+            if self._config is None:
+                self._config = ExerciseConfig.from_dict(raw)
+            return self._config
+
+    def read(self, key: str) -> Optional[Any]:
+        raw = self.raw()
+        if key not in raw:
+            return None
+        # Copied so that callers cannot change the cache without writing
+        return copy.deepcopy(raw[key])
+
+    def write(self, key: str, value: Any) -> None:
+        with self._lock:
+            self.raw()[key] = value
+            self._config = None
+            self._dirty = True
+            if self._batch_depth == 0:
+                self.flush()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Defers flushing writes until the outermost batch exits. The lock is not held
+        while the batch runs, so other threads can still read the config.
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._dirty or self._raw is None:
+                return
+            fd, temp_path = tempfile.mkstemp(
+                dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w") as file:
+                    file.write(json.dumps(self._raw))
+                # mkstemp creates files that only the owner can read
+                if self.path.exists():
+                    os.chmod(temp_path, self.path.stat().st_mode & 0o777)
+                os.replace(temp_path, self.path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+            self._stamp = self.__stamp()
+            self._dirty = False
+
+    def __load(self) -> Dict[str, Any]:
+        stamp = self.__stamp()
+        with open(self.path, "r") as file:
+            raw = json.load(file)
+        self._config = None
+        self._stamp = stamp
+        return raw
+
+    def __stamp(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
@@ -1,4 +1,4 @@
-__all__ = ["BranchHelper", "CommitHelper", "RemoteHelper", "FileHelper", "TagHelper", "PrHelper", "NullPrHelper"]
+__all__ = ["BranchHelper", "CommitHelper", "RemoteHelper", "FileHelper", "TagHelper", "PrHelper", "NullPrHelper", "RemoteRefsHelper", "TreeHelper", "StagingHelper", "MergeSimulator", "HistoryShapeHelper", "PatchIdHelper"]
 
 from .branch_helper import BranchHelper
 from .commit_helper import CommitHelper
@@ -7,3 +7,9 @@ from .file_helper import FileHelper
 from .tag_helper import TagHelper
 from .pr_helper.pr_helper import PrHelper
 from .pr_helper.null_pr_helper import NullPrHelper
+from .remote_refs_helper import RemoteRefsHelper
+from .tree_helper import TreeHelper
+from .staging_helper import StagingHelper
+from .merge_simulator import MergeSimulator
+from .history_shape_helper import HistoryShapeHelper
+from .patch_id_helper import PatchIdHelper
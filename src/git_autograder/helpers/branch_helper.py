@@ -2,20 +2,25 @@ from typing import Optional
 
 from git import Repo
 
+from git_autograder.backends.object_backend import ObjectBackend
 from git_autograder.branch import GitAutograderBranch
 from git_autograder.exception import GitAutograderInvalidStateException
+from git_autograder.helpers.merge_simulator import MergeSimulator
 
 
 class BranchHelper:
     MISSING_BRANCH = "Branch {branch} is missing."
 
-    def __init__(self, repo: Repo) -> None:
+    def __init__(self, repo: Repo, backend: Optional[ObjectBackend] = None) -> None:
         self.repo = repo
+        self.backend = backend
+        # Dry-run merges between branches, without touching the working tree
+        self.merges = MergeSimulator(repo)
 
     def branch_or_none(self, branch_name: str) -> Optional[GitAutograderBranch]:
         for head in self.repo.heads:
             if head.name == branch_name:
-                return GitAutograderBranch(head)
+                return GitAutograderBranch(head, self.backend)
         return None
 
     def branch(self, branch_name: str) -> GitAutograderBranch:
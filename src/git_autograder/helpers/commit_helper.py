@@ -1,25 +1,33 @@
-from typing import Optional, Union
+from typing import List, Optional, Sequence, Tuple, Union
 
-from git import Repo
+from git import Commit, GitCommandError, Repo
 from git.types import Commit_ish
+from git.util import hex_to_bin
 
+from git_autograder.backends.object_backend import ObjectBackend
 from git_autograder.commit import GitAutograderCommit
+from git_autograder.role_marker import RoleMarker
+from git_autograder.search_hit import GitAutograderSearchHit
 
 
 class CommitHelper:
-    def __init__(self, repo: Repo) -> None:
+    # Revisions given to a single git grep, to stay under command line length limits
+    GREP_BATCH_SIZE = 500
+
+    def __init__(self, repo: Repo, backend: Optional[ObjectBackend] = None) -> None:
         self.repo = repo
+        self.backend = backend
 
     def commit(self, rev: Optional[Union[Commit_ish, str]]) -> GitAutograderCommit:
         c = self.repo.commit(rev)
-        return GitAutograderCommit(c)
+        return GitAutograderCommit(c, self.backend)
 
     def commit_or_none(
         self, rev: Optional[Union[Commit_ish, str]]
     ) -> Optional[GitAutograderCommit]:
         try:
             c = self.repo.commit(rev)
-            return GitAutograderCommit(c)
+            return GitAutograderCommit(c, self.backend)
         except Exception:
             return None
 
@@ -31,3 +39,124 @@ class CommitHelper:
             if commit.message.strip() == target:
                 return commit
         return None
+
+    def partition_by_role(
+        self, revs: Union[str, Sequence[str]] = "HEAD"
+    ) -> Tuple[List[GitAutograderCommit], List[GitAutograderCommit]]:
+        """
+        Splits the commits reachable from the given revisions, or in the given ranges,
+        into user and non-user commits, reading every message from a single git log.
+
+        :param revs: Revisions or ranges as accepted by git log, e.g. main..feature.
+        :returns: The user commits and the non-user commits, newest first.
+        """
+        rev_args = [revs] if isinstance(revs, str) else list(revs)
+        output = self.repo.git.log("-z", "--format=%H%x1f%B", *rev_args, "--")
+
+        user_commits: List[GitAutograderCommit] = []
+        non_user_commits: List[GitAutograderCommit] = []
+        for record in output.split("\x00"):
+            if not record:
+                continue
+            sha, _, message = record.partition("\x1f")
+            is_from_user = RoleMarker.is_from_user(message)
+            RoleMarker.remember_user_commit(sha, is_from_user)
+            commit = GitAutograderCommit(
+                Commit(self.repo, hex_to_bin(sha)), self.backend
+            )
+            (user_commits if is_from_user else non_user_commits).append(commit)
+        return user_commits, non_user_commits
+
+    def search(
+        self,
+        pattern: str,
+        commits: Sequence[Union[GitAutograderCommit, str]],
+        paths: Optional[Sequence[str]] = None,
+        regex: bool = False,
+        ignore_case: bool = False,
+    ) -> List[GitAutograderSearchHit]:
+        """
+        Every line matching the pattern in the files of the given commits, searching
+        many commits per git grep instead of reading each blob. Binary files are
+        skipped.
+
+        :param pattern: Fixed string to look for, or an extended regex when regex is
+            True.
+        :param paths: Pathspecs to limit the search to, e.g. *.txt.
+        """
+        hits: List[GitAutograderSearchHit] = []
+        for batch in self.__grep_batches(commits):
+            status, output = self.__grep(
+                ["-n", "-z", "--full-name"], pattern, batch, paths, regex, ignore_case
+            )
+            if status != 0:
+                continue
+            for line in output.split("\n"):
+                if not line:
+                    continue
+                # Lines are sha:path\0line number\0text, and shas never contain a colon
+                name, line_number, text = line.split("\x00", 2)
+                sha, _, path = name.partition(":")
+                hits.append(
+                    GitAutograderSearchHit(
+                        sha=sha,
+                        path=path,
+                        line_number=int(line_number),
+                        line=text,
+                    )
+                )
+        return hits
+
+    def contains(
+        self,
+        pattern: str,
+        commits: Sequence[Union[GitAutograderCommit, str]],
+        paths: Optional[Sequence[str]] = None,
+        regex: bool = False,
+        ignore_case: bool = False,
+    ) -> bool:
+        """
+        Whether any file of the given commits has a line matching the pattern, stopping
+        at the first match.
+        """
+        for batch in self.__grep_batches(commits):
+            status, _ = self.__grep(["-q"], pattern, batch, paths, regex, ignore_case)
+            if status == 0:
+                return True
+        return False
+
+    def __grep_batches(
+        self, commits: Sequence[Union[GitAutograderCommit, str]]
+    ) -> List[List[str]]:
+        shas = [
+            commit.hexsha
+            if isinstance(commit, GitAutograderCommit)
+            else self.repo.commit(commit).hexsha
+            for commit in commits
+        ]
+        return [
+            shas[i : i + self.GREP_BATCH_SIZE]
+            for i in range(0, len(shas), self.GREP_BATCH_SIZE)
+        ]
+
+    def __grep(
+        self,
+        options: List[str],
+        pattern: str,
+        shas: List[str],
+        paths: Optional[Sequence[str]],
+        regex: bool,
+        ignore_case: bool,
+    ) -> Tuple[int, str]:
+        args = ["--no-color", "-I", *options]
+        args.append("-E" if regex else "-F")
+        if ignore_case:
+            args.append("-i")
+        args += ["-e", pattern, *shas, "--", *(paths or [])]
+        status, stdout, stderr = self.repo.git.grep(
+            *args, with_extended_output=True, with_exceptions=False
+        )
+        # git grep exits with 1 when nothing matched, anything else is an error
+        if status not in (0, 1):
+            raise GitCommandError(["git", "grep", *args], status, stderr)
+        return status, str(stdout)
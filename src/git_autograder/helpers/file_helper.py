@@ -1,13 +1,53 @@
+import hashlib
 import os
+import stat
+import time
 from contextlib import contextmanager
-from typing import Iterator, List, Optional, TextIO, Union
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TextIO,
+    Tuple,
+    Union,
+)
 
-from git import Repo
+from git import GitCommandError, Repo
+
+from git_autograder.helpers.tree_helper import CommitLike, TreeHelper
+
+# mtime, ctime, size, inode and mode of a file
+StatStamp = Tuple[int, int, int, int, int]
+# mtime, ctime and size of a config or attributes file, None if it is missing
+SourceStamp = Optional[Tuple[int, int, int]]
 
 
 class FileHelper:
-    def __init__(self, repo: Repo) -> None:
+    # Files modified this recently may change again within the same mtime, so their
+    # hashes are not cached
+    RACY_WINDOW_NS = 2_000_000_000
+    HASH_OBJECT_BATCH_SIZE = 500
+    # Attributes that make git convert a file's contents when hashing it
+    FILTER_ATTRIBUTES = (
+        "filter",
+        "text",
+        "eol",
+        "crlf",
+        "ident",
+        "working-tree-encoding",
+    )
+
+    def __init__(self, repo: Repo, trees: Optional[TreeHelper] = None) -> None:
         self.repo = repo
+        self.trees = trees if trees is not None else TreeHelper(repo)
+        self._blob_shas: Dict[str, Tuple[StatStamp, str]] = {}
+        self._autocrlf: Optional[bool] = None
+        self._filtered: Dict[str, bool] = {}
+        # Files the cached conversion decisions were read from
+        self._attribute_sources: Dict[str, SourceStamp] = {}
 
     @contextmanager
     def file_or_none(
@@ -79,3 +119,205 @@ class FileHelper:
         ]
 
         return given_lines == expected_lines
+
+    @staticmethod
+    def hash_blob(data: bytes) -> str:
+        """Sha git gives a blob with the given contents, like git hash-object."""
+        return hashlib.sha1(b"blob %d\x00" % len(data) + data).hexdigest()
+
+    def blob_sha(self, path: Union[str, os.PathLike[str]]) -> Optional[str]:
+        """
+        Blob sha of a working tree file, None if it is missing or not a file.
+
+        Hashes are cached against the file's stat data, so checking an unchanged file
+        again only costs a stat.
+        """
+        return self.blob_shas([path])[self.__relative_path(path)]
+
+    def blob_shas(
+        self, paths: Sequence[Union[str, os.PathLike[str]]]
+    ) -> Dict[str, Optional[str]]:
+        """Blob shas of many working tree files, keyed by their repo-relative path."""
+        self.__check_attribute_sources()
+        shas: Dict[str, Optional[str]] = {}
+        to_hash: Dict[str, StatStamp] = {}
+        for path in paths:
+            relative_path = self.__relative_path(path)
+            try:
+                st = os.lstat(os.path.join(self.repo.working_dir, relative_path))
+            except OSError:
+                shas[relative_path] = None
+                continue
+            if not (stat.S_ISREG(st.st_mode) or stat.S_ISLNK(st.st_mode)):
+                shas[relative_path] = None
+                continue
+
+            stamp = (st.st_mtime_ns, st.st_ctime_ns, st.st_size, st.st_ino, st.st_mode)
+            cached = self._blob_shas.get(relative_path)
+            if cached is not None and cached[0] == stamp:
+                shas[relative_path] = cached[1]
+            else:
+                to_hash[relative_path] = stamp
+
+        if to_hash:
+            hashed = self.__hash_files(to_hash)
+            racy_after = time.time_ns() - self.RACY_WINDOW_NS
+            for relative_path, sha in hashed.items():
+                stamp = to_hash[relative_path]
+                shas[relative_path] = sha
+                if sha is not None and stamp[0] < racy_after:
+                    self._blob_shas[relative_path] = (stamp, sha)
+        return shas
+
+    def remember_blob_sha(
+        self, path: Union[str, os.PathLike[str]], stamp: StatStamp, sha: str
+    ) -> None:
+        """Seeds the hash cache with a sha known to match the given stat data."""
+        self._blob_shas[self.__relative_path(path)] = (stamp, sha)
+
+    def is_unchanged_since(
+        self, path: Union[str, os.PathLike[str]], commit: CommitLike
+    ) -> bool:
+        """
+        Returns if a working tree file has the same contents as at the given commit,
+        without reading the committed blob.
+        """
+        relative_path = self.__relative_path(path)
+        committed_sha = self.trees.blob_sha(commit, relative_path)
+        return committed_sha is not None and committed_sha == self.blob_sha(
+            relative_path
+        )
+
+    def matches_content(
+        self, path: Union[str, os.PathLike[str]], expected: Union[str, bytes]
+    ) -> bool:
+        """Returns if a working tree file has exactly the expected contents."""
+        expected_bytes = (
+            expected.encode("utf-8") if isinstance(expected, str) else expected
+        )
+        sha = self.blob_sha(path)
+        if sha is None:
+            return False
+        full_path = os.path.join(self.repo.working_dir, path)
+        if not os.path.islink(full_path) and self.__is_filtered(
+            self.__relative_path(path)
+        ):
+            # Filtered hashes cannot be compared with a hash of the raw contents
+            with open(full_path, "rb") as f:
+                return f.read() == expected_bytes
+        return sha == self.hash_blob(expected_bytes)
+
+    def __hash_files(self, stamps: Dict[str, StatStamp]) -> Dict[str, Optional[str]]:
+        filtered = self.__filtered_paths(
+            [path for path, stamp in stamps.items() if not stat.S_ISLNK(stamp[4])]
+        )
+        shas: Dict[str, Optional[str]] = {}
+        through_git: List[str] = []
+        for relative_path, stamp in stamps.items():
+            if relative_path in filtered:
+                through_git.append(relative_path)
+                continue
+            full_path = os.path.join(self.repo.working_dir, relative_path)
+            try:
+                if stat.S_ISLNK(stamp[4]):
+                    # Symlinks are stored as their target path and never filtered
+                    data = os.fsencode(os.readlink(full_path))
+                else:
+                    with open(full_path, "rb") as f:
+                        data = f.read()
+            except OSError:
+                shas[relative_path] = None
+                continue
+            shas[relative_path] = self.hash_blob(data)
+
+        # Only git knows how to apply line ending conversions and clean filters
+        for i in range(0, len(through_git), self.HASH_OBJECT_BATCH_SIZE):
+            batch = through_git[i : i + self.HASH_OBJECT_BATCH_SIZE]
+            try:
+                output = self.repo.git.hash_object("--", *batch)
+                shas.update(zip(batch, output.splitlines()))
+            except GitCommandError:
+                # A file vanished since it was listed, hash the batch one by one
+                for relative_path in batch:
+                    try:
+                        shas[relative_path] = self.repo.git.hash_object(
+                            "--", relative_path
+                        )
+                    except GitCommandError:
+                        shas[relative_path] = None
+        return shas
+
+    def __is_filtered(self, relative_path: str) -> bool:
+        return relative_path in self.__filtered_paths([relative_path])
+
+    def __filtered_paths(self, relative_paths: List[str]) -> Set[str]:
+        """Paths git converts when hashing, through core.autocrlf or attributes."""
+        if self._autocrlf is None:
+            self.__watch(os.path.join(self.repo.git_dir, "config"))
+            self.__watch(os.path.join(self.repo.git_dir, "info", "attributes"))
+            try:
+                autocrlf = self.repo.git.config("--get", "core.autocrlf")
+            except GitCommandError:
+                autocrlf = "false"
+            self._autocrlf = autocrlf.lower() in ("true", "input")
+        if self._autocrlf:
+            return set(relative_paths)
+
+        # Attributes can come from .gitattributes in any folder, info/attributes and
+        # the user's and system's attribute files, so git is asked for them
+        unchecked = [path for path in relative_paths if path not in self._filtered]
+        for folder in {os.path.dirname(path) for path in unchecked}:
+            # Watch the .gitattributes of every folder up to the root
+            while True:
+                attributes_path = os.path.join(
+                    self.repo.working_dir, folder, ".gitattributes"
+                )
+                if attributes_path in self._attribute_sources:
+                    break
+                self.__watch(attributes_path)
+                if folder == "":
+                    break
+                folder = os.path.dirname(folder)
+        for i in range(0, len(unchecked), self.HASH_OBJECT_BATCH_SIZE):
+            batch = unchecked[i : i + self.HASH_OBJECT_BATCH_SIZE]
+            for relative_path in batch:
+                self._filtered[relative_path] = False
+            output = self.repo.git.check_attr(
+                "-z", *self.FILTER_ATTRIBUTES, "--", *batch
+            ).split("\x00")
+            for j in range(0, len(output) - 2, 3):
+                if output[j + 2] != "unspecified":
+                    self._filtered[output[j]] = True
+        return {path for path in relative_paths if self._filtered[path]}
+
+    def __check_attribute_sources(self) -> None:
+        """
+        Forgets conversion decisions, and the hashes made with them, once the config
+        or an attributes file they were read from changes. This keeps a long-lived
+        helper correct when .gitattributes is edited between gradings.
+        """
+        if all(
+            self.__source_stamp(path) == stamp
+            for path, stamp in self._attribute_sources.items()
+        ):
+            return
+        self._autocrlf = None
+        self._filtered.clear()
+        self._blob_shas.clear()
+        self._attribute_sources.clear()
+
+    def __watch(self, path: str) -> None:
+        if path not in self._attribute_sources:
+            self._attribute_sources[path] = self.__source_stamp(path)
+
+    @staticmethod
+    def __source_stamp(path: str) -> SourceStamp:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_ctime_ns, st.st_size)
+
+    def __relative_path(self, path: Union[str, os.PathLike[str]]) -> str:
+        full_path = os.path.join(self.repo.working_dir, path)
+        return os.path.relpath(full_path, self.repo.working_dir).replace(os.sep, "/")
@@ -0,0 +1,202 @@
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from git import Repo
+
+from git_autograder.backends.gitpython_object_backend import GitPythonObjectBackend
+from git_autograder.backends.object_backend import ObjectBackend, ReflogLine
+from git_autograder.exception import GitAutograderInvalidStateException
+from git_autograder.helpers.patch_id_helper import PatchIdHelper
+from git_autograder.history.history_shape import GitAutograderHistoryShape
+
+FIELD_SEPARATOR = "\x1f"
+LOG_FORMAT = FIELD_SEPARATOR.join(["%H", "%T", "%P", "%B"])
+
+
+class _Node(NamedTuple):
+    tree_sha: str
+    parents: Tuple[str, ...]
+    message: str
+
+
+class HistoryShapeHelper:
+    """
+    Classifies merges, fast-forwards, rebases and squashes of a set of branches.
+
+    Commits reachable from the branches and from their reflogs are read in a single
+    git log, and rebased commits are matched by patch id with the PatchIdHelper.
+    Shapes are cached until one of the branches moves.
+    """
+
+    MISSING_BRANCH = "Branch {branch} is missing."
+    FAST_FORWARD_MESSAGE = re.compile(r"^(merge|pull)\b.*: Fast-forward$")
+    REBASE_FINISH_MESSAGE = re.compile(r"^(rebase|pull --rebase)\b.*\(finish\)")
+    SQUASHED_COMMIT = re.compile(r"^commit ([0-9a-f]{40})$", re.MULTILINE)
+    SQUASH_MESSAGE = "Squashed commit of the following:"
+    # Commits further back than this are not considered part of a squashed series
+    MAX_SQUASHED_COMMITS = 100
+
+    def __init__(
+        self,
+        repo: Repo,
+        backend: Optional[ObjectBackend] = None,
+        patch_ids: Optional[PatchIdHelper] = None,
+    ) -> None:
+        self.repo = repo
+        self.backend = backend if backend is not None else GitPythonObjectBackend(repo)
+        self.patch_ids = patch_ids if patch_ids is not None else PatchIdHelper(repo)
+        self._shapes: Dict[Tuple[Tuple[str, str], ...], GitAutograderHistoryShape] = {}
+
+    def shape(self, branch_names: Sequence[str]) -> GitAutograderHistoryShape:
+        """
+        Shape of the history of the given branches.
+
+        :raises GitAutograderInvalidStateException: when a branch is missing.
+        """
+        heads = {head.name: head for head in self.repo.heads}
+        tips: Dict[str, str] = {}
+        for name in branch_names:
+            if name not in heads:
+                raise GitAutograderInvalidStateException(
+                    self.MISSING_BRANCH.format(branch=name)
+                )
+            tips[name] = heads[name].commit.hexsha
+
+        key = tuple(sorted(tips.items()))
+        shape = self._shapes.get(key)
+        if shape is None:
+            shape = self.__classify(tips)
+            self._shapes[key] = shape
+        return shape
+
+    def __classify(self, tips: Dict[str, str]) -> GitAutograderHistoryShape:
+        reflogs = {
+            name: self.backend.reflog(f"refs/heads/{name}") for name in tips.keys()
+        }
+        revs = set(tips.values())
+        for lines in reflogs.values():
+            revs.update(line.sha for line in lines)
+        nodes = self.__read_commits(revs)
+
+        branch_commits = {
+            name: self.__reachable(nodes, [tip]) for name, tip in tips.items()
+        }
+        reachable: Set[str] = set().union(*branch_commits.values())
+
+        merge_commits = [
+            sha
+            for sha in nodes.keys()
+            if sha in reachable and len(nodes[sha].parents) > 1
+        ]
+        fast_forwards = {
+            name: [
+                line.sha
+                for line in lines
+                if self.FAST_FORWARD_MESSAGE.match(line.message)
+            ]
+            for name, lines in reflogs.items()
+        }
+        rebased_commits = self.__rebased_commits(nodes, reachable)
+        rebased_branches = [
+            name
+            for name in tips.keys()
+            if self.__has_finished_rebase(reflogs[name])
+            or any(sha in branch_commits[name] for sha in rebased_commits.keys())
+        ]
+
+        return GitAutograderHistoryShape(
+            tips=dict(tips),
+            merge_commits=merge_commits,
+            fast_forwards=fast_forwards,
+            rebased_commits=rebased_commits,
+            rebased_branches=rebased_branches,
+            squash_candidates=self.__squash_candidates(nodes, reachable),
+        )
+
+    def __rebased_commits(
+        self, nodes: Dict[str, _Node], reachable: Set[str]
+    ) -> Dict[str, str]:
+        # Only commits dropped from the branches can have been rebased away
+        if all(sha in reachable for sha in nodes.keys()):
+            return {}
+
+        patch_ids = self.patch_ids.patch_ids(
+            sha for sha, node in nodes.items() if len(node.parents) <= 1
+        )
+        replaced: Dict[str, str] = {}
+        for sha in nodes.keys():
+            patch_id = patch_ids.get(sha)
+            if sha not in reachable and patch_id is not None:
+                replaced.setdefault(patch_id, sha)
+
+        rebased_commits: Dict[str, str] = {}
+        for sha in nodes.keys():
+            patch_id = patch_ids.get(sha)
+            if sha in reachable and patch_id in replaced:
+                rebased_commits[sha] = replaced[patch_id]
+        return rebased_commits
+
+    def __squash_candidates(
+        self, nodes: Dict[str, _Node], reachable: Set[str]
+    ) -> Dict[str, List[str]]:
+        by_tree: Dict[str, List[str]] = {}
+        for sha, node in nodes.items():
+            by_tree.setdefault(node.tree_sha, []).append(sha)
+
+        candidates: Dict[str, List[str]] = {}
+        for sha, node in nodes.items():
+            if sha not in reachable or len(node.parents) != 1:
+                continue
+
+            if node.message.startswith(self.SQUASH_MESSAGE):
+                squashed = self.SQUASHED_COMMIT.findall(node.message)
+                if squashed:
+                    candidates[sha] = list(reversed(squashed))
+                    continue
+
+            # A commit is a squash when another commit ends up with the same files
+            # after two or more commits on top of the same parent
+            for other in by_tree[node.tree_sha]:
+                series = self.__first_parent_series(nodes, other, node.parents[0])
+                if series is not None and len(series) >= 2 and sha not in series:
+                    candidates[sha] = series
+                    break
+        return candidates
+
+    def __first_parent_series(
+        self, nodes: Dict[str, _Node], sha: str, base: str
+    ) -> Optional[List[str]]:
+        series: List[str] = []
+        current: Optional[str] = sha
+        while current is not None and len(series) < self.MAX_SQUASHED_COMMITS:
+            if current == base:
+                return list(reversed(series))
+            series.append(current)
+            node = nodes.get(current)
+            current = node.parents[0] if node is not None and node.parents else None
+        return None
+
+    def __has_finished_rebase(self, lines: List[ReflogLine]) -> bool:
+        return any(self.REBASE_FINISH_MESSAGE.match(line.message) for line in lines)
+
+    @staticmethod
+    def __reachable(nodes: Dict[str, _Node], tips: List[str]) -> Set[str]:
+        seen: Set[str] = set()
+        pending = list(tips)
+        while pending:
+            sha = pending.pop()
+            if sha in seen or sha not in nodes:
+                continue
+            seen.add(sha)
+            pending.extend(nodes[sha].parents)
+        return seen
+
+    def __read_commits(self, revs: Iterable[str]) -> Dict[str, _Node]:
+        output = self.repo.git.log("-z", f"--format={LOG_FORMAT}", *sorted(revs), "--")
+        nodes: Dict[str, _Node] = {}
+        for record in output.split("\x00"):
+            if not record:
+                continue
+            sha, tree_sha, parents, message = record.split(FIELD_SEPARATOR, 3)
+            nodes[sha] = _Node(tree_sha, tuple(parents.split()), message)
+        return nodes
@@ -0,0 +1,118 @@
+from typing import Dict, List, Tuple, Union
+
+from git import BadName, Commit, Repo
+
+from git_autograder.branch import GitAutograderBranch
+from git_autograder.commit import GitAutograderCommit
+from git_autograder.exception import GitAutograderInvalidStateException
+from git_autograder.merge_result import (
+    GitAutograderMergeMessage,
+    GitAutograderMergeResult,
+)
+
+MergeSide = Union[GitAutograderBranch, GitAutograderCommit, Commit, str]
+
+
+class MergeSimulator:
+    """
+    Computes merges in memory with git merge-tree, so checking whether two branches
+    merge cleanly never checks out, merges or otherwise changes the student's
+    repository. Results are cached per pair of commit shas.
+    """
+
+    CANNOT_MERGE = "Cannot merge {theirs} into {ours}: {reason}"
+    MISSING_REVISION = "Revision {revision} is missing."
+    UNSUPPORTED_GIT = (
+        "Simulating merges requires git {required} or newer, but git {found} is "
+        "installed."
+    )
+    # First version with git merge-tree --write-tree
+    MIN_GIT_VERSION = (2, 38)
+
+    def __init__(self, repo: Repo) -> None:
+        self.repo = repo
+        self._results: Dict[Tuple[str, str], GitAutograderMergeResult] = {}
+
+    def merge(self, ours: MergeSide, theirs: MergeSide) -> GitAutograderMergeResult:
+        """
+        Result of merging theirs into ours.
+
+        :raises GitAutograderInvalidStateException: when git refuses the merge, like
+            for unrelated histories, or is older than 2.38.
+        """
+        ours_sha, theirs_sha = self.__sha(ours), self.__sha(theirs)
+        result = self._results.get((ours_sha, theirs_sha))
+        if result is None:
+            result = self.__merge_tree(ours_sha, theirs_sha)
+            self._results[(ours_sha, theirs_sha)] = result
+        return result
+
+    def merges_cleanly(self, ours: MergeSide, theirs: MergeSide) -> bool:
+        return self.merge(ours, theirs).is_clean
+
+    def conflicts(self, ours: MergeSide, theirs: MergeSide) -> List[str]:
+        return self.merge(ours, theirs).conflicts
+
+    def __merge_tree(self, ours: str, theirs: str) -> GitAutograderMergeResult:
+        version = self.repo.git.version_info
+        if version[:2] < self.MIN_GIT_VERSION:
+            raise GitAutograderInvalidStateException(
+                self.UNSUPPORTED_GIT.format(
+                    required=".".join(map(str, self.MIN_GIT_VERSION)),
+                    found=".".join(map(str, version)),
+                )
+            )
+
+        status, stdout, stderr = self.repo.git.merge_tree(
+            "--write-tree",
+            "-z",
+            "--name-only",
+            ours,
+            theirs,
+            with_extended_output=True,
+            with_exceptions=False,
+            strip_newline_in_stdout=False,
+        )
+        # 0 is a clean merge and 1 a merge with conflicts, anything else is an error
+        if status not in (0, 1):
+            raise GitAutograderInvalidStateException(
+                self.CANNOT_MERGE.format(
+                    ours=ours, theirs=theirs, reason=str(stderr).strip()
+                )
+            )
+
+        fields = str(stdout).split("\x00")
+        tree_sha = fields[0]
+        position = 1
+        conflicts: List[str] = []
+        # Conflicted paths end with an empty field, which only exists on conflicts
+        while status == 1 and position < len(fields) and fields[position] != "":
+            if fields[position] not in conflicts:
+                conflicts.append(fields[position])
+            position += 1
+        position += 1
+
+        messages: List[GitAutograderMergeMessage] = []
+        while position < len(fields) and fields[position] != "":
+            path_count = int(fields[position])
+            paths = tuple(fields[position + 1 : position + 1 + path_count])
+            position += 1 + path_count
+            kind, message = fields[position], fields[position + 1]
+            messages.append(GitAutograderMergeMessage(paths, kind, message.rstrip()))
+            position += 2
+
+        return GitAutograderMergeResult(ours, theirs, tree_sha, conflicts, messages)
+
+    def __sha(self, side: MergeSide) -> str:
+        if isinstance(side, GitAutograderBranch):
+            return side.branch.commit.hexsha
+        if isinstance(side, GitAutograderCommit):
+            return side.hexsha
+        if isinstance(side, Commit):
+            return side.hexsha
+        try:
+            return self.repo.commit(side).hexsha
+        except (BadName, ValueError):
+            raise GitAutograderInvalidStateException(
+                self.MISSING_REVISION.format(revision=side)
+            )
@@ -0,0 +1,85 @@
+import subprocess
+from typing import Dict, Iterable, List, Optional
+
+from git import Repo
+
+
+class PatchIdHelper:
+    """
+    Stable patch ids of commits, to tell when a commit was cherry-picked or rebased.
+
+    Patch ids of any number of commits are computed in a single git log -p | git
+    patch-id --stable pipeline and cached by commit sha. Merge commits and commits
+    without changes have no patch id.
+    """
+
+    def __init__(self, repo: Repo) -> None:
+        self.repo = repo
+        self._patch_ids: Dict[str, Optional[str]] = {}
+
+    def patch_id(self, sha: str) -> Optional[str]:
+        return self.patch_ids([sha]).get(sha)
+
+    def patch_ids(self, shas: Iterable[str]) -> Dict[str, str]:
+        """Patch ids of the given commits, leaving out those without one."""
+        shas = list(dict.fromkeys(shas))
+        missing = [sha for sha in shas if sha not in self._patch_ids]
+        if missing:
+            computed = self.__compute(missing)
+            for sha in missing:
+                self._patch_ids[sha] = computed.get(sha)
+
+        patch_ids: Dict[str, str] = {}
+        for sha in shas:
+            patch_id = self._patch_ids[sha]
+            if patch_id is not None:
+                patch_ids[sha] = patch_id
+        return patch_ids
+
+    def range_patch_ids(self, *revs: str) -> Dict[str, str]:
+        """Patch ids of the commits git rev-list lists for the revisions."""
+        return self.patch_ids(self.__rev_list(*revs))
+
+    def equivalent_commits(self, ours: str, theirs: str) -> Dict[str, str]:
+        """
+        Commits only on ours mapped to a commit only on theirs with the same patch,
+        like the commits git cherry leaves out.
+        """
+        their_commits: Dict[str, str] = {}
+        for sha, patch_id in self.range_patch_ids(theirs, "--not", ours).items():
+            their_commits.setdefault(patch_id, sha)
+
+        return {
+            sha: their_commits[patch_id]
+            for sha, patch_id in self.range_patch_ids(ours, "--not", theirs).items()
+            if patch_id in their_commits
+        }
+
+    def __rev_list(self, *revs: str) -> List[str]:
+        return self.repo.git.rev_list("--no-merges", *revs, "--").split()
+
+    def __compute(self, shas: List[str]) -> Dict[str, str]:
+        log = self.repo.git.log(
+            "-p",
+            "--no-merges",
+            "--no-walk=unsorted",
+            "--format=commit %H",
+            "--stdin",
+            as_process=True,
+            istream=subprocess.PIPE,
+        )
+        if log.proc is None or log.proc.stdin is None:
+            return {}
+        # git log reads every revision before writing anything, so this cannot block
+        log.proc.stdin.write("\n".join(shas).encode("ascii") + b"\n")
+        log.proc.stdin.close()
+        try:
+            output = self.repo.git.patch_id("--stable", istream=log.proc.stdout)
+        finally:
+            log.wait()
+
+        patch_ids: Dict[str, str] = {}
+        for line in output.splitlines():
+            patch_id, sha = line.split()
+            patch_ids[sha] = patch_id
+        return patch_ids
@@ -4,6 +4,7 @@ from git import Repo
 
 from git_autograder.exception import GitAutograderInvalidStateException
 from git_autograder.remote import GitAutograderRemote
+from git_autograder.remote_registry import GitAutograderRemoteRegistry
 
 
 class RemoteHelper:
@@ -11,12 +12,10 @@ class RemoteHelper:
 
     def __init__(self, repo: Repo) -> None:
         self.repo = repo
+        self.registry = GitAutograderRemoteRegistry(repo)
 
     def remote_or_none(self, remote_name: str) -> Optional[GitAutograderRemote]:
-        for remote in self.repo.remotes:
-            if remote.name == remote_name:
-                return GitAutograderRemote(remote)
-        return None
+        return self.registry.remote_or_none(remote_name)
 
     def remote(self, remote_name: str) -> GitAutograderRemote:
         r = self.remote_or_none(remote_name)
@@ -28,3 +27,15 @@ class RemoteHelper:
 
     def has_remote(self, remote_name: str) -> bool:
         return self.remote_or_none(remote_name) is not None
+
+    def remote_for_repo_or_none(
+        self, owner: str, repo_name: str, host: str = "github.com"
+    ) -> Optional[GitAutograderRemote]:
+        """Returns the first remote, in config order, that points to the repository."""
+        remotes = self.registry.remotes_for_repo(owner, repo_name, host)
+        return remotes[0] if remotes else None
+
+    def has_remote_for_repo(
+        self, owner: str, repo_name: str, host: str = "github.com"
+    ) -> bool:
+        return self.remote_for_repo_or_none(owner, repo_name, host) is not None
@@ -0,0 +1,138 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from git import Repo
+from git.exc import GitCommandError
+
+from git_autograder.exception import GitAutograderInvalidStateException
+
+
+@dataclass(frozen=True)
+class RemoteRefsSnapshot:
+    remote: str
+    # Every advertised ref, keyed by its full name
+    refs: Dict[str, str]
+    # Keyed by branch name
+    heads: Dict[str, str]
+    # Keyed by tag name, annotated tags point to their tag object
+    tags: Dict[str, str]
+    # Commits of annotated tags, keyed by tag name
+    peeled: Dict[str, str]
+    fetched_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def tag_names(self) -> List[str]:
+        return list(self.tags.keys())
+
+    @property
+    def head_names(self) -> List[str]:
+        return list(self.heads.keys())
+
+    def has_tag(self, tag_name: str) -> bool:
+        return tag_name in self.tags
+
+    def has_head(self, branch_name: str) -> bool:
+        return branch_name in self.heads
+
+    def tag_commit_sha(self, tag_name: str) -> Optional[str]:
+        return self.peeled.get(tag_name, self.tags.get(tag_name))
+
+    @staticmethod
+    def parse(remote: str, raw: str) -> "RemoteRefsSnapshot":
+        refs: Dict[str, str] = {}
+        heads: Dict[str, str] = {}
+        tags: Dict[str, str] = {}
+        peeled: Dict[str, str] = {}
+
+        for line in raw.splitlines():
+            parts = line.split()
+            if len(parts) != 2:
+                continue
+
+            sha, ref = parts
+            if ref.endswith("^{}"):
+                name = ref[: -len("^{}")]
+                if name.startswith("refs/tags/"):
+                    peeled[name[len("refs/tags/") :]] = sha
+                continue
+
+            refs[ref] = sha
+            if ref.startswith("refs/heads/"):
+                heads[ref[len("refs/heads/") :]] = sha
+            elif ref.startswith("refs/tags/"):
+                tags[ref[len("refs/tags/") :]] = sha
+
+        return RemoteRefsSnapshot(
+            remote=remote, refs=refs, heads=heads, tags=tags, peeled=peeled
+        )
+
+
+class RemoteRefsHelper:
+    """
+    Caches the refs advertised by remotes for the duration of a grading run.
+
+    All refs of a remote are fetched with a single ls-remote and reused until the
+    snapshot is older than the TTL.
+
+    :param ttl: Seconds before a snapshot is fetched again, never if None.
+    :type ttl: Optional[float]
+    """
+
+    MISSING_REMOTE = "Remote {remote} is missing."
+    CANNOT_QUERY_REMOTE = "Unable to query remote refs for '{remote}'."
+    DEFAULT_TTL = 60.0
+
+    def __init__(self, repo: Repo, ttl: Optional[float] = DEFAULT_TTL) -> None:
+        self.repo = repo
+        self.ttl = ttl
+        self._snapshots: Dict[str, RemoteRefsSnapshot] = {}
+        self._lock = threading.Lock()
+
+    def snapshot_or_none(self, remote: str = "origin") -> Optional[RemoteRefsSnapshot]:
+        if not any(r.name == remote for r in self.repo.remotes):
+            return None
+
+        with self._lock:
+            snapshot = self._snapshots.get(remote)
+        if snapshot is not None and not self.__is_expired(snapshot):
+            return snapshot
+
+        # Fetched outside the lock so that readers of cached snapshots do not wait on
+        # the network, concurrent fetches of the same remote just race to store theirs
+        try:
+            raw = self.repo.git.ls_remote(remote)
+        except GitCommandError:
+            return None
+
+        snapshot = RemoteRefsSnapshot.parse(remote, str(raw))
+        with self._lock:
+            self._snapshots[remote] = snapshot
+        return snapshot
+
+    def snapshot(self, remote: str = "origin") -> RemoteRefsSnapshot:
+        if not any(r.name == remote for r in self.repo.remotes):
+            raise GitAutograderInvalidStateException(
+                self.MISSING_REMOTE.format(remote=remote)
+            )
+
+        snapshot = self.snapshot_or_none(remote)
+        if snapshot is None:
+            raise GitAutograderInvalidStateException(
+                self.CANNOT_QUERY_REMOTE.format(remote=remote)
+            )
+        return snapshot
+
+    def invalidate(self, remote: Optional[str] = None) -> None:
+        """Drops cached snapshots, for example after pushing to a remote."""
+        with self._lock:
+            if remote is None:
+                self._snapshots.clear()
+            else:
+                self._snapshots.pop(remote, None)
+
+    def __is_expired(self, snapshot: RemoteRefsSnapshot) -> bool:
+        return (
+            self.ttl is not None and time.monotonic() - snapshot.fetched_at > self.ttl
+        )
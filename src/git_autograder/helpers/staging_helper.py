@@ -0,0 +1,183 @@
+import os
+import stat
+from typing import Dict, List, Optional, Tuple
+
+from git import Repo
+
+from git_autograder.helpers.file_helper import FileHelper
+from git_autograder.helpers.tree_helper import GITLINK_MODE, TreeHelper
+from git_autograder.index import GitAutograderIndex
+from git_autograder.index_entry import GitAutograderIndexEntry
+
+
+class StagingHelper:
+    """
+    Checks on the staging area, read straight from .git/index.
+
+    The index is parsed again only when its mtime, size or inode change. Files whose
+    stat data still matches their index entry are known to be unmodified without
+    being hashed, which also seeds the FileHelper hash cache.
+    """
+
+    def __init__(
+        self,
+        repo: Repo,
+        files: Optional[FileHelper] = None,
+        trees: Optional[TreeHelper] = None,
+    ) -> None:
+        self.repo = repo
+        self.trees = trees if trees is not None else TreeHelper(repo)
+        self.files = files if files is not None else FileHelper(repo, self.trees)
+        self.index_path = os.path.join(repo.git_dir, "index")
+        self._index: Optional[GitAutograderIndex] = None
+        self._stamp: Optional[Tuple[int, int, int]] = None
+        self._core_flags: Optional[Dict[str, bool]] = None
+
+    @property
+    def index(self) -> GitAutograderIndex:
+        try:
+            st = os.stat(self.index_path)
+            stamp: Optional[Tuple[int, int, int]] = (
+                st.st_mtime_ns,
+                st.st_size,
+                st.st_ino,
+            )
+        except FileNotFoundError:
+            stamp = None
+        if self._index is None or stamp != self._stamp:
+            self._index = GitAutograderIndex.read(self.index_path)
+            self._stamp = stamp
+        return self._index
+
+    def entry(self, path: str, stage: int = 0) -> Optional[GitAutograderIndexEntry]:
+        return self.index.entry(self.__normalize(path), stage)
+
+    def is_tracked(self, path: str) -> bool:
+        return bool(self.index.stages(self.__normalize(path)))
+
+    def has_conflicts(self) -> bool:
+        return bool(self.index.conflicted_paths)
+
+    def staged_changes(self) -> Dict[str, str]:
+        """
+        Paths whose staged version differs from HEAD, mapped to A, M or D like
+        git diff --cached --name-status. Submodules are not compared.
+        """
+        index = self.index
+        head = self.__head_files()
+        changes: Dict[str, str] = {}
+        for (path, stage), entry in index.entries.items():
+            if (
+                stage != 0
+                or entry.is_intent_to_add
+                or stat.S_ISDIR(entry.mode)
+                or entry.mode == GITLINK_MODE
+            ):
+                continue
+            head_sha = head.get(path)
+            if head_sha is None:
+                changes[path] = "A"
+            elif head_sha != entry.sha:
+                changes[path] = "M"
+        for path in head:
+            if not index.stages(path):
+                changes[path] = "D"
+        return dict(sorted(changes.items()))
+
+    def is_staged(self, path: str) -> bool:
+        """Returns if the path has changes staged since HEAD, including deletions."""
+        return self.__normalize(path) in self.staged_changes()
+
+    def is_index_clean(self) -> bool:
+        """Returns if nothing is staged and there are no conflicts."""
+        return not self.has_conflicts() and not self.staged_changes()
+
+    def is_modified(self, path: str) -> bool:
+        """
+        Returns if the working tree copy of a tracked file differs from its staged
+        version, like git diff --name-only. Submodules are not compared.
+        """
+        entry = self.entry(path)
+        if entry is None or entry.mode == GITLINK_MODE:
+            return False
+        relative_path = entry.path
+        try:
+            st = os.lstat(os.path.join(self.repo.working_dir, relative_path))
+        except OSError:
+            return True
+        if self.__mode_changed(entry, st):
+            return True
+        if self.__stat_matches(entry, st):
+            self.files.remember_blob_sha(
+                relative_path,
+                (st.st_mtime_ns, st.st_ctime_ns, st.st_size, st.st_ino, st.st_mode),
+                entry.sha,
+            )
+            return False
+        return self.files.blob_sha(relative_path) != entry.sha
+
+    def modified_paths(self) -> List[str]:
+        return [path for path in self.index.paths if self.is_modified(path)]
+
+    def __head_files(self) -> Dict[str, str]:
+        if not self.repo.head.is_valid():
+            return {}
+        return self.trees.files(self.repo.head.commit)
+
+    def __mode_changed(
+        self, entry: GitAutograderIndexEntry, st: os.stat_result
+    ) -> bool:
+        if stat.S_ISLNK(entry.mode) != stat.S_ISLNK(st.st_mode):
+            return True
+        if stat.S_ISLNK(st.st_mode):
+            return False
+        if not stat.S_ISREG(st.st_mode):
+            return True
+        # Like git, the executable bit is ignored when core.fileMode is false
+        return self.__core_flag("filemode") and bool(entry.mode & stat.S_IXUSR) != bool(
+            st.st_mode & stat.S_IXUSR
+        )
+
+    def __stat_matches(
+        self, entry: GitAutograderIndexEntry, st: os.stat_result
+    ) -> bool:
+        if entry.size != st.st_size & 0xFFFFFFFF:
+            return False
+        if entry.ino != st.st_ino & 0xFFFFFFFF:
+            return False
+        if entry.mtime_ns != self.__truncated_ns(st.st_mtime_ns):
+            return False
+        # A chmod or a rewrite within the mtime granularity only changes the ctime
+        if self.__core_flag("trustctime") and entry.ctime_ns != self.__truncated_ns(
+            st.st_ctime_ns
+        ):
+            return False
+        # Like git, files modified at or after the index was written are racy and
+        # have to be hashed
+        return self._stamp is not None and entry.mtime_ns < self._stamp[0]
+
+    def __core_flag(self, name: str) -> bool:
+        """Boolean core option that defaults to true, such as filemode or trustctime."""
+        if self._core_flags is None:
+            flags: Dict[str, bool] = {}
+            with self.repo.config_reader() as config_reader:
+                if config_reader.has_section("core"):
+                    # Option names are case insensitive in git but not in the reader
+                    for option, value in config_reader.items("core"):
+                        flags[option.lower()] = str(value).lower() not in (
+                            "false",
+                            "no",
+                            "off",
+                            "0",
+                        )
+            self._core_flags = flags
+        return self._core_flags.get(name, True)
+
+    @staticmethod
+    def __truncated_ns(ns: int) -> int:
+        seconds, nanoseconds = divmod(ns, 1_000_000_000)
+        return (seconds & 0xFFFFFFFF) * 1_000_000_000 + nanoseconds
+
+    @staticmethod
+    def __normalize(path: str) -> str:
+        return os.path.normpath(path).replace(os.sep, "/")
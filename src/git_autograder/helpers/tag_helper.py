@@ -1,9 +1,12 @@
 from typing import List, Optional
 
 from git import Repo
-from git.exc import GitCommandError
 
 from git_autograder.exception import GitAutograderInvalidStateException
+from git_autograder.helpers.remote_refs_helper import (
+    RemoteRefsHelper,
+    RemoteRefsSnapshot,
+)
 from git_autograder.tag import GitAutograderTag
 
 
@@ -14,28 +17,16 @@ class TagHelper:
 
     @staticmethod
     def _parse_remote_tag_names(raw: str) -> list[str]:
-        names: list[str] = []
+        # Peeled refs always follow their tag, so tag names keep ls-remote's order
+        return RemoteRefsSnapshot.parse("", raw).tag_names
 
-        for line in raw.splitlines():
-            parts = line.split()
-            if len(parts) != 2:
-                continue
-
-            ref = parts[1]
-            if not ref.startswith("refs/tags/"):
-                continue
-
-            name = ref[len("refs/tags/") :]
-            if name.endswith("^{}"):
-                name = name[:-3]
-
-            if name not in names:
-                names.append(name)
-
-        return names
-
-    def __init__(self, repo: Repo) -> None:
+    def __init__(
+        self, repo: Repo, remote_refs: Optional[RemoteRefsHelper] = None
+    ) -> None:
         self.repo = repo
+        self.remote_refs = (
+            remote_refs if remote_refs is not None else RemoteRefsHelper(repo)
+        )
 
     def tag_or_none(self, tag_name: str) -> Optional[GitAutograderTag]:
         for tag_ref in self.repo.tags:
@@ -55,15 +46,10 @@ class TagHelper:
         return self.tag_or_none(tag_name) is not None
 
     def remote_tag_names_or_none(self, remote: str = "origin") -> Optional[List[str]]:
-        if not any(r.name == remote for r in self.repo.remotes):
+        snapshot = self.remote_refs.snapshot_or_none(remote)
+        if snapshot is None:
             return None
-
-        try:
-            raw = self.repo.git.ls_remote("--tags", remote)
-        except GitCommandError:
-            return None
-
-        return self._parse_remote_tag_names(raw)
+        return snapshot.tag_names
 
     def remote_tag_names(self, remote: str = "origin") -> List[str]:
         if not any(r.name == remote for r in self.repo.remotes):
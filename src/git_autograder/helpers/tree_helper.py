@@ -0,0 +1,105 @@
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from git import Commit, Repo
+
+from git_autograder.backends.object_backend import ObjectBackend
+from git_autograder.commit import GitAutograderCommit
+
+CommitLike = Union[GitAutograderCommit, Commit, str]
+# Name of an entry mapped to its type (blob, tree or commit) and sha
+TreeEntries = Dict[str, Tuple[str, str]]
+# Mode of submodule entries, which point at a commit of another repository
+GITLINK_MODE = 0o160000
+
+
+class TreeHelper:
+    """
+    Answers file existence queries across many commits from cached tree listings.
+
+    Each tree is listed recursively with a single ls-tree and cached by its sha,
+    along with the entries of every subtree in it. Commits that share a tree share
+    its cached listing, so walking a whole history only lists each distinct tree
+    once. Blobs are never read.
+
+    Revisions given as strings are resolved through the object backend when there
+    is one.
+    """
+
+    def __init__(self, repo: Repo, backend: Optional[ObjectBackend] = None) -> None:
+        self.repo = repo
+        self.backend = backend
+        self._entries: Dict[str, TreeEntries] = {}
+        self._files: Dict[str, Dict[str, str]] = {}
+
+    def entries(self, tree_sha: str) -> TreeEntries:
+        """Entries directly inside a tree."""
+        if tree_sha not in self._entries:
+            self.__list(tree_sha)
+        return self._entries[tree_sha]
+
+    def blob_sha(self, commit: CommitLike, file_path: str) -> Optional[str]:
+        """Sha of the file at the commit, None when it is missing or not a file."""
+        return self.files(commit).get("/".join(self.__split(file_path)))
+
+    def files(self, commit: CommitLike) -> Dict[str, str]:
+        """Every file of the commit mapped to its blob sha, like ls-tree -r."""
+        tree_sha = self.__tree_sha(commit)
+        files = self._files.get(tree_sha)
+        if files is None:
+            files = self.__list(tree_sha)
+        return files
+
+    def exists_in(self, commits: Sequence[CommitLike], file_path: str) -> List[bool]:
+        return [sha is not None for sha in self.blob_sha_at(commits, file_path)]
+
+    def exists_in_all(self, commits: Sequence[CommitLike], file_path: str) -> bool:
+        return all(self.blob_sha(commit, file_path) is not None for commit in commits)
+
+    def blob_sha_at(
+        self, commits: Sequence[CommitLike], file_path: str
+    ) -> List[Optional[str]]:
+        return [self.blob_sha(commit, file_path) for commit in commits]
+
+    def __list(self, tree_sha: str) -> Dict[str, str]:
+        """Lists a tree and all of its subtrees with one ls-tree."""
+        files: Dict[str, str] = {}
+        entries: Dict[str, TreeEntries] = {tree_sha: {}}
+        tree_shas = {"": tree_sha}
+        output = self.repo.git.ls_tree("-r", "-t", "-z", tree_sha)
+        # Records are "mode type sha\tpath", and trees come before their contents
+        for record in output.split("\x00"):
+            if not record:
+                continue
+            info, path = record.split("\t", 1)
+            _, entry_type, sha = info.split(" ")
+            folder, _, name = path.rpartition("/")
+            entries[tree_shas[folder]][name] = (entry_type, sha)
+            if entry_type == "tree":
+                tree_shas[path] = sha
+                entries.setdefault(sha, {})
+            elif entry_type == "blob":
+                files[path] = sha
+
+        for sha, tree_entries in entries.items():
+            self._entries.setdefault(sha, tree_entries)
+        self._files[tree_sha] = files
+        return files
+
+    def __tree_sha(self, commit: CommitLike) -> str:
+        if isinstance(commit, GitAutograderCommit):
+            return commit.commit.tree.hexsha
+        if isinstance(commit, Commit):
+            return commit.tree.hexsha
+        if self.backend is not None:
+            sha = self.backend.resolve(commit)
+            if sha is not None:
+                return self.backend.commit(sha).tree_sha
+        return self.repo.commit(commit).tree.hexsha
+
+    @staticmethod
+    def __split(file_path: str) -> List[str]:
+        return [
+            part
+            for part in file_path.replace("\\", "/").split("/")
+            if part not in ("", ".")
+        ]
@@ -0,0 +1,4 @@
+__all__ = ["GitAutograderHistoryTable", "GitAutograderHistoryShape"]
+
+from .history_shape import GitAutograderHistoryShape
+from .history_table import GitAutograderHistoryTable
@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from typing import Dict, List
+
+
+@dataclass(frozen=True)
+class GitAutograderHistoryShape:
+    """
+    How the history of some branches came to be, from their commit graph and reflogs.
+
+    :param tips: Branch names mapped to the commit they point to.
+    :param merge_commits: Commits on the branches with more than one parent.
+    :param fast_forwards: Branch names mapped to the commits their reflog says they
+        were fast-forwarded to, newest first.
+    :param rebased_commits: Commits on the branches mapped to the commit with the same
+        patch that they replaced, which is no longer on any of the branches.
+    :param rebased_branches: Branches that finished a rebase according to their reflog,
+        or that contain rebased commits.
+    :param squash_candidates: Commits on the branches mapped to the commits they
+        appear to squash together, oldest first.
+    """
+
+    tips: Dict[str, str]
+    merge_commits: List[str]
+    fast_forwards: Dict[str, List[str]]
+    rebased_commits: Dict[str, str]
+    rebased_branches: List[str]
+    squash_candidates: Dict[str, List[str]]
+
+    def is_merge_commit(self, sha: str) -> bool:
+        return sha in self.merge_commits
+
+    def was_fast_forwarded(self, branch_name: str) -> bool:
+        return len(self.fast_forwards.get(branch_name, [])) > 0
+
+    def was_rebased(self, branch_name: str) -> bool:
+        return branch_name in self.rebased_branches
+
+    def is_squash(self, sha: str) -> bool:
+        return sha in self.squash_candidates
@@ -0,0 +1,427 @@
+import mmap
+import os
+import struct
+from array import array
+from typing import IO, Any, Dict, Iterator, List, Literal, Optional, Sequence, Tuple
+
+from git import Repo
+
+from git_autograder.role_marker import RoleMarker
+
+SHA_SIZE = 20
+FIELD_SEPARATOR = "\x1f"
+RECORD_SEPARATOR = "\x1e"
+LOG_FORMAT = RECORD_SEPARATOR + FIELD_SEPARATOR.join(["%H", "%P", "%at", "%ct", "%B"])
+
+_Typecode = Literal["B", "I", "i", "q", "Q"]
+
+
+class GitAutograderHistoryTable:
+    """
+    Commit history of one or more repositories stored as columns instead of objects.
+
+    Row i of every column describes the same commit. Rows of a repository are
+    contiguous, between repo_offsets[i] and repo_offsets[i + 1], and in git log order.
+    Columns are memoryviews over either arrays or a memory mapped file, so they can be
+    handed to numpy.frombuffer without copying.
+
+    :param shas: Raw 20 byte shas of the commits, concatenated.
+    :param parent_offsets: Row i's parents are parent_indices[parent_offsets[i]:
+        parent_offsets[i + 1]].
+    :param parent_indices: Rows of the parents, -1 for parents outside the table.
+    :param message_offsets: Row i's message is messages[message_offsets[i]:
+        message_offsets[i + 1]], UTF-8 encoded.
+    :param role_markers: 1 when the commit message starts with a role marker.
+    :param file_offsets: Row i's touched files are files[file_offsets[i]:
+        file_offsets[i + 1]], UTF-8 encoded paths that each end with a NUL byte.
+        Merges list no files, like git log --name-only.
+    """
+
+    MAGIC = b"GAHT"
+    VERSION = 2
+    HEADER = struct.Struct("<4sIIIQI")
+
+    def __init__(
+        self,
+        repo_names: List[str],
+        repo_offsets: memoryview,
+        shas: memoryview,
+        parent_offsets: memoryview,
+        parent_indices: memoryview,
+        author_times: memoryview,
+        commit_times: memoryview,
+        message_offsets: memoryview,
+        role_markers: memoryview,
+        messages: memoryview,
+        file_offsets: memoryview,
+        files: memoryview,
+        mapping: Optional[mmap.mmap] = None,
+    ) -> None:
+        self.repo_names = repo_names
+        self.repo_offsets = repo_offsets
+        self.shas = shas
+        self.parent_offsets = parent_offsets
+        self.parent_indices = parent_indices
+        self.author_times = author_times
+        self.commit_times = commit_times
+        self.message_offsets = message_offsets
+        self.role_markers = role_markers
+        self.messages = messages
+        self.file_offsets = file_offsets
+        self.files = files
+        self._mapping = mapping
+        self._rows: Optional[Dict[str, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.author_times)
+
+    def __enter__(self) -> "GitAutograderHistoryTable":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def sha(self, row: int) -> str:
+        return self.shas[row * SHA_SIZE : (row + 1) * SHA_SIZE].hex()
+
+    def row_of(self, sha: str) -> Optional[int]:
+        """Row of a commit, the first one when several repositories contain it."""
+        if self._rows is None:
+            rows: Dict[str, int] = {}
+            for row in range(len(self) - 1, -1, -1):
+                rows[self.sha(row)] = row
+            self._rows = rows
+        return self._rows.get(sha)
+
+    def parents(self, row: int) -> List[int]:
+        start, end = self.parent_offsets[row], self.parent_offsets[row + 1]
+        return list(self.parent_indices[start:end])
+
+    def message(self, row: int) -> str:
+        start, end = self.message_offsets[row], self.message_offsets[row + 1]
+        return bytes(self.messages[start:end]).decode("utf-8", "replace")
+
+    def files_touched(self, row: int) -> List[str]:
+        start, end = self.file_offsets[row], self.file_offsets[row + 1]
+        if start == end:
+            return []
+        return (
+            bytes(self.files[start : end - 1]).decode("utf-8", "replace").split("\x00")
+        )
+
+    def files_touched_counts(self) -> array:
+        """Number of files touched by every commit."""
+        offsets = self.file_offsets
+        return array(
+            "I",
+            (
+                bytes(self.files[offsets[row] : offsets[row + 1]]).count(0)
+                for row in range(len(self))
+            ),
+        )
+
+    def repo_rows(self, repo_name: str) -> range:
+        index = self.repo_names.index(repo_name)
+        return range(self.repo_offsets[index], self.repo_offsets[index + 1])
+
+    def commits_per_repo(self) -> Dict[str, int]:
+        offsets = self.repo_offsets
+        return {
+            name: offsets[i + 1] - offsets[i] for i, name in enumerate(self.repo_names)
+        }
+
+    def role_markers_per_repo(self) -> Dict[str, int]:
+        offsets = self.repo_offsets
+        return {
+            name: sum(self.role_markers[offsets[i] : offsets[i + 1]])
+            for i, name in enumerate(self.repo_names)
+        }
+
+    def message_lengths(self) -> array:
+        """Length of every message in bytes."""
+        offsets = self.message_offsets
+        return array("Q", map(int.__sub__, offsets[1:], offsets[:-1]))
+
+    def merge_rows(self) -> List[int]:
+        offsets = self.parent_offsets
+        return [row for row in range(len(self)) if offsets[row + 1] - offsets[row] > 1]
+
+    def close(self) -> None:
+        """Releases the memory mapped file of a loaded table."""
+        if self._mapping is None:
+            return
+        for column in self.__columns():
+            column.release()
+        self.repo_offsets.release()
+        self._mapping.close()
+        self._mapping = None
+
+    @staticmethod
+    def extract(
+        repo: Repo, repo_name: Optional[str] = None
+    ) -> "GitAutograderHistoryTable":
+        """
+        Builds the table of every commit reachable from a ref or HEAD, streaming a
+        single git log that lists the files each commit touched.
+        """
+        name = (
+            repo_name if repo_name is not None else os.path.basename(repo.working_dir)
+        )
+        rows = GitAutograderHistoryTable.__read_log(repo)
+        row_of = {sha: row for row, (sha, *_) in enumerate(rows)}
+        shas = bytearray()
+        parent_offsets = array("I", [0])
+        parent_indices = array("i")
+        author_times = array("q")
+        commit_times = array("q")
+        message_offsets = array("Q", [0])
+        role_markers = array("B")
+        messages = bytearray()
+        file_offsets = array("Q", [0])
+        files = bytearray()
+        for sha, parents, author_time, commit_time, message, paths in rows:
+            shas += bytes.fromhex(sha)
+            parent_indices.extend(row_of.get(parent, -1) for parent in parents)
+            parent_offsets.append(len(parent_indices))
+            author_times.append(author_time)
+            commit_times.append(commit_time)
+            messages += message.encode("utf-8")
+            message_offsets.append(len(messages))
+            role_markers.append(1 if RoleMarker.has_role_marker(message) else 0)
+            for path in paths:
+                files += path.encode("utf-8") + b"\x00"
+            file_offsets.append(len(files))
+
+        return GitAutograderHistoryTable(
+            repo_names=[name],
+            repo_offsets=memoryview(array("Q", [0, len(rows)])),
+            shas=memoryview(shas),
+            parent_offsets=memoryview(parent_offsets),
+            parent_indices=memoryview(parent_indices),
+            author_times=memoryview(author_times),
+            commit_times=memoryview(commit_times),
+            message_offsets=memoryview(message_offsets),
+            role_markers=memoryview(role_markers),
+            messages=memoryview(messages),
+            file_offsets=memoryview(file_offsets),
+            files=memoryview(files),
+        )
+
+    @staticmethod
+    def concat(
+        tables: Sequence["GitAutograderHistoryTable"],
+    ) -> "GitAutograderHistoryTable":
+        """Concatenates the tables of many repositories into a single table."""
+        repo_names: List[str] = []
+        repo_offsets = array("Q", [0])
+        shas = bytearray()
+        parent_offsets = array("I", [0])
+        parent_indices = array("i")
+        author_times = array("q")
+        commit_times = array("q")
+        message_offsets = array("Q", [0])
+        role_markers = array("B")
+        messages = bytearray()
+        file_offsets = array("Q", [0])
+        files = bytearray()
+        for table in tables:
+            rows_before, parents_before = len(author_times), len(parent_indices)
+            messages_before, files_before = len(messages), len(files)
+
+            repo_names.extend(table.repo_names)
+            repo_offsets.extend(
+                rows_before + offset for offset in table.repo_offsets[1:]
+            )
+            shas += table.shas
+            parent_indices.extend(
+                index + rows_before if index >= 0 else -1
+                for index in table.parent_indices
+            )
+            parent_offsets.extend(
+                parents_before + offset for offset in table.parent_offsets[1:]
+            )
+            author_times.frombytes(table.author_times.cast("B"))
+            commit_times.frombytes(table.commit_times.cast("B"))
+            messages += table.messages
+            message_offsets.extend(
+                messages_before + offset for offset in table.message_offsets[1:]
+            )
+            role_markers.frombytes(table.role_markers.cast("B"))
+            files += table.files
+            file_offsets.extend(
+                files_before + offset for offset in table.file_offsets[1:]
+            )
+
+        return GitAutograderHistoryTable(
+            repo_names=repo_names,
+            repo_offsets=memoryview(repo_offsets),
+            shas=memoryview(shas),
+            parent_offsets=memoryview(parent_offsets),
+            parent_indices=memoryview(parent_indices),
+            author_times=memoryview(author_times),
+            commit_times=memoryview(commit_times),
+            message_offsets=memoryview(message_offsets),
+            role_markers=memoryview(role_markers),
+            messages=memoryview(messages),
+            file_offsets=memoryview(file_offsets),
+            files=memoryview(files),
+        )
+
+    def save(self, path: str | os.PathLike) -> None:
+        names = "\n".join(self.repo_names).encode("utf-8")
+        header = self.HEADER.pack(
+            self.MAGIC,
+            self.VERSION,
+            len(self.repo_names),
+            len(self),
+            len(self.parent_indices),
+            len(names),
+        )
+        with open(path, "wb") as f:
+            self.__write_section(f, header)
+            self.__write_section(f, names)
+            self.__write_section(f, self.repo_offsets)
+            for column in self.__columns():
+                self.__write_section(f, column)
+
+    @staticmethod
+    def load(path: str | os.PathLike) -> "GitAutograderHistoryTable":
+        """
+        Memory maps a saved table, columns are read from the file as they are used.
+
+        :raises ValueError: when the file is not a saved history table.
+        """
+        with open(path, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = GitAutograderHistoryTable.HEADER
+        magic, version, repo_count, count, parent_count, names_size = (
+            header.unpack_from(mapping)
+        )
+        if (
+            magic != GitAutograderHistoryTable.MAGIC
+            or version != GitAutograderHistoryTable.VERSION
+        ):
+            mapping.close()
+            raise ValueError(f"{path} is not a history table")
+
+        view = memoryview(mapping)
+        position = GitAutograderHistoryTable.__aligned(header.size)
+
+        def section(size: int, typecode: _Typecode = "B") -> memoryview:
+            nonlocal position
+            start = position
+            position = GitAutograderHistoryTable.__aligned(start + size)
+            return view[start : start + size].cast(typecode)
+
+        names = bytes(section(names_size)).decode("utf-8")
+        repo_offsets = section((repo_count + 1) * 8, "Q")
+        shas = section(count * SHA_SIZE)
+        parent_offsets = section((count + 1) * 4, "I")
+        parent_indices = section(parent_count * 4, "i")
+        author_times = section(count * 8, "q")
+        commit_times = section(count * 8, "q")
+        message_offsets = section((count + 1) * 8, "Q")
+        role_markers = section(count)
+        messages = section(message_offsets[count])
+        file_offsets = section((count + 1) * 8, "Q")
+        files = section(file_offsets[count])
+        view.release()
+
+        return GitAutograderHistoryTable(
+            repo_names=names.split("\n") if repo_count > 0 else [],
+            repo_offsets=repo_offsets,
+            shas=shas,
+            parent_offsets=parent_offsets,
+            parent_indices=parent_indices,
+            author_times=author_times,
+            commit_times=commit_times,
+            message_offsets=message_offsets,
+            role_markers=role_markers,
+            messages=messages,
+            file_offsets=file_offsets,
+            files=files,
+            mapping=mapping,
+        )
+
+    @staticmethod
+    def load_many(paths: Sequence[str | os.PathLike]) -> "GitAutograderHistoryTable":
+        """Loads the saved tables of a cohort into one table."""
+        tables = [GitAutograderHistoryTable.load(path) for path in paths]
+        try:
+            return GitAutograderHistoryTable.concat(tables)
+        finally:
+            for table in tables:
+                table.close()
+
+    def __columns(self) -> List[memoryview]:
+        # In file order, after the repository names and offsets
+        return [
+            self.shas,
+            self.parent_offsets,
+            self.parent_indices,
+            self.author_times,
+            self.commit_times,
+            self.message_offsets,
+            self.role_markers,
+            self.messages,
+            self.file_offsets,
+            self.files,
+        ]
+
+    @staticmethod
+    def __aligned(position: int) -> int:
+        return (position + 7) & ~7
+
+    @staticmethod
+    def __write_section(f: IO[bytes], data: bytes | memoryview) -> None:
+        size = len(memoryview(data).cast("B"))
+        f.write(data)
+        f.write(b"\x00" * (GitAutograderHistoryTable.__aligned(size) - size))
+
+    @staticmethod
+    def __read_log(
+        repo: Repo,
+    ) -> List[Tuple[str, List[str], int, int, str, List[str]]]:
+        rows = []
+        # Each record is the formatted commit, a NUL, then the touched paths each
+        # followed by a NUL
+        process = repo.git.log(
+            "--all",
+            "-z",
+            "--no-renames",
+            "--name-only",
+            f"--format={LOG_FORMAT}",
+            as_process=True,
+        )
+        stdout = process.proc.stdout if process.proc is not None else None
+        if stdout is not None:
+            for record in GitAutograderHistoryTable.__records(stdout):
+                header, _, paths = record.partition("\x00")
+                sha, parents, author_time, commit_time, message = header.split(
+                    FIELD_SEPARATOR, 4
+                )
+                rows.append(
+                    (
+                        sha,
+                        parents.split(),
+                        int(author_time),
+                        int(commit_time),
+                        message,
+                        [path for path in paths.lstrip("\n").split("\x00") if path],
+                    )
+                )
+        process.wait()
+        return rows
+
+    @staticmethod
+    def __records(stdout: IO[bytes], chunk_size: int = 1 << 16) -> Iterator[str]:
+        separator = RECORD_SEPARATOR.encode("ascii")
+        pending = b""
+        while chunk := stdout.read(chunk_size):
+            records = (pending + chunk).split(separator)
+            pending = records.pop()
+            for record in records:
+                if record:
+                    yield record.decode("utf-8", "replace")
+        if pending:
+            yield pending.decode("utf-8", "replace")
@@ -0,0 +1,172 @@
+import mmap
+import os
+import struct
+from typing import Dict, List, Optional, Tuple
+
+from git_autograder.exception import GitAutograderInvalidStateException
+from git_autograder.index_entry import GitAutograderIndexEntry
+
+
+class GitAutograderIndex:
+    """
+    Read-only view of .git/index, parsed without going through git.
+
+    Versions 2 to 4 are supported. Extensions are skipped, only their signatures are
+    kept. Entries are keyed by path and stage for constant time lookups.
+    """
+
+    SIGNATURE = b"DIRC"
+    HEADER = struct.Struct(">4sII")
+    # ctime, mtime, dev, ino, mode, uid, gid and size are followed by the sha and flags
+    ENTRY = struct.Struct(">IIIIIIIIII20sH")
+    EXTENDED_FLAGS = struct.Struct(">H")
+    EXTENSION_HEADER = struct.Struct(">4sI")
+    CHECKSUM_SIZE = 20
+
+    EXTENDED = 0x4000
+    NAME_MASK = 0x0FFF
+
+    def __init__(
+        self,
+        version: int,
+        entries: Dict[Tuple[str, int], GitAutograderIndexEntry],
+        extensions: List[str],
+    ) -> None:
+        self.version = version
+        self.entries = entries
+        self.extensions = extensions
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def entry(self, path: str, stage: int = 0) -> Optional[GitAutograderIndexEntry]:
+        return self.entries.get((path, stage))
+
+    def stages(self, path: str) -> List[int]:
+        return [stage for stage in range(4) if (path, stage) in self.entries]
+
+    @property
+    def paths(self) -> List[str]:
+        return sorted({path for path, _ in self.entries})
+
+    @property
+    def conflicted_paths(self) -> List[str]:
+        return sorted({path for path, stage in self.entries if stage > 0})
+
+    @staticmethod
+    def read(path: str | os.PathLike) -> "GitAutograderIndex":
+        """
+        Parses the index file at path, an empty index if it does not exist.
+
+        :raises GitAutograderInvalidStateException: when the file is not a valid index.
+        """
+        try:
+            with open(path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return GitAutograderIndex(2, {}, [])
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    return GitAutograderIndex.parse(data)
+        except FileNotFoundError:
+            return GitAutograderIndex(2, {}, [])
+
+    @staticmethod
+    def parse(data: bytes | mmap.mmap) -> "GitAutograderIndex":
+        if (
+            len(data)
+            < GitAutograderIndex.HEADER.size + GitAutograderIndex.CHECKSUM_SIZE
+        ):
+            raise GitAutograderInvalidStateException("Index file is truncated")
+        signature, version, count = GitAutograderIndex.HEADER.unpack_from(data, 0)
+        if signature != GitAutograderIndex.SIGNATURE:
+            raise GitAutograderInvalidStateException("Index file has no DIRC signature")
+        if version not in (2, 3, 4):
+            raise GitAutograderInvalidStateException(
+                f"Index version {version} is not supported"
+            )
+
+        entry_struct = GitAutograderIndex.ENTRY
+        entries: Dict[Tuple[str, int], GitAutograderIndexEntry] = {}
+        offset = GitAutograderIndex.HEADER.size
+        previous_path = b""
+        for _ in range(count):
+            start = offset
+            (
+                ctime_s,
+                ctime_ns,
+                mtime_s,
+                mtime_ns,
+                dev,
+                ino,
+                mode,
+                uid,
+                gid,
+                size,
+                sha,
+                flags,
+            ) = entry_struct.unpack_from(data, offset)
+            offset += entry_struct.size
+            all_flags = flags
+            if version >= 3 and flags & GitAutograderIndex.EXTENDED:
+                (extended,) = GitAutograderIndex.EXTENDED_FLAGS.unpack_from(
+                    data, offset
+                )
+                offset += GitAutograderIndex.EXTENDED_FLAGS.size
+                all_flags |= extended << 16
+
+            if version == 4:
+                # The path is stored as the number of bytes to drop from the end of
+                # the previous path followed by the rest of the path
+                strip, offset = GitAutograderIndex.__varint(data, offset)
+                end = data.find(b"\x00", offset)
+                path = previous_path[: len(previous_path) - strip] + data[offset:end]
+                offset = end + 1
+            else:
+                name_length = flags & GitAutograderIndex.NAME_MASK
+                if name_length < GitAutograderIndex.NAME_MASK:
+                    end = offset + name_length
+                else:
+                    end = data.find(b"\x00", offset)
+                path = data[offset:end]
+                # Entries are padded with 1 to 8 NULs to a multiple of 8 bytes
+                offset = start + ((end - start) // 8 + 1) * 8
+            previous_path = path
+
+            entry = GitAutograderIndexEntry(
+                path=path.decode("utf-8", "surrogateescape"),
+                stage=(flags >> 12) & 0x3,
+                mode=mode,
+                sha=sha.hex(),
+                ctime_ns=ctime_s * 1_000_000_000 + ctime_ns,
+                mtime_ns=mtime_s * 1_000_000_000 + mtime_ns,
+                dev=dev,
+                ino=ino,
+                uid=uid,
+                gid=gid,
+                size=size,
+                flags=all_flags,
+            )
+            entries[(entry.path, entry.stage)] = entry
+
+        extensions = []
+        end_of_extensions = len(data) - GitAutograderIndex.CHECKSUM_SIZE
+        header = GitAutograderIndex.EXTENSION_HEADER
+        while offset + header.size <= end_of_extensions:
+            signature, size = header.unpack_from(data, offset)
+            extensions.append(signature.decode("ascii", "replace"))
+            offset += header.size + size
+
+        if "link" in extensions:
+            # Entries of a split index live in a shared index this does not read
+            raise GitAutograderInvalidStateException("Split indexes are not supported")
+        return GitAutograderIndex(version, entries, extensions)
+
+    @staticmethod
+    def __varint(data: bytes | mmap.mmap, offset: int) -> Tuple[int, int]:
+        byte = data[offset]
+        offset += 1
+        value = byte & 0x7F
+        while byte & 0x80:
+            byte = data[offset]
+            offset += 1
+            value = ((value + 1) << 7) | (byte & 0x7F)
+        return value, offset
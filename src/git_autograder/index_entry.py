@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class GitAutograderIndexEntry:
+    """
+    Entry of the staging area, as stored in .git/index.
+
+    Stat data is truncated to 32 bits by git, so it can only be compared with the
+    same truncation applied.
+    """
+
+    path: str
+    stage: int
+    mode: int
+    sha: str
+    ctime_ns: int
+    mtime_ns: int
+    dev: int
+    ino: int
+    uid: int
+    gid: int
+    size: int
+    flags: int
+
+    INTENT_TO_ADD = 1 << 29
+    SKIP_WORKTREE = 1 << 30
+
+    @property
+    def is_intent_to_add(self) -> bool:
+        return bool(self.flags & self.INTENT_TO_ADD)
+
+    @property
+    def is_skip_worktree(self) -> bool:
+        return bool(self.flags & self.SKIP_WORKTREE)
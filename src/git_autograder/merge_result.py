@@ -0,0 +1,42 @@
+from dataclasses import dataclass, field
+from typing import List, NamedTuple, Tuple
+
+
+class GitAutograderMergeMessage(NamedTuple):
+    """Informational message of a merge, like "CONFLICT (contents)"."""
+
+    paths: Tuple[str, ...]
+    kind: str
+    message: str
+
+
+@dataclass(frozen=True)
+class GitAutograderMergeResult:
+    """
+    Outcome of merging two commits, computed without touching the working tree.
+
+    :param tree_sha: Sha of the merged tree. When there are conflicts, conflicted
+        files contain conflict markers, like they would after git merge.
+    :param conflicts: Paths that would be left unmerged, in git's order.
+    """
+
+    ours: str
+    theirs: str
+    tree_sha: str
+    conflicts: List[str] = field(default_factory=list)
+    messages: List[GitAutograderMergeMessage] = field(default_factory=list)
+
+    @property
+    def is_clean(self) -> bool:
+        return not self.conflicts
+
+    def has_conflict(self, file_path: str) -> bool:
+        return file_path in self.conflicts
+
+    def conflict_kinds(self, file_path: str) -> List[str]:
+        """Kinds of conflicts reported for a path, like "CONFLICT (modify/delete)"."""
+        return [
+            message.kind
+            for message in self.messages
+            if file_path in message.paths and message.kind.startswith("CONFLICT")
+        ]
@@ -1,12 +1,13 @@
-import json
 import os
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import ClassVar, List, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional
 
-from git_autograder.encoder import Encoder
 from git_autograder.status import GitAutograderStatus
 
+if TYPE_CHECKING:
+    from git_autograder.output_sinks.output_sink import GitAutograderOutputSink
+
 
 @dataclass
 class GitAutograderOutput:
@@ -16,12 +17,35 @@ class GitAutograderOutput:
     completed_at: Optional[datetime]
     comments: Optional[List[str]] = None
     exercise_name: Optional[str] = None
+    # Where save writes the output when no sink is given
+    sink: Optional["GitAutograderOutputSink"] = field(
+        default=None, repr=False, compare=False
+    )
 
     OUTPUT_FILE_NAME: ClassVar[str] = "output.json"
 
-    def save(self, path: str = "../output") -> None:
-        os.makedirs(path, exist_ok=True)
-        file_path = os.path.join(path, self.OUTPUT_FILE_NAME)
-        output = asdict(self)
-        with open(file_path, "w") as f:
-            f.write(json.dumps(output, cls=Encoder))
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "started_at": self.started_at,
+            "completed_at": self.completed_at,
+            "comments": self.comments,
+            "exercise_name": self.exercise_name,
+        }
+
+    def save(
+        self,
+        path: str | os.PathLike = "../output",
+        sink: Optional["GitAutograderOutputSink"] = None,
+    ) -> None:
+        """
+        Writes the output to the given sink, falling back to the sink the output was
+        created with and then to a single output.json in path.
+        """
+        if sink is None:
+            sink = self.sink
+        if sink is None:
+            from git_autograder.output_sinks.file_output_sink import FileOutputSink
+
+            sink = FileOutputSink(path)
+        sink.write(self)
@@ -0,0 +1,13 @@
+__all__ = [
+    "GitAutograderOutputSink",
+    "FileOutputSink",
+    "JsonLinesOutputSink",
+    "BinaryStreamOutputSink",
+    "MemoryOutputSink",
+]
+
+from .output_sink import GitAutograderOutputSink
+from .file_output_sink import FileOutputSink
+from .json_lines_output_sink import JsonLinesOutputSink
+from .binary_stream_output_sink import BinaryStreamOutputSink
+from .memory_output_sink import MemoryOutputSink
@@ -0,0 +1,50 @@
+import struct
+import sys
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Tuple
+
+from git_autograder.output import GitAutograderOutput
+from git_autograder.output_sinks.output_sink import GitAutograderOutputSink
+from git_autograder.serialization import dumps, loads
+
+
+class BinaryStreamOutputSink(GitAutograderOutputSink):
+    """
+    Writes length-prefixed frames to a binary stream, stdout by default.
+
+    Each frame is a 1 byte kind, a 4 byte big-endian payload length and a UTF-8
+    JSON payload. Frames can be read back with read_frames.
+    """
+
+    COMMENT = 0
+    OUTPUT = 1
+    HEADER = struct.Struct(">BI")
+
+    def __init__(self, stream: Optional[BinaryIO] = None) -> None:
+        self.stream = stream if stream is not None else sys.stdout.buffer
+
+    def emit_comment(self, comment: str, exercise_name: Optional[str] = None) -> None:
+        self.__write_frame(
+            self.COMMENT, {"exercise_name": exercise_name, "comment": comment}
+        )
+
+    def write(self, output: GitAutograderOutput) -> None:
+        self.__write_frame(self.OUTPUT, output.to_dict())
+
+    def close(self) -> None:
+        self.stream.flush()
+
+    @staticmethod
+    def read_frames(stream: BinaryIO) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        header_size = BinaryStreamOutputSink.HEADER.size
+        while True:
+            header = stream.read(header_size)
+            if len(header) < header_size:
+                return
+            kind, length = BinaryStreamOutputSink.HEADER.unpack(header)
+            yield kind, loads(stream.read(length))
+
+    def __write_frame(self, kind: int, payload: Dict[str, Any]) -> None:
+        data = dumps(payload)
+        # Written at once so that frames from concurrent writers do not interleave
+        self.stream.write(self.HEADER.pack(kind, len(data)) + data)
+        self.stream.flush()
@@ -0,0 +1,53 @@
+import os
+import secrets
+from typing import Optional
+
+from git_autograder.output import GitAutograderOutput
+from git_autograder.output_sinks.output_sink import GitAutograderOutputSink
+from git_autograder.serialization import dumps, dumps_str
+
+
+class FileOutputSink(GitAutograderOutputSink):
+    """
+    Writes the output to a single JSON file, replacing it atomically so readers never
+    see a partially written output.
+
+    Comments emitted while grading are appended to a ``.partial`` JSON Lines file next
+    to it, which is removed once the output is written.
+
+    :param path: Folder to write the output file to.
+    :type path: str | os.PathLike
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike = "../output",
+        file_name: str = GitAutograderOutput.OUTPUT_FILE_NAME,
+    ) -> None:
+        self.path = os.fspath(path)
+        self.file_path = os.path.join(self.path, file_name)
+        self.partial_file_path = self.file_path + ".partial"
+
+    def emit_comment(self, comment: str, exercise_name: Optional[str] = None) -> None:
+        os.makedirs(self.path, exist_ok=True)
+        line = dumps_str({"exercise_name": exercise_name, "comment": comment})
+        with open(self.partial_file_path, "a") as f:
+            f.write(line + "\n")
+
+    def write(self, output: GitAutograderOutput) -> None:
+        os.makedirs(self.path, exist_ok=True)
+        temp_path = os.path.join(
+            self.path, f".output.{os.getpid()}.{secrets.token_hex(8)}.tmp"
+        )
+        # Unlike mkstemp's 0o600, this leaves the permissions to the umask like open
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(dumps(output.to_dict()))
+            os.replace(temp_path, self.file_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+        if os.path.exists(self.partial_file_path):
+            os.unlink(self.partial_file_path)
@@ -0,0 +1,45 @@
+import os
+from typing import Any, Dict, Optional, TextIO
+
+from git_autograder.output import GitAutograderOutput
+from git_autograder.output_sinks.output_sink import GitAutograderOutputSink
+from git_autograder.serialization import dumps_str
+
+
+class JsonLinesOutputSink(GitAutograderOutputSink):
+    """
+    Appends one JSON object per line, so many gradings can share a single file.
+
+    Every line has an ``event`` of either ``comment`` or ``output``. Each line is
+    written and flushed with a single write so that a crash never leaves a
+    partially written output behind a complete one.
+
+    :param path: JSON Lines file to append to.
+    :type path: str | os.PathLike
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self.path = os.fspath(path)
+        self._file: Optional[TextIO] = None
+
+    def emit_comment(self, comment: str, exercise_name: Optional[str] = None) -> None:
+        self.__append(
+            {"event": "comment", "exercise_name": exercise_name, "comment": comment}
+        )
+
+    def write(self, output: GitAutograderOutput) -> None:
+        self.__append({"event": "output", **output.to_dict()})
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __append(self, record: Dict[str, Any]) -> None:
+        if self._file is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(dumps_str(record) + "\n")
+        self._file.flush()
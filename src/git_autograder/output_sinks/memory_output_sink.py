@@ -0,0 +1,18 @@
+from typing import List, Optional, Tuple
+
+from git_autograder.output import GitAutograderOutput
+from git_autograder.output_sinks.output_sink import GitAutograderOutputSink
+
+
+class MemoryOutputSink(GitAutograderOutputSink):
+    """Collects outputs in memory, mainly for batch runners and tests."""
+
+    def __init__(self) -> None:
+        self.comments: List[Tuple[Optional[str], str]] = []
+        self.outputs: List[GitAutograderOutput] = []
+
+    def emit_comment(self, comment: str, exercise_name: Optional[str] = None) -> None:
+        self.comments.append((exercise_name, comment))
+
+    def write(self, output: GitAutograderOutput) -> None:
+        self.outputs.append(output)
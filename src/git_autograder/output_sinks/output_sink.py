@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+from git_autograder.output import GitAutograderOutput
+
+
+class GitAutograderOutputSink(ABC):
+    """
+    Destination of grading outputs.
+
+    Comments can be emitted while grading is still in progress, and write is called
+    once per exercise with its final output. Sinks can be used as context managers
+    to close them once every output is written.
+    """
+
+    def emit_comment(self, comment: str, exercise_name: Optional[str] = None) -> None:
+        """Records a comment before the final output is written."""
+
+    @abstractmethod
+    def write(self, output: GitAutograderOutput) -> None: ...
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "GitAutograderOutputSink":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
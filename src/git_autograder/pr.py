@@ -91,9 +91,10 @@ class GitAutograderPr:
         self._commits = commits
         self._reviews = reviews
         self._comments = comments
-        self._user_reviews = [review for review in reviews if review.is_from_user()]
-        self._user_comments = [comment for comment in comments if comment.is_from_user()]
-        self._user_commits = [commit for commit in commits if commit.is_from_user()]
+        # Classified on first access since most graders only read some of them
+        self._user_reviews: Optional[List[GitAutograderPrReview]] = None
+        self._user_comments: Optional[List[GitAutograderPrComment]] = None
+        self._user_commits: Optional[List[GitAutograderCommit]] = None
 
     def __eq__(self, value: Any) -> bool:
         if not isinstance(value, GitAutograderPr):
@@ -166,33 +167,42 @@ class GitAutograderPr:
 
     @property
     def user_reviews(self) -> List[GitAutograderPrReview]:
+        if self._user_reviews is None:
+            self._user_reviews = [r for r in self._reviews if r.is_from_user()]
         return self._user_reviews
     
     @property
     def user_comments(self) -> List[GitAutograderPrComment]:
+        if self._user_comments is None:
+            self._user_comments = [c for c in self._comments if c.is_from_user()]
         return self._user_comments
     
     @property
     def user_commits(self) -> List[GitAutograderCommit]:
+        if self._user_commits is None:
+            self._user_commits = [c for c in self._commits if c.is_from_user()]
         return self._user_commits
     
     @property
     def last_user_review(self) -> GitAutograderPrReview:
-        if not self._user_reviews:
+        user_reviews = self.user_reviews
+        if not user_reviews:
             raise GitAutograderInvalidStateException("No user reviews found for this PR.")
-        return self._user_reviews[-1]
+        return user_reviews[-1]
     
     @property
     def last_user_comment(self) -> GitAutograderPrComment:
-        if not self._user_comments:
+        user_comments = self.user_comments
+        if not user_comments:
             raise GitAutograderInvalidStateException("No user comments found for this PR.")
-        return self._user_comments[-1]
+        return user_comments[-1]
 
     @property
     def last_user_commit(self) -> GitAutograderCommit:
-        if not self._user_commits:
+        user_commits = self.user_commits
+        if not user_commits:
             raise GitAutograderInvalidStateException("No user commits found for this PR.")
-        return self._user_commits[-1]
+        return user_commits[-1]
 
     def is_open(self) -> bool:
         return self._state.upper() == "OPEN"
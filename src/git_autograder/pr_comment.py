@@ -11,6 +11,7 @@ class GitAutograderPrComment:
     ) -> None:
         self._author_login = author_login
         self._body = body
+        self._is_from_user: Optional[bool] = None
 
     def __eq__(self, value: object) -> bool:
         if not isinstance(value, GitAutograderPrComment):
@@ -29,10 +30,10 @@ class GitAutograderPrComment:
         return self._body
     
     def is_from_user(self) -> bool:
-        if self._body:
-            return not RoleMarker.has_role_marker(self._body)
-        # If there is no body, we can assume it's from a user.
-        return True
+        if self._is_from_user is None:
+            # If there is no body, we can assume it's from a user.
+            self._is_from_user = RoleMarker.is_from_user(self._body)
+        return self._is_from_user
 
     def is_content_equal(self, body: str) -> bool:
         return self._body.lower() == body.lower() if self._body else False
@@ -13,6 +13,7 @@ class GitAutograderPrReview:
         self._author_login = author_login
         self._state = state
         self._body = body
+        self._is_from_user: Optional[bool] = None
 
     def __eq__(self, value: object) -> bool:
         if not isinstance(value, GitAutograderPrReview):
@@ -36,10 +37,10 @@ class GitAutograderPrReview:
         return self._body
     
     def is_from_user(self) -> bool:
-        if self._body:
-            return not RoleMarker.has_role_marker(self._body)
-        # If there is no body, we can assume it's from a user.
-        return True
+        if self._is_from_user is None:
+            # If there is no body, we can assume it's from a user.
+            self._is_from_user = RoleMarker.is_from_user(self._body)
+        return self._is_from_user
 
     def is_approved(self) -> bool:
         return self._state.upper() == "APPROVED" if self._state else False
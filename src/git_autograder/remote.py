@@ -1,48 +1,101 @@
-from typing import Any, List
-from urllib.parse import urlparse
+import tempfile
+from functools import cached_property
+from typing import Any, List, Optional
 
-from git import Remote
+from git import Head, Object, RefLog, Remote
+from git.util import hex_to_bin
+
+from git_autograder.remote_url import GitAutograderRemoteUrl
 
 
 class GitAutograderRemote:
-    def __init__(self, remote: Remote) -> None:
+    def __init__(self, remote: Remote, url: Optional[str] = None) -> None:
         self.remote = remote
+        # Reading the URL from a Remote re-reads the repository's config
+        self._url = url
 
     def __eq__(self, value: Any) -> bool:
         if not isinstance(value, GitAutograderRemote):
             return False
         return value.remote == self.remote
 
+    @property
+    def name(self) -> str:
+        return self.remote.name
+
+    @property
+    def url(self) -> str:
+        if self._url is None:
+            self._url = self.remote.url
+        return self._url
+
+    @cached_property
+    def parsed_url(self) -> Optional[GitAutograderRemoteUrl]:
+        return GitAutograderRemoteUrl.parse(self.url)
+
     def track_branches(self, branches: List[str]) -> None:
-        # We start with filtering main because it should be the default branch that
-        # exists even on local machines.
-        tracked = {"main"}
-        for remote in self.remote.refs:
-            for b in branches:
-                if b not in tracked or f"{self.remote.name}/{b}" != remote.name:
-                    continue
-                tracked.add(b)
-                self.remote.repo.git.checkout("-b", b, f"{self.remote.name}/{b}")
-                break
-
-    def is_for_repo(self, owner: str, repo_name: str) -> bool:
-        remote_url = self.remote.url
-        if remote_url.startswith("https://github.com"):
-            # https://github.com/<owner>/<repo>.git
-            parsed = urlparse(remote_url)
-            path_parts = parsed.path.strip("/").split("/")
-        elif remote_url.startswith("git@github.com"):
-            # git@github.com:<owner>/<repo>.git
-            components = remote_url.split(":")
-            if len(components) != 2:
-                return False
-            path_parts = components[1].split("/")
-        else:
-            return False
+        """
+        Creates local branches that track the given branches of this remote.
 
-        owner_part = path_parts[0]
-        repo_part = path_parts[1]
-        if repo_part.endswith(".git"):
-            repo_part = repo_part[:-4]
+        All branches are created in a single update-ref transaction without checking
+        them out, so the working tree and HEAD are left untouched. Branches that
+        already exist locally, such as main, or that are missing on the remote are
+        skipped.
+        """
+        repo = self.remote.repo
+        remote_shas = {ref.remote_head: ref.object.hexsha for ref in self.remote.refs}
+        local_branches = {head.name for head in repo.heads}
+        untracked = [
+            b
+            for b in dict.fromkeys(branches)
+            if b in remote_shas and b not in local_branches
+        ]
+        if not untracked:
+            return
 
-        return owner_part == owner and repo_part == repo_name
+        commands = "".join(
+            f"create refs/heads/{b} {remote_shas[b]}\n" for b in untracked
+        )
+        with tempfile.TemporaryFile() as stdin:
+            stdin.write(commands.encode("utf-8"))
+            stdin.seek(0)
+            # update-ref gives every ref of a transaction the same reflog message, so
+            # the reflogs are written below instead, one message per branch
+            repo.git(c="core.logAllRefUpdates=false").update_ref(
+                "--stdin", istream=stdin
+            )
+
+        with repo.config_reader() as config_reader:
+            # Option names are case insensitive in git but not in the config reader
+            core = (
+                {name.lower(): value for name, value in config_reader.items("core")}
+                if config_reader.has_section("core")
+                else {}
+            )
+            log_updates = str(
+                core.get("logallrefupdates", "false" if repo.bare else "true")
+            )
+            if log_updates.lower() not in ("false", "no", "off", "0"):
+                for b in untracked:
+                    RefLog.append_entry(
+                        config_reader,
+                        RefLog.path(Head(repo, f"refs/heads/{b}")),
+                        Object.NULL_BIN_SHA,
+                        hex_to_bin(remote_shas[b]),
+                        f"branch: Created from {self.remote.name}/{b}",
+                    )
+
+        with repo.config_writer() as config:
+            for b in untracked:
+                config.set_value(f'branch "{b}"', "remote", self.remote.name)
+                config.set_value(f'branch "{b}"', "merge", f"refs/heads/{b}")
+
+    def is_for_repo(self, owner: str, repo_name: str, host: str = "github.com") -> bool:
+        """
+        Returns if the remote points to the given repository. Supports https, ssh,
+        scp-like and git URLs, with file:// URLs and local paths using an empty host.
+        """
+        parsed_url = self.parsed_url
+        if parsed_url is None:
+            return False
+        return parsed_url.key == GitAutograderRemoteUrl.key_of(host, owner, repo_name)
@@ -0,0 +1,66 @@
+import os
+from typing import Dict, List, Optional, Tuple
+
+from git import Remote, Repo
+
+from git_autograder.remote import GitAutograderRemote
+from git_autograder.remote_url import GitAutograderRemoteUrl
+
+
+class GitAutograderRemoteRegistry:
+    """
+    Index of a repository's remotes by name and by the repository they point to.
+
+    Remote URLs are read from a single pass over the config and parsed once. The
+    index is rebuilt only when the repository's config file changes.
+    """
+
+    def __init__(self, repo: Repo) -> None:
+        self.repo = repo
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._by_name: Dict[str, GitAutograderRemote] = {}
+        self._by_key: Dict[Tuple[str, str, str], List[GitAutograderRemote]] = {}
+
+    def remote_or_none(self, remote_name: str) -> Optional[GitAutograderRemote]:
+        self.__refresh()
+        return self._by_name.get(remote_name)
+
+    def remotes(self) -> List[GitAutograderRemote]:
+        self.__refresh()
+        return list(self._by_name.values())
+
+    def remotes_for_repo(
+        self, owner: str, repo_name: str, host: str = "github.com"
+    ) -> List[GitAutograderRemote]:
+        self.__refresh()
+        key = GitAutograderRemoteUrl.key_of(host, owner, repo_name)
+        return list(self._by_key.get(key, []))
+
+    def __refresh(self) -> None:
+        stamp = self.__config_stamp()
+        if stamp is not None and stamp == self._stamp:
+            return
+
+        by_name: Dict[str, GitAutograderRemote] = {}
+        by_key: Dict[Tuple[str, str, str], List[GitAutograderRemote]] = {}
+        reader = self.repo.config_reader()
+        for section in reader.sections():
+            if not section.startswith('remote "') or not section.endswith('"'):
+                continue
+            name = section[len('remote "') : -1]
+            url = str(reader.get_value(section, "url", default=""))
+            remote = GitAutograderRemote(Remote(self.repo, name), url=url)
+            by_name[name] = remote
+            if remote.parsed_url is not None:
+                by_key.setdefault(remote.parsed_url.key, []).append(remote)
+
+        self._by_name = by_name
+        self._by_key = by_key
+        self._stamp = stamp
+
+    def __config_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(os.path.join(self.repo.common_dir, "config"))
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
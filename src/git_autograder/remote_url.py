@@ -0,0 +1,65 @@
+import os
+import re
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from urllib.parse import urlparse
+
+
+@dataclass(frozen=True)
+class GitAutograderRemoteUrl:
+    """
+    Remote URL normalized into the (host, owner, repo) that it points to.
+
+    Hosts, owners and repository names are compared case-insensitively, as GitHub
+    does. Local paths and file:// URLs have an empty host.
+    """
+
+    host: str
+    owner: str
+    repo: str
+
+    # Matches scp-like URLs such as git@github.com:owner/repo.git
+    SCP_PATTERN = re.compile(r"^(?:[^@/]+@)?([^:/]+):(?!//)(.+)$")
+
+    @property
+    def key(self) -> Tuple[str, str, str]:
+        return self.key_of(self.host, self.owner, self.repo)
+
+    @staticmethod
+    def key_of(host: str, owner: str, repo: str) -> Tuple[str, str, str]:
+        return host.casefold(), owner.casefold(), repo.casefold()
+
+    @staticmethod
+    def parse(url: str) -> Optional["GitAutograderRemoteUrl"]:
+        url = url.strip()
+        if url == "":
+            return None
+
+        host: str
+        path: str
+        if "://" in url:
+            parsed = urlparse(url)
+            host = "" if parsed.scheme == "file" else parsed.hostname or ""
+            path = parsed.path
+        else:
+            match = GitAutograderRemoteUrl.SCP_PATTERN.match(url)
+            # Windows drive letters look like single character scp hosts
+            if match is not None and len(match.group(1)) > 1:
+                host, path = match.group(1), match.group(2)
+            else:
+                host, path = "", url
+
+        if host == "":
+            path = os.path.normpath(path)
+        parts = [part for part in re.split(r"[/\\]", path) if part not in ("", ".")]
+        if len(parts) < 2:
+            return None
+
+        # Hosted repositories are identified by the start of their path, such as
+        # github.com/<owner>/<repo>/tree/main, while local ones by their folders
+        owner, repo = (parts[0], parts[1]) if host != "" else (parts[-2], parts[-1])
+        if repo.endswith(".git"):
+            repo = repo[: -len(".git")]
+        if repo == "":
+            return None
+        return GitAutograderRemoteUrl(host=host.lower(), owner=owner, repo=repo)
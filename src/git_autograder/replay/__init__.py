@@ -0,0 +1,10 @@
+__all__ = [
+    "GitAutograderReplayHarness",
+    "GitAutograderReplayReport",
+    "GitAutograderReplayComparison",
+    "ReplayResult",
+]
+
+from .replay_comparison import GitAutograderReplayComparison
+from .replay_report import GitAutograderReplayReport, ReplayResult
+from .replay_harness import GitAutograderReplayHarness
@@ -0,0 +1,60 @@
+import argparse
+import importlib
+import sys
+
+from git_autograder.replay.replay_harness import GitAutograderReplayHarness
+from git_autograder.replay.replay_report import GitAutograderReplayReport
+from git_autograder.snapshot.snapshot_store import GitAutograderSnapshotStore
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m git_autograder.replay",
+        description="Benchmarks a grader against a store of exercise snapshots.",
+    )
+    parser.add_argument(
+        "grader", help="Grading function of the exercise, as module:function"
+    )
+    parser.add_argument("--store", required=True, help="Folder of the snapshot store")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--report", help="Path to save the report to")
+    parser.add_argument("--baseline", help="Report of a previous run to compare with")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="Fraction by which latencies may grow before counting as a regression",
+    )
+    args = parser.parse_args()
+
+    module_name, _, function_name = args.grader.partition(":")
+    grade = getattr(importlib.import_module(module_name), function_name or "grade")
+    harness = GitAutograderReplayHarness(
+        grade, GitAutograderSnapshotStore(args.store), max_workers=args.workers
+    )
+    report = harness.run()
+    if args.report:
+        report.save(args.report)
+
+    latencies = report.latencies
+    print(f"gradings: {len(report.results)}")
+    print(f"throughput: {report.throughput:.2f}/s")
+    for name in ["p50", "p95", "p99"]:
+        print(f"{name}: {latencies[name] * 1000:.1f}ms")
+    print(f"peak rss: {report.peak_rss_kb} KiB")
+    print(f"subprocesses: {report.subprocess_count}")
+    for name, seconds in sorted(
+        report.helper_times.items(), key=lambda item: item[1], reverse=True
+    ):
+        print(f"{name}: {seconds * 1000:.1f}ms over {report.helper_calls[name]} calls")
+
+    if args.baseline:
+        comparison = report.compare(GitAutograderReplayReport.load(args.baseline))
+        for line in comparison.summary():
+            print(line)
+        if comparison.has_regressions(args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+import functools
+import inspect
+import sys
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+from git_autograder.helpers.branch_helper import BranchHelper
+from git_autograder.helpers.commit_helper import CommitHelper
+from git_autograder.helpers.file_helper import FileHelper
+from git_autograder.helpers.history_shape_helper import HistoryShapeHelper
+from git_autograder.helpers.merge_simulator import MergeSimulator
+from git_autograder.helpers.patch_id_helper import PatchIdHelper
+from git_autograder.helpers.remote_helper import RemoteHelper
+from git_autograder.helpers.remote_refs_helper import RemoteRefsHelper
+from git_autograder.helpers.staging_helper import StagingHelper
+from git_autograder.helpers.tag_helper import TagHelper
+from git_autograder.helpers.tree_helper import TreeHelper
+
+
+class SubprocessCounter:
+    """
+    Counts the processes started through subprocess, per thread, using an audit hook.
+
+    Audit hooks cannot be removed, so a single hook is installed for the lifetime of
+    the interpreter and only counts while a counter is active on the thread.
+    """
+
+    _installed = False
+    _install_lock = threading.Lock()
+    _local = threading.local()
+
+    def __init__(self) -> None:
+        self.count = 0
+        with SubprocessCounter._install_lock:
+            if not SubprocessCounter._installed:
+                sys.addaudithook(SubprocessCounter.__audit)
+                SubprocessCounter._installed = True
+
+    def __enter__(self) -> "SubprocessCounter":
+        self._local.counter = self
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self._local.counter = None
+
+    @staticmethod
+    def __audit(event: str, args: Tuple[Any, ...]) -> None:
+        if event != "subprocess.Popen":
+            return
+        counter = getattr(SubprocessCounter._local, "counter", None)
+        if counter is not None:
+            counter.count += 1
+
+
+class HelperTimer:
+    """
+    Accumulates the time spent in the public methods of the repository helpers.
+
+    Methods are wrapped on the helper classes while the timer is active. Times are
+    inclusive, so a helper method calling another helper is counted in both.
+    """
+
+    HELPERS: List[Type[Any]] = [
+        BranchHelper,
+        CommitHelper,
+        FileHelper,
+        HistoryShapeHelper,
+        MergeSimulator,
+        PatchIdHelper,
+        RemoteHelper,
+        RemoteRefsHelper,
+        StagingHelper,
+        TagHelper,
+        TreeHelper,
+    ]
+
+    def __init__(self) -> None:
+        self.times: Dict[str, float] = defaultdict(float)
+        self.calls: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self._originals: List[Tuple[Type[Any], str, Callable[..., Any]]] = []
+
+    def __enter__(self) -> "HelperTimer":
+        for helper in self.HELPERS:
+            for name, method in list(vars(helper).items()):
+                # Static methods and properties are left alone
+                if name.startswith("_") or not inspect.isfunction(method):
+                    continue
+                self._originals.append((helper, name, method))
+                setattr(helper, name, self.__wrap(f"{helper.__name__}.{name}", method))
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        for helper, name, method in self._originals:
+            setattr(helper, name, method)
+        self._originals.clear()
+
+    def __wrap(self, key: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(method)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    self.times[key] += elapsed
+                    self.calls[key] += 1
+
+        return timed
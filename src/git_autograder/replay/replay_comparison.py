@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from git_autograder.replay.replay_report import GitAutograderReplayReport
+
+
+@dataclass(frozen=True)
+class GitAutograderReplayComparison:
+    """
+    Differences between two replays of the same corpus.
+
+    Correctness is compared per snapshot, while speed is compared on the latency
+    percentiles and throughput of the whole replay.
+    """
+
+    status_changes: Dict[str, Tuple[str, str]]
+    comment_changes: List[str]
+    added: List[str]
+    removed: List[str]
+    latency_changes: Dict[str, Tuple[float, float]]
+    throughput_change: Tuple[float, float]
+
+    @staticmethod
+    def between(
+        previous: "GitAutograderReplayReport", current: "GitAutograderReplayReport"
+    ) -> "GitAutograderReplayComparison":
+        previous_results = {result.snapshot_id: result for result in previous.results}
+        current_results = {result.snapshot_id: result for result in current.results}
+
+        status_changes: Dict[str, Tuple[str, str]] = {}
+        comment_changes: List[str] = []
+        for snapshot_id, result in current_results.items():
+            previous_result = previous_results.get(snapshot_id)
+            if previous_result is None:
+                continue
+            if previous_result.status != result.status:
+                status_changes[snapshot_id] = (previous_result.status, result.status)
+            elif previous_result.comments != result.comments:
+                comment_changes.append(snapshot_id)
+
+        previous_latencies = previous.latencies
+        return GitAutograderReplayComparison(
+            status_changes=status_changes,
+            comment_changes=sorted(comment_changes),
+            added=sorted(current_results.keys() - previous_results.keys()),
+            removed=sorted(previous_results.keys() - current_results.keys()),
+            latency_changes={
+                name: (previous_latencies[name], latency)
+                for name, latency in current.latencies.items()
+            },
+            throughput_change=(previous.throughput, current.throughput),
+        )
+
+    @property
+    def has_correctness_changes(self) -> bool:
+        return bool(self.status_changes or self.comment_changes)
+
+    def slowdowns(self, tolerance: float = 0.1) -> List[str]:
+        """
+        Names of the latencies, and of the throughput, that got worse by more than the
+        given fraction.
+        """
+        slower = [
+            name
+            for name, (previous, current) in self.latency_changes.items()
+            if current > previous * (1 + tolerance)
+        ]
+        previous_throughput, current_throughput = self.throughput_change
+        if current_throughput < previous_throughput * (1 - tolerance):
+            slower.append("throughput")
+        return slower
+
+    def has_regressions(self, tolerance: float = 0.1) -> bool:
+        return self.has_correctness_changes or bool(self.slowdowns(tolerance))
+
+    def summary(self) -> List[str]:
+        lines = [
+            f"{snapshot_id}: {previous} -> {current}"
+            for snapshot_id, (previous, current) in sorted(self.status_changes.items())
+        ]
+        lines.extend(
+            f"{snapshot_id}: comments changed" for snapshot_id in self.comment_changes
+        )
+        for name, (previous, current) in self.latency_changes.items():
+            lines.append(f"{name}: {previous * 1000:.1f}ms -> {current * 1000:.1f}ms")
+        previous_throughput, current_throughput = self.throughput_change
+        lines.append(
+            f"throughput: {previous_throughput:.2f}/s -> {current_throughput:.2f}/s"
+        )
+        return lines
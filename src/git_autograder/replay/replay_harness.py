@@ -0,0 +1,137 @@
+import os
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Callable, ContextManager, Iterable, List, Optional, Tuple
+
+from git_autograder.exception import (
+    GitAutograderException,
+    GitAutograderWrongAnswerException,
+)
+from git_autograder.exercise import GitAutograderExercise
+from git_autograder.output import GitAutograderOutput
+from git_autograder.replay.instrumentation import HelperTimer, SubprocessCounter
+from git_autograder.replay.replay_report import GitAutograderReplayReport, ReplayResult
+from git_autograder.repo.repo import GitAutograderRepo
+from git_autograder.snapshot.snapshot_store import GitAutograderSnapshotStore
+from git_autograder.status import GitAutograderStatus
+
+Grader = Callable[[GitAutograderExercise], GitAutograderOutput]
+
+
+class GitAutograderReplayHarness:
+    """
+    Replays a grader over snapshots of recorded submissions to benchmark it.
+
+    Snapshots are restored before any grading starts, so the latencies only cover
+    loading the exercise and grading it. Gradings run on a thread pool, which keeps
+    the helper timings and subprocess counts in process.
+
+    :param grade: Grading function of the exercise.
+    :type grade: Callable[[GitAutograderExercise], GitAutograderOutput]
+    :param store: Store holding the snapshots to replay.
+    :type store: GitAutograderSnapshotStore
+    :param max_workers: Number of gradings to run concurrently.
+    :type max_workers: int
+    :param time_helpers: Whether to time the repository helper methods.
+    :type time_helpers: bool
+    """
+
+    def __init__(
+        self,
+        grade: Grader,
+        store: GitAutograderSnapshotStore,
+        max_workers: int = 1,
+        time_helpers: bool = True,
+    ) -> None:
+        self.grade = grade
+        self.store = store
+        self.max_workers = max_workers
+        self.time_helpers = time_helpers
+
+    def run(
+        self, snapshot_ids: Optional[Iterable[str]] = None
+    ) -> GitAutograderReplayReport:
+        """Replays the given snapshots, all of the store's by default."""
+        ids = list(snapshot_ids) if snapshot_ids is not None else self.store.ids()
+        timer = HelperTimer()
+        timing: ContextManager[object] = timer if self.time_helpers else nullcontext()
+
+        with tempfile.TemporaryDirectory(prefix="git-autograder-replay-") as temp_dir:
+            # Snapshots are all restored up front so restoring is not measured
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                exercise_paths = list(
+                    executor.map(
+                        lambda snapshot_id: self.store.restore(
+                            snapshot_id, os.path.join(temp_dir, snapshot_id)
+                        ),
+                        ids,
+                    )
+                )
+
+            with timing, ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                started_at = time.perf_counter()
+                results = list(executor.map(self.__replay, ids, exercise_paths))
+                wall_time = time.perf_counter() - started_at
+
+        peak_rss_kb, children_peak_rss_kb = self.__peak_rss()
+        return GitAutograderReplayReport(
+            results=results,
+            wall_time=wall_time,
+            max_workers=self.max_workers,
+            peak_rss_kb=peak_rss_kb,
+            children_peak_rss_kb=children_peak_rss_kb,
+            helper_times=dict(timer.times),
+            helper_calls=dict(timer.calls),
+        )
+
+    def __replay(self, snapshot_id: str, exercise_path: Path) -> ReplayResult:
+        with SubprocessCounter() as counter:
+            started_at = time.perf_counter()
+            status, comments = self.__grade(str(exercise_path))
+            duration = time.perf_counter() - started_at
+
+        return ReplayResult(
+            snapshot_id=snapshot_id,
+            status=status,
+            comments=comments,
+            duration=duration,
+            subprocess_count=counter.count,
+        )
+
+    def __grade(self, exercise_path: str) -> Tuple[str, List[str]]:
+        exercise: Optional[GitAutograderExercise] = None
+        try:
+            exercise = GitAutograderExercise(exercise_path)
+            output = self.grade(exercise)
+            return output.status, list(output.comments or [])
+        except GitAutograderWrongAnswerException as e:
+            return GitAutograderStatus.UNSUCCESSFUL, self.__messages(e.message)
+        except GitAutograderException as e:
+            return GitAutograderStatus.ERROR, self.__messages(e.message)
+        except Exception:
+            return GitAutograderStatus.ERROR, [traceback.format_exc()]
+        finally:
+            if exercise is not None and isinstance(exercise.repo, GitAutograderRepo):
+                exercise.repo.close()
+
+    @staticmethod
+    def __messages(message: str | List[str]) -> List[str]:
+        return message if isinstance(message, list) else [message]
+
+    @staticmethod
+    def __peak_rss() -> Tuple[Optional[int], Optional[int]]:
+        if sys.platform == "win32":
+            return None, None
+        import resource
+
+        # ru_maxrss is in bytes on macOS but in KiB elsewhere
+        scale = 1024 if sys.platform == "darwin" else 1
+        return (
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // scale,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss // scale,
+        )
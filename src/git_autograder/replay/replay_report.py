@@ -0,0 +1,124 @@
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from git_autograder.replay.replay_comparison import GitAutograderReplayComparison
+from git_autograder.serialization import dumps, loads
+
+
+@dataclass(frozen=True)
+class ReplayResult:
+    snapshot_id: str
+    status: str
+    comments: List[str]
+    duration: float
+    subprocess_count: int
+
+
+@dataclass
+class GitAutograderReplayReport:
+    """
+    Results of replaying a grader over a corpus of snapshots.
+
+    :param wall_time: Seconds taken by the whole replay.
+    :param peak_rss_kb: Peak resident set size of the process and of its git
+        subprocesses, in KiB.
+    :param helper_times: Inclusive seconds spent in each helper method.
+    """
+
+    results: List[ReplayResult]
+    wall_time: float
+    max_workers: int
+    peak_rss_kb: Optional[int] = None
+    children_peak_rss_kb: Optional[int] = None
+    helper_times: Dict[str, float] = field(default_factory=dict)
+    helper_calls: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        """Gradings per second."""
+        return len(self.results) / self.wall_time if self.wall_time > 0 else 0.0
+
+    @property
+    def subprocess_count(self) -> int:
+        return sum(result.subprocess_count for result in self.results)
+
+    @property
+    def latencies(self) -> Dict[str, float]:
+        durations = sorted(result.duration for result in self.results)
+        return {
+            "p50": self.percentile(durations, 50),
+            "p95": self.percentile(durations, 95),
+            "p99": self.percentile(durations, 99),
+            "max": durations[-1] if durations else 0.0,
+        }
+
+    @staticmethod
+    def percentile(sorted_values: List[float], percent: float) -> float:
+        """Linearly interpolated percentile of already sorted values."""
+        if not sorted_values:
+            return 0.0
+        rank = (len(sorted_values) - 1) * percent / 100
+        lower = math.floor(rank)
+        upper = min(lower + 1, len(sorted_values) - 1)
+        return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (
+            rank - lower
+        )
+
+    def compare(
+        self, previous: "GitAutograderReplayReport"
+    ) -> GitAutograderReplayComparison:
+        return GitAutograderReplayComparison.between(previous, self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "results": [
+                {
+                    "snapshot_id": result.snapshot_id,
+                    "status": result.status,
+                    "comments": result.comments,
+                    "duration": result.duration,
+                    "subprocess_count": result.subprocess_count,
+                }
+                for result in self.results
+            ],
+            "wall_time": self.wall_time,
+            "max_workers": self.max_workers,
+            "peak_rss_kb": self.peak_rss_kb,
+            "children_peak_rss_kb": self.children_peak_rss_kb,
+            "helper_times": self.helper_times,
+            "helper_calls": self.helper_calls,
+            "throughput": self.throughput,
+            "latencies": self.latencies,
+            "subprocess_count": self.subprocess_count,
+        }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "GitAutograderReplayReport":
+        return GitAutograderReplayReport(
+            results=[
+                ReplayResult(
+                    snapshot_id=result["snapshot_id"],
+                    status=result["status"],
+                    comments=result["comments"],
+                    duration=result["duration"],
+                    subprocess_count=result["subprocess_count"],
+                )
+                for result in data["results"]
+            ],
+            wall_time=data["wall_time"],
+            max_workers=data["max_workers"],
+            peak_rss_kb=data.get("peak_rss_kb"),
+            children_peak_rss_kb=data.get("children_peak_rss_kb"),
+            helper_times=data.get("helper_times", {}),
+            helper_calls=data.get("helper_calls", {}),
+        )
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as f:
+            f.write(dumps(self.to_dict()))
+
+    @staticmethod
+    def load(path: str) -> "GitAutograderReplayReport":
+        with open(path, "rb") as f:
+            return GitAutograderReplayReport.from_dict(loads(f.read()))
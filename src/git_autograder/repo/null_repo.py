@@ -1,12 +1,18 @@
 from git import Repo
 
+from git_autograder.backends.object_backend import ObjectBackend
 from git_autograder.helpers.branch_helper import BranchHelper
 from git_autograder.helpers.commit_helper import CommitHelper
 from git_autograder.helpers.file_helper import FileHelper
+from git_autograder.helpers.history_shape_helper import HistoryShapeHelper
+from git_autograder.helpers.patch_id_helper import PatchIdHelper
 from git_autograder.helpers.pr_helper.null_pr_helper import NullPrHelper
 from git_autograder.helpers.pr_helper.pr_helper import PrHelper
 from git_autograder.helpers.remote_helper import RemoteHelper
+from git_autograder.helpers.remote_refs_helper import RemoteRefsHelper
+from git_autograder.helpers.staging_helper import StagingHelper
 from git_autograder.helpers.tag_helper import TagHelper
+from git_autograder.helpers.tree_helper import TreeHelper
 from git_autograder.repo.repo_base import GitAutograderRepoBase
 
 
@@ -17,6 +23,12 @@ class NullGitAutograderRepo(GitAutograderRepoBase):
             "Cannot access attribute repo on NullGitAutograderRepo. Check that your repo_type is not 'ignore'."
         )
 
+    @property
+    def backend(self) -> ObjectBackend:
+        raise AttributeError(
+            "Cannot access attribute backend on NullGitAutograderRepo. Check that your repo_type is not 'ignore'."
+        )
+
     @property
     def branches(self) -> BranchHelper:
         raise AttributeError(
@@ -48,12 +60,42 @@ class NullGitAutograderRepo(GitAutograderRepoBase):
             "Cannot access attribute tags on NullGitAutograderRepo. Check that your repo_type is not 'ignore'."
         )
     
+    @property
+    def trees(self) -> TreeHelper:
+        raise AttributeError(
+            "Cannot access attribute trees on NullGitAutograderRepo. Check that your repo_type is not 'ignore'."
+        )
+    
+    @property
+    def staging(self) -> StagingHelper:
+        raise AttributeError(
+            "Cannot access attribute staging on NullGitAutograderRepo. Check that your repo_type is not 'ignore'."
+        )
+
+    @property
+    def patch_ids(self) -> PatchIdHelper:
+        raise AttributeError(
+            "Cannot access attribute patch_ids on NullGitAutograderRepo. Check that your repo_type is not 'ignore'."
+        )
+
+    @property
+    def history(self) -> HistoryShapeHelper:
+        raise AttributeError(
+            "Cannot access attribute history on NullGitAutograderRepo. Check that your repo_type is not 'ignore'."
+        )
+    
     @property
     def prs(self) -> PrHelper | NullPrHelper:
         raise AttributeError(
             "Cannot access attribute prs on NullGitAutograderRepo. Check that your repo_type is not 'ignore'."
         )
 
+    @property
+    def remote_refs(self) -> RemoteRefsHelper:
+        raise AttributeError(
+            "Cannot access attribute remote_refs on NullGitAutograderRepo. Check that your repo_type is not 'ignore'."
+        )
+
     def __getattr__(self, name: str) -> None:
         raise AttributeError(
             f"Cannot access attribute {name} on NullGitAutograderRepo. Check that your repo_type is not 'ignore'."
@@ -1,67 +1,217 @@
 import os
+import threading
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from git import Repo
 
+from git_autograder.backends import ObjectBackend, open_backend
 from git_autograder.exercise_config import ExerciseConfig
 from git_autograder.helpers.branch_helper import BranchHelper
 from git_autograder.helpers.commit_helper import CommitHelper
 from git_autograder.helpers.file_helper import FileHelper
+from git_autograder.helpers.history_shape_helper import HistoryShapeHelper
+from git_autograder.helpers.patch_id_helper import PatchIdHelper
 from git_autograder.helpers.pr_helper.null_pr_helper import NullPrHelper
 from git_autograder.helpers.pr_helper.pr_helper import PrContext, PrHelper
 from git_autograder.helpers.remote_helper import RemoteHelper
+from git_autograder.helpers.remote_refs_helper import RemoteRefsHelper
+from git_autograder.helpers.staging_helper import StagingHelper
 from git_autograder.helpers.tag_helper import TagHelper
+from git_autograder.helpers.tree_helper import TreeHelper
 from git_autograder.repo.repo_base import GitAutograderRepoBase
 
 
+@dataclass
+class _RepoHandles:
+    repo: Repo
+    backend: ObjectBackend
+    branches: BranchHelper
+    commits: CommitHelper
+    remotes: RemoteHelper
+    files: FileHelper
+    tags: TagHelper
+    trees: TreeHelper
+    staging: StagingHelper
+    patch_ids: PatchIdHelper
+    history: HistoryShapeHelper
+
+    @staticmethod
+    def open(
+        repo: Repo, remote_refs: RemoteRefsHelper, backend_name: Optional[str]
+    ) -> "_RepoHandles":
+        backend = open_backend(repo, backend_name)
+        trees = TreeHelper(repo, backend)
+        files = FileHelper(repo, trees)
+        patch_ids = PatchIdHelper(repo)
+        return _RepoHandles(
+            repo=repo,
+            backend=backend,
+            branches=BranchHelper(repo, backend),
+            commits=CommitHelper(repo, backend),
+            remotes=RemoteHelper(repo),
+            files=files,
+            tags=TagHelper(repo, remote_refs),
+            trees=trees,
+            staging=StagingHelper(repo, files, trees),
+            patch_ids=patch_ids,
+            history=HistoryShapeHelper(repo, backend, patch_ids),
+        )
+
+    def close(self) -> None:
+        self.backend.close()
+        self.repo.close()
+
+
 class GitAutograderRepo(GitAutograderRepoBase):
+    """
+    Submission repository of an exercise.
+
+    GitPython's Repo and the helpers built on it are not safe to share across threads.
+    In thread safe mode, every thread lazily opens its own Repo and helpers, so
+    objects returned by them should not be passed between threads.
+
+    :param thread_safe: Whether each thread should use its own Repo and helpers.
+    :type thread_safe: bool
+    :param backend: Object backend to read commits and refs with, one of auto,
+        gitpython or pygit2. Defaults to the GIT_AUTOGRADER_BACKEND environment
+        variable, then to gitpython.
+    :type backend: Optional[str]
+    """
+
     def __init__(
         self,
         exercise_name: str,
         repo_path: str | os.PathLike,
         pr_context: Optional[PrContext] = None,
+        thread_safe: bool = False,
+        backend: Optional[str] = None,
     ) -> None:
         self.exercise_name = exercise_name
         self.repo_path = repo_path
+        self.backend_name = backend
 
-        self._repo: Repo = Repo(self.repo_path)
+        repo = Repo(self.repo_path)
+        # Remote refs do not depend on the thread, so one cache is shared by all
+        self._remote_refs = RemoteRefsHelper(repo)
+        self._handles = _RepoHandles.open(repo, self._remote_refs, backend)
+        self._thread_handles = threading.local()
+        # Handles opened by other threads, with the thread that opened them
+        self._opened_handles: List[Tuple[threading.Thread, _RepoHandles]] = []
+        self._opened_handles_lock = threading.Lock()
+        self.thread_safe = False
+        if thread_safe:
+            self.enable_thread_safety()
 
-        self._branches: BranchHelper = BranchHelper(self._repo)
-        self._commits: CommitHelper = CommitHelper(self._repo)
-        self._remotes: RemoteHelper = RemoteHelper(self._repo)
-        self._files: FileHelper = FileHelper(self._repo)
-        self._tags: TagHelper = TagHelper(self._repo)
-        self._prs: PrHelper | NullPrHelper = PrHelper(pr_context, self._repo) if pr_context else NullPrHelper()
+        self._prs: PrHelper | NullPrHelper = (
+            PrHelper(pr_context, self._handles.repo) if pr_context else NullPrHelper()
+        )
+
+    def enable_thread_safety(self) -> None:
+        """Switches to thread safe mode, the current thread keeps its existing Repo."""
+        if self.thread_safe:
+            return
+        self._thread_handles.handles = self._handles
+        self.thread_safe = True
+
+    def close(self) -> None:
+        """Closes the Repo of every thread, including their git processes."""
+        with self._opened_handles_lock:
+            for _, handles in self._opened_handles:
+                handles.close()
+            self._opened_handles.clear()
+        self._handles.close()
+
+    def close_finished_threads(self) -> None:
+        """Closes the Repo and helpers of threads that have exited."""
+        with self._opened_handles_lock:
+            finished = [
+                handles
+                for thread, handles in self._opened_handles
+                if not thread.is_alive()
+            ]
+            self._opened_handles = [
+                (thread, handles)
+                for thread, handles in self._opened_handles
+                if thread.is_alive()
+            ]
+        for handles in finished:
+            handles.close()
+
+    @property
+    def opened_handles_count(self) -> int:
+        """Number of threads other than the creating one with their own Repo open."""
+        with self._opened_handles_lock:
+            return len(self._opened_handles)
+
+    def __current_handles(self) -> _RepoHandles:
+        if not self.thread_safe:
+            return self._handles
+        handles: Optional[_RepoHandles] = getattr(
+            self._thread_handles, "handles", None
+        )
+        if handles is None:
+            handles = _RepoHandles.open(
+                Repo(self.repo_path), self._remote_refs, self.backend_name
+            )
+            self._thread_handles.handles = handles
+            with self._opened_handles_lock:
+                self._opened_handles.append((threading.current_thread(), handles))
+        return handles
 
     @property
     def repo(self) -> Repo:
-        return self._repo
+        return self.__current_handles().repo
+
+    @property
+    def backend(self) -> ObjectBackend:
+        return self.__current_handles().backend
 
     @property
     def branches(self) -> BranchHelper:
-        return self._branches
+        return self.__current_handles().branches
 
     @property
     def commits(self) -> CommitHelper:
-        return self._commits
+        return self.__current_handles().commits
 
     @property
     def remotes(self) -> RemoteHelper:
-        return self._remotes
+        return self.__current_handles().remotes
 
     @property
     def files(self) -> FileHelper:
-        return self._files
-    
+        return self.__current_handles().files
+
     @property
     def tags(self) -> TagHelper:
-        return self._tags
-    
+        return self.__current_handles().tags
+
+    @property
+    def trees(self) -> TreeHelper:
+        return self.__current_handles().trees
+
+    @property
+    def staging(self) -> StagingHelper:
+        return self.__current_handles().staging
+
+    @property
+    def patch_ids(self) -> PatchIdHelper:
+        return self.__current_handles().patch_ids
+
+    @property
+    def history(self) -> HistoryShapeHelper:
+        return self.__current_handles().history
+
     @property
     def prs(self) -> PrHelper | NullPrHelper:
         return self._prs
 
+    @property
+    def remote_refs(self) -> RemoteRefsHelper:
+        return self._remote_refs
+
     @staticmethod
     def read_pr_context_from_config(
         repo_path: Optional[str | os.PathLike] = None, 
@@ -2,13 +2,19 @@ from abc import ABC, abstractmethod, abstractproperty
 
 from git import Repo
 
+from git_autograder.backends.object_backend import ObjectBackend
 from git_autograder.helpers.branch_helper import BranchHelper
 from git_autograder.helpers.commit_helper import CommitHelper
 from git_autograder.helpers.file_helper import FileHelper
+from git_autograder.helpers.history_shape_helper import HistoryShapeHelper
+from git_autograder.helpers.patch_id_helper import PatchIdHelper
 from git_autograder.helpers.pr_helper.null_pr_helper import NullPrHelper
 from git_autograder.helpers.pr_helper.pr_helper import PrHelper
 from git_autograder.helpers.remote_helper import RemoteHelper
+from git_autograder.helpers.remote_refs_helper import RemoteRefsHelper
+from git_autograder.helpers.staging_helper import StagingHelper
 from git_autograder.helpers.tag_helper import TagHelper
+from git_autograder.helpers.tree_helper import TreeHelper
 
 
 class GitAutograderRepoBase(ABC):
@@ -16,6 +22,10 @@ class GitAutograderRepoBase(ABC):
     @abstractmethod
     def repo(self) -> Repo: ...
 
+    @property
+    @abstractmethod
+    def backend(self) -> ObjectBackend: ...
+
     @property
     @abstractmethod
     def branches(self) -> BranchHelper: ...
@@ -36,6 +46,26 @@ class GitAutograderRepoBase(ABC):
     @abstractmethod
     def tags(self) -> TagHelper: ...
     
+    @property
+    @abstractmethod
+    def trees(self) -> TreeHelper: ...
+    
+    @property
+    @abstractmethod
+    def staging(self) -> StagingHelper: ...
+
+    @property
+    @abstractmethod
+    def patch_ids(self) -> PatchIdHelper: ...
+
+    @property
+    @abstractmethod
+    def history(self) -> HistoryShapeHelper: ...
+    
     @property
     @abstractmethod 
     def prs(self) -> PrHelper | NullPrHelper: ...
+
+    @property
+    @abstractmethod
+    def remote_refs(self) -> RemoteRefsHelper: ...
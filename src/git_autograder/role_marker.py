@@ -1,4 +1,7 @@
 import re
+import threading
+from collections import OrderedDict
+from typing import Callable, ClassVar, Optional
 
 
 class RoleMarker: 
@@ -6,7 +9,43 @@ class RoleMarker:
     
     PATTERN = re.compile(r"^\[ROLE:([a-zA-Z0-9_-]+)\]\s*", re.IGNORECASE)
 
+    # Commits are immutable, so whether one is from the user is cached by its sha,
+    # evicting the least recently used commits once the cache is full
+    MAX_CACHED_COMMITS: ClassVar[int] = 100_000
+    _user_commits: ClassVar["OrderedDict[str, bool]"] = OrderedDict()
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
     @staticmethod
     def has_role_marker(text: str) -> bool:
         """Check if text contains a role marker."""
-        return RoleMarker.PATTERN.match(text) is not None
\ No newline at end of file
+        return RoleMarker.PATTERN.match(text) is not None
+
+    @staticmethod
+    def is_from_user(text: Optional[str]) -> bool:
+        """Check if text was written by the user, which is assumed when it is empty."""
+        if text:
+            return not RoleMarker.has_role_marker(text)
+        return True
+
+    @staticmethod
+    def is_user_commit(sha: str, read_message: Callable[[], str]) -> bool:
+        """
+        Check if a commit was made by the user, only reading its message the first
+        time the commit is seen.
+        """
+        with RoleMarker._lock:
+            is_from_user = RoleMarker._user_commits.get(sha)
+            if is_from_user is not None:
+                RoleMarker._user_commits.move_to_end(sha)
+        if is_from_user is None:
+            is_from_user = RoleMarker.is_from_user(read_message())
+            RoleMarker.remember_user_commit(sha, is_from_user)
+        return is_from_user
+
+    @staticmethod
+    def remember_user_commit(sha: str, is_from_user: bool) -> None:
+        with RoleMarker._lock:
+            RoleMarker._user_commits[sha] = is_from_user
+            RoleMarker._user_commits.move_to_end(sha)
+            while len(RoleMarker._user_commits) > RoleMarker.MAX_CACHED_COMMITS:
+                RoleMarker._user_commits.popitem(last=False)
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class GitAutograderSearchHit:
+    """Line of a file that matched a search, at a given commit."""
+
+    sha: str
+    path: str
+    line_number: int
+    line: str
@@ -0,0 +1,111 @@
+import json
+import marshal
+from datetime import datetime
+from enum import Enum
+from typing import Any, Tuple, Type
+
+from git_autograder.encoder import Encoder
+
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # pragma: no cover - depends on the installed extras
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+try:
+    import msgpack  # type: ignore[import-untyped, import-not-found, unused-ignore]
+except ImportError:  # pragma: no cover - depends on the installed extras
+    msgpack = None
+
+HAS_ORJSON = orjson is not None
+HAS_MSGPACK = msgpack is not None
+
+# Leading byte of packed data, recording which format was used to pack it
+MSGPACK_FORMAT = b"M"
+MARSHAL_FORMAT = b"R"
+
+
+def _default(o: Any) -> Any:
+    if isinstance(o, datetime):
+        return o.timestamp()
+    raise TypeError(f"Object of type {type(o).__name__} is not serializable")
+
+
+PRIMITIVE_TYPES: Tuple[Type[Any], ...] = (bool, int, float, str, bytes)
+
+
+def _to_primitive(o: Any) -> Any:
+    if o is None or type(o) in PRIMITIVE_TYPES:
+        return o
+    if isinstance(o, Enum):
+        return _to_primitive(o.value)
+    if isinstance(o, datetime):
+        return o.timestamp()
+    for primitive_type in PRIMITIVE_TYPES:
+        # marshal only accepts the exact built-in types, not their subclasses
+        if isinstance(o, primitive_type):
+            return primitive_type(o)
+    if isinstance(o, dict):
+        return {_to_primitive(k): _to_primitive(v) for k, v in o.items()}
+    if isinstance(o, (list, tuple, set, frozenset)):
+        return [_to_primitive(v) for v in o]
+    raise TypeError(f"Object of type {type(o).__name__} is not serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serializes obj to compact UTF-8 JSON, using orjson when it is installed.
+
+    datetimes are written as POSIX timestamps and StrEnums as their values, matching
+    Encoder.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj, default=_default, option=orjson.OPT_PASSTHROUGH_DATETIME
+        )
+    return dumps_str(obj).encode("utf-8")
+
+
+def dumps_str(obj: Any) -> str:
+    """Same as dumps, but returns a str."""
+    if orjson is not None:
+        return dumps(obj).decode("utf-8")
+    return json.dumps(obj, cls=Encoder, separators=(",", ":"), ensure_ascii=False)
+
+
+def loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def pack(obj: Any) -> bytes:
+    """
+    Serializes obj to a compact binary format for internal caches.
+
+    msgpack is used when it is installed, otherwise marshal. obj is normalized first
+    so both accept the same values: datetimes are packed as POSIX timestamps, Enums as
+    their values, and tuples and sets as lists.
+
+    :raises TypeError: when obj contains a value that cannot be packed.
+    """
+    primitive = _to_primitive(obj)
+    if msgpack is not None:
+        return MSGPACK_FORMAT + msgpack.packb(primitive, use_bin_type=True)
+    return MARSHAL_FORMAT + marshal.dumps(primitive)
+
+
+def unpack(data: bytes) -> Any:
+    """
+    Deserializes data produced by pack.
+
+    :raises ValueError: when data was not produced by pack or needs msgpack which is
+        not installed.
+    """
+    header, body = data[:1], data[1:]
+    if header == MSGPACK_FORMAT:
+        if msgpack is None:
+            raise ValueError("msgpack is required to unpack this data")
+        return msgpack.unpackb(body, raw=False)
+    if header == MARSHAL_FORMAT:
+        return marshal.loads(body)
+    raise ValueError(f"Unknown packed data format {header!r}")
@@ -0,0 +1,5 @@
+__all__ = ["ContentStore", "GitAutograderSnapshot", "GitAutograderSnapshotStore"]
+
+from .content_store import ContentStore
+from .snapshot import GitAutograderSnapshot
+from .snapshot_store import GitAutograderSnapshotStore
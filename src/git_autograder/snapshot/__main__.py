@@ -0,0 +1,43 @@
+import argparse
+
+from git_autograder.snapshot.snapshot_store import GitAutograderSnapshotStore
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m git_autograder.snapshot",
+        description="Captures and restores exercise snapshots.",
+    )
+    parser.add_argument("--store", required=True, help="Folder of the snapshot store")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    capture = commands.add_parser("capture", help="Capture exercise folders")
+    capture.add_argument("exercise_paths", nargs="+")
+
+    restore = commands.add_parser("restore", help="Restore a snapshot")
+    restore.add_argument("snapshot_id")
+    restore.add_argument("--target", help="Folder to restore into")
+
+    export = commands.add_parser("export", help="Write snapshots into an archive")
+    export.add_argument("archive_path")
+    export.add_argument("snapshot_ids", nargs="*")
+
+    import_archive = commands.add_parser("import", help="Add snapshots of an archive")
+    import_archive.add_argument("archive_path")
+
+    args = parser.parse_args()
+    store = GitAutograderSnapshotStore(args.store)
+    if args.command == "capture":
+        for exercise_path in args.exercise_paths:
+            print(store.capture(exercise_path))
+    elif args.command == "restore":
+        print(store.restore(args.snapshot_id, args.target))
+    elif args.command == "export":
+        store.export(args.archive_path, args.snapshot_ids or None)
+    else:
+        for snapshot_id in store.import_archive(args.archive_path):
+            print(snapshot_id)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import hashlib
+import os
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Iterator
+
+
+class ContentStore:
+    """
+    Content-addressed store of zlib compressed blobs, keyed by their SHA-256 digest.
+
+    Identical content is only ever stored once, which keeps a corpus of snapshots that
+    share most of their files small.
+
+    :param root: Folder of the store, created if it does not exist.
+    :type root: str | os.PathLike
+    """
+
+    def __init__(self, root: str | os.PathLike) -> None:
+        self.root = Path(root)
+        self.objects_path = self.root / "objects"
+        self.objects_path.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def digest_of(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def path_of(self, digest: str) -> Path:
+        return self.objects_path / digest[:2] / digest[2:]
+
+    def has(self, digest: str) -> bool:
+        return self.path_of(digest).is_file()
+
+    def put(self, data: bytes) -> str:
+        digest = self.digest_of(data)
+        path = self.path_of(digest)
+        if path.is_file():
+            return digest
+
+        path.parent.mkdir(exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(zlib.compress(data))
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """
+        :raises KeyError: when no content is stored under digest.
+        """
+        try:
+            with open(self.path_of(digest), "rb") as f:
+                return zlib.decompress(f.read())
+        except FileNotFoundError:
+            raise KeyError(digest)
+
+    def digests(self) -> Iterator[str]:
+        for folder in sorted(self.objects_path.iterdir()):
+            if not folder.is_dir():
+                continue
+            for path in sorted(folder.iterdir()):
+                if not path.name.startswith("."):
+                    yield folder.name + path.name
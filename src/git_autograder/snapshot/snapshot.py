@@ -0,0 +1,61 @@
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Set, Tuple
+
+
+@dataclass(frozen=True)
+class GitAutograderSnapshot:
+    """
+    Manifest of a captured exercise, referring to its contents by digest.
+
+    :param files: Files of the exercise folder, including the working tree of the
+        repository, mapped to their digest and mode.
+    :param git_files: State files of the repository (HEAD, index, config, reflogs and
+        in-progress operation markers), relative to its .git folder.
+    :param bundle: Digest of a bundle with every ref and the objects reachable from
+        them and their reflogs, None when the repository has no commits.
+    """
+
+    exercise_name: str
+    repo_name: Optional[str]
+    files: Dict[str, Tuple[str, int]] = field(default_factory=dict)
+    git_files: Dict[str, str] = field(default_factory=dict)
+    bundle: Optional[str] = None
+
+    @property
+    def id(self) -> str:
+        """Digest of the manifest, so identical submissions share one snapshot."""
+        return hashlib.sha256(self.to_json().encode("utf-8")).hexdigest()
+
+    @property
+    def digests(self) -> Set[str]:
+        digests = {digest for digest, _ in self.files.values()}
+        digests.update(self.git_files.values())
+        if self.bundle is not None:
+            digests.add(self.bundle)
+        return digests
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "exercise_name": self.exercise_name,
+                "repo_name": self.repo_name,
+                "files": {path: list(entry) for path, entry in self.files.items()},
+                "git_files": self.git_files,
+                "bundle": self.bundle,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+
+    @staticmethod
+    def from_json(raw: str | bytes) -> "GitAutograderSnapshot":
+        data: Dict[str, Any] = json.loads(raw)
+        return GitAutograderSnapshot(
+            exercise_name=data["exercise_name"],
+            repo_name=data["repo_name"],
+            files={path: (entry[0], entry[1]) for path, entry in data["files"].items()},
+            git_files=data["git_files"],
+            bundle=data["bundle"],
+        )
@@ -0,0 +1,235 @@
+import os
+import stat
+import tarfile
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from git import Repo
+
+from git_autograder.exception import GitAutograderInvalidStateException
+from git_autograder.exercise_config_store import ExerciseConfigStore
+from git_autograder.repo.repo import GitAutograderRepo
+from git_autograder.snapshot.content_store import ContentStore
+from git_autograder.snapshot.snapshot import GitAutograderSnapshot
+
+
+class GitAutograderSnapshotStore:
+    """
+    Captures exercises into snapshots and restores them, for replaying real submissions
+    against a grader.
+
+    Snapshot contents are kept in a ContentStore so they are deduplicated across the
+    whole corpus, and manifests are stored by their id under manifests/.
+
+    :param root: Folder of the store, created if it does not exist.
+    :type root: str | os.PathLike
+    """
+
+    # Relative to the repository's .git folder, captured alongside the logs folder
+    GIT_STATE_FILES = [
+        "HEAD",
+        "config",
+        "index",
+        "ORIG_HEAD",
+        "FETCH_HEAD",
+        "MERGE_HEAD",
+        "MERGE_MSG",
+        "MERGE_MODE",
+        "CHERRY_PICK_HEAD",
+        "REVERT_HEAD",
+        "REBASE_HEAD",
+    ]
+
+    def __init__(self, root: str | os.PathLike) -> None:
+        self.root = Path(root)
+        self.manifests_path = self.root / "manifests"
+        self.manifests_path.mkdir(parents=True, exist_ok=True)
+        self.content = ContentStore(self.root)
+
+    def capture(self, exercise_path: str | os.PathLike) -> str:
+        """
+        Captures an exercise folder and returns the id of its snapshot.
+
+        :raises GitAutograderInvalidStateException: when the exercise config is missing.
+        """
+        exercise_path = Path(exercise_path)
+        config_path = exercise_path / ".gitmastery-exercise.json"
+        if not config_path.is_file():
+            raise GitAutograderInvalidStateException(
+                "Missing .gitmastery-exercise.json"
+            )
+        config = ExerciseConfigStore(config_path).config()
+
+        repo_name: Optional[str] = None
+        git_files: Dict[str, str] = {}
+        bundle: Optional[str] = None
+        repo_path = exercise_path / config.exercise_repo.repo_name
+        if (repo_path / ".git").is_dir():
+            repo_name = config.exercise_repo.repo_name
+            repo = GitAutograderRepo(config.exercise_name, repo_path)
+            try:
+                git_files = self.__capture_git_files(repo_path / ".git")
+                bundle = self.__capture_bundle(repo.repo)
+            finally:
+                repo.close()
+
+        snapshot = GitAutograderSnapshot(
+            exercise_name=config.exercise_name,
+            repo_name=repo_name,
+            files=self.__capture_files(exercise_path),
+            git_files=git_files,
+            bundle=bundle,
+        )
+        snapshot_id = snapshot.id
+        manifest_path = self.manifests_path / f"{snapshot_id}.json"
+        if not manifest_path.is_file():
+            manifest_path.write_text(snapshot.to_json())
+        return snapshot_id
+
+    def get(self, snapshot_id: str) -> GitAutograderSnapshot:
+        """
+        :raises KeyError: when no snapshot has the given id.
+        """
+        try:
+            return GitAutograderSnapshot.from_json(
+                (self.manifests_path / f"{snapshot_id}.json").read_bytes()
+            )
+        except FileNotFoundError:
+            raise KeyError(snapshot_id)
+
+    def ids(self) -> List[str]:
+        return sorted(path.stem for path in self.manifests_path.glob("*.json"))
+
+    def restore(
+        self, snapshot_id: str, target: Optional[str | os.PathLike] = None
+    ) -> Path:
+        """
+        Restores a snapshot into target, a new temporary folder by default, and returns
+        the path of the restored exercise.
+        """
+        snapshot = self.get(snapshot_id)
+        target_path = (
+            Path(target)
+            if target is not None
+            else Path(tempfile.mkdtemp(prefix="git-autograder-snapshot-"))
+        )
+        target_path.mkdir(parents=True, exist_ok=True)
+
+        for relative_path, (digest, mode) in snapshot.files.items():
+            self.__restore_file(target_path / relative_path, digest, mode)
+
+        if snapshot.repo_name is not None:
+            repo_path = target_path / snapshot.repo_name
+            repo = Repo.init(repo_path)
+            if snapshot.bundle is not None:
+                self.__restore_bundle(repo, snapshot.bundle)
+            # Written last so the fetch cannot overwrite HEAD, FETCH_HEAD or the logs
+            for relative_path, digest in snapshot.git_files.items():
+                path = repo_path / ".git" / relative_path
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(self.content.get(digest))
+            repo.close()
+
+        return target_path
+
+    def export(
+        self,
+        archive_path: str | os.PathLike,
+        snapshot_ids: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Writes the given snapshots, all of them by default, into a tar archive."""
+        ids = list(snapshot_ids) if snapshot_ids is not None else self.ids()
+        digests = set()
+        with tarfile.open(archive_path, "w") as archive:
+            for snapshot_id in ids:
+                digests.update(self.get(snapshot_id).digests)
+                archive.add(
+                    self.manifests_path / f"{snapshot_id}.json",
+                    arcname=f"manifests/{snapshot_id}.json",
+                )
+            for digest in sorted(digests):
+                archive.add(
+                    self.content.path_of(digest),
+                    arcname=f"objects/{digest[:2]}/{digest[2:]}",
+                )
+
+    def import_archive(self, archive_path: str | os.PathLike) -> List[str]:
+        """Adds the snapshots of a tar archive to the store and returns their ids."""
+        ids = []
+        with tarfile.open(archive_path, "r") as archive:
+            members = []
+            for member in archive.getmembers():
+                if not member.isfile():
+                    continue
+                if member.name.startswith("manifests/"):
+                    ids.append(Path(member.name).stem)
+                elif not member.name.startswith("objects/"):
+                    continue
+                members.append(member)
+            archive.extractall(self.root, members=members, filter="data")
+        return sorted(ids)
+
+    def __capture_files(self, exercise_path: Path) -> Dict[str, Tuple[str, int]]:
+        files: Dict[str, Tuple[str, int]] = {}
+        for folder, dir_names, file_names in os.walk(exercise_path):
+            # Repository state is captured through the bundle and its state files
+            if ".git" in dir_names:
+                dir_names.remove(".git")
+            for name in file_names:
+                path = os.path.join(folder, name)
+                mode = os.lstat(path).st_mode
+                if stat.S_ISLNK(mode):
+                    data = os.fsencode(os.readlink(path))
+                elif stat.S_ISREG(mode):
+                    with open(path, "rb") as f:
+                        data = f.read()
+                else:
+                    continue
+                relative_path = Path(path).relative_to(exercise_path).as_posix()
+                files[relative_path] = (self.content.put(data), mode)
+        return files
+
+    def __capture_git_files(self, git_path: Path) -> Dict[str, str]:
+        git_files: Dict[str, str] = {}
+        paths = [git_path / name for name in self.GIT_STATE_FILES]
+        paths.extend(path for path in (git_path / "logs").rglob("*") if path.is_file())
+        for path in paths:
+            if path.is_file():
+                relative_path = path.relative_to(git_path).as_posix()
+                git_files[relative_path] = self.content.put(path.read_bytes())
+        return git_files
+
+    def __capture_bundle(self, repo: Repo) -> Optional[str]:
+        if not repo.git.for_each_ref("--count=1") and not repo.head.is_valid():
+            return None
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            bundle_path = os.path.join(temp_dir, "repo.bundle")
+            # Objects only reachable from reflogs are kept so reset or amended commits
+            # can still be inspected
+            repo.git.bundle("create", bundle_path, "--all", "--reflog")
+            with open(bundle_path, "rb") as f:
+                return self.content.put(f.read())
+
+    def __restore_file(self, path: Path, digest: str, mode: int) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = self.content.get(digest)
+        if stat.S_ISLNK(mode):
+            os.symlink(os.fsdecode(data), path)
+        else:
+            path.write_bytes(data)
+            os.chmod(path, stat.S_IMODE(mode))
+
+    def __restore_bundle(self, repo: Repo, digest: str) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            bundle_path = os.path.join(temp_dir, "repo.bundle")
+            with open(bundle_path, "wb") as f:
+                f.write(self.content.get(digest))
+
+            refspecs = ["+refs/*:refs/*"]
+            heads = repo.git.bundle("list-heads", bundle_path).splitlines()
+            if any(line.split(" ", 1)[-1] == "HEAD" for line in heads):
+                # Fetches the objects of a detached HEAD that no ref points to
+                refspecs.append("HEAD")
+            repo.git.fetch("--quiet", "--update-head-ok", bundle_path, *refspecs)
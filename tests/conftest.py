@@ -0,0 +1,88 @@
+import json
+from pathlib import Path
+
+import pytest
+from git import Actor, Repo
+
+AUTHOR = Actor("Git Mastery", "git-mastery@example.com")
+
+
+class GitRepos:
+    """
+    Creates repositories for tests under a temporary folder. Repositories start on
+    main and every commit is made by AUTHOR.
+    """
+
+    author = AUTHOR
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def init(self, name: str = "repo", *, bare: bool = False) -> Repo:
+        repo = Repo.init(self.root / name, initial_branch="main", bare=bare)
+        with repo.config_writer() as config:
+            config.set_value("user", "name", AUTHOR.name)
+            config.set_value("user", "email", AUTHOR.email)
+        return repo
+
+    @staticmethod
+    def write(repo: Repo, file_path: str, content: str | bytes) -> Path:
+        path = Path(repo.working_dir) / file_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+        else:
+            path.write_text(content)
+        return path
+
+    @staticmethod
+    def commit(
+        repo: Repo,
+        files: dict[str, str | bytes | None],
+        message: str = "Update",
+        *,
+        timestamp: int | None = None,
+    ) -> str:
+        """Writes the files, removing those set to None, and commits them."""
+        for file_path, content in files.items():
+            if content is None:
+                repo.index.remove([file_path], working_tree=True)
+                continue
+            GitRepos.write(repo, file_path, content)
+            repo.index.add([file_path])
+        date = f"{timestamp} +0000" if timestamp is not None else None
+        return repo.index.commit(
+            message,
+            author=AUTHOR,
+            committer=AUTHOR,
+            author_date=date,
+            commit_date=date,
+        ).hexsha
+
+    def exercise(
+        self, name: str = "exercise", exercise_name: str = "branch-out"
+    ) -> Repo:
+        """
+        Exercise folder with its .gitmastery-exercise.json and a local repo, which
+        has a single commit of file.txt.
+        """
+        path = self.root / name
+        path.mkdir()
+        config = {
+            "exercise_name": exercise_name,
+            "tags": [],
+            "requires_git": True,
+            "requires_github": False,
+            "base_files": {},
+            "exercise_repo": {"repo_type": "local", "repo_name": "repo"},
+            "downloaded_at": None,
+        }
+        (path / ".gitmastery-exercise.json").write_text(json.dumps(config))
+        repo = self.init(f"{name}/repo")
+        self.commit(repo, {"file.txt": "hello"}, "Initial commit")
+        return repo
+
+
+@pytest.fixture
+def git_repos(tmp_path: Path) -> GitRepos:
+    return GitRepos(tmp_path)
@@ -0,0 +1,115 @@
+import os
+
+import pytest
+
+from git_autograder.answers.answers import GitAutograderAnswers
+from git_autograder.answers.answers_batch import GitAutograderAnswersBatch
+from git_autograder.answers.rules import (
+    ContainsListRule,
+    HasExactListRule,
+    HasExactValueRule,
+    NotEmptyRule,
+)
+from git_autograder.exception import (
+    GitAutograderInvalidStateException,
+    GitAutograderWrongAnswerException,
+)
+
+
+def make_answers(*qna: tuple[str, str]) -> GitAutograderAnswers:
+    return GitAutograderAnswers(
+        questions=[q for q, _ in qna], answers=[a for _, a in qna], validations={}
+    )
+
+
+def test_validate_without_plan():
+    answers = make_answers(("Hello", "World"), ("List", "- a\n- b"))
+    answers.add_validation("Hello", NotEmptyRule(), HasExactValueRule("World"))
+    answers.add_validation("List", HasExactListRule(["b", "a"]))
+    answers.validate()
+
+
+def test_validate_reports_first_failure_per_question():
+    answers = make_answers(("Hello", ""), ("List", "- a\n- c"))
+    answers.add_validation("Hello", NotEmptyRule(), HasExactValueRule("World"))
+    answers.add_validation("List", ContainsListRule(["a", "b"]))
+    with pytest.raises(GitAutograderWrongAnswerException) as e:
+        answers.validate()
+    assert e.value.message == [
+        NotEmptyRule.EMPTY.format(question="Hello"),
+        ContainsListRule.INVALID_ITEM.format(question="List"),
+    ]
+
+
+def test_compiled_plan_is_reused_across_answers():
+    definition = make_answers()
+    definition.add_validation("Order", HasExactListRule(["A", "B"], ordered=True))
+    plan = definition.compile_validations()
+
+    make_answers(("Order", "- A\n- B")).validate(plan)
+    with pytest.raises(GitAutograderWrongAnswerException):
+        make_answers(("Order", "- B\n- A")).validate(plan)
+
+
+def test_compiled_plan_missing_question():
+    definition = make_answers()
+    definition.add_validation("Missing", NotEmptyRule())
+    plan = definition.compile_validations()
+    with pytest.raises(GitAutograderInvalidStateException):
+        make_answers(("Hello", "World")).validate(plan)
+
+
+def test_recompile_after_changing_values():
+    rule = HasExactValueRule("World")
+    rule.value = "There"
+    answers = make_answers(("Hello", "There"))
+    answers.add_validation("Hello", rule)
+    answers.validate(answers.compile_validations())
+
+
+def test_validate_without_plan_reads_current_values():
+    rule = ContainsListRule(["a"])
+    answers = make_answers(("List", "- b"))
+    answers.add_validation("List", rule)
+    plan = answers.compile_validations()
+    rule.values = ["a", "b"]
+
+    answers.validate()
+    with pytest.raises(GitAutograderWrongAnswerException):
+        answers.validate(plan)
+
+
+def test_batch_validation(tmp_path):
+    definition = make_answers()
+    definition.add_validation("Hello", HasExactValueRule("World"))
+    definition.add_validation("Bye", NotEmptyRule())
+    plan = definition.compile_validations()
+
+    contents = {
+        "a.txt": "Q: Hello\nA: World\nQ: Bye\nA: Now",
+        "b.txt": "Q: Hello\nA: World\nQ: Bye\nA: Later",
+        "c.txt": "Q: Hello\nA: There\nQ: Bye\nA: Now",
+        "d.txt": "Q: Hello\nA: World",
+        "e.txt": "Q: Hello",
+    }
+    paths = []
+    for name, content in contents.items():
+        (tmp_path / name).write_text(content)
+        paths.append(str(tmp_path / name))
+    paths.append(str(tmp_path / "missing.txt"))
+
+    for max_workers in (1, 2):
+        result = GitAutograderAnswersBatch(plan, max_workers=max_workers).validate(
+            paths
+        )
+        errors = {os.path.basename(p): e for p, e in result.errors.items()}
+        assert errors["a.txt"] == []
+        assert errors["b.txt"] == []
+        assert errors["c.txt"] == [HasExactValueRule.NOT_EXACT.format(question="Hello")]
+        assert errors["d.txt"] == [
+            GitAutograderAnswers.MISSING_QUESTION.format(question="Bye")
+        ]
+        assert len(errors["e.txt"]) == 1
+        assert errors["missing.txt"] == ["Missing answers.txt file from repository."]
+        assert result.answer_frequencies["Hello"] == {"World": 3, "There": 1}
+        assert result.answer_frequencies["Bye"] == {"Now": 2, "Later": 1}
@@ -0,0 +1,195 @@
+import importlib.util
+import subprocess
+from typing import TYPE_CHECKING
+
+import pytest
+from git import Repo
+
+from git_autograder.backends import (
+    BACKEND_ENV_VAR,
+    GitPythonObjectBackend,
+    open_backend,
+)
+from git_autograder.branch import GitAutograderBranch
+from git_autograder.diff import GitAutograderDiffHelper
+from git_autograder.helpers.tree_helper import TreeHelper
+from git_autograder.repo.repo import GitAutograderRepo
+
+if TYPE_CHECKING:
+    from conftest import GitRepos
+
+requires_pygit2 = pytest.mark.skipif(
+    importlib.util.find_spec("pygit2") is None, reason="pygit2 is not installed"
+)
+
+
+def make_repo(git_repos: "GitRepos") -> Repo:
+    repo = git_repos.init()
+    git_repos.commit(repo, {"a.txt": "a"}, timestamp=1_700_000_000)
+    git_repos.commit(repo, {"docs/b.txt": "b"}, timestamp=1_700_000_100)
+    repo.git.checkout("-b", "feature")
+    git_repos.commit(repo, {"c.txt": "c"}, timestamp=1_700_000_200)
+    repo.git.checkout("main")
+    git_repos.commit(repo, {"a.txt": "a2"}, timestamp=1_700_000_300)
+    repo.git.merge("feature", "--no-edit")
+    repo.git.reset("--hard", "HEAD~1")
+    repo.git.merge("feature", "--no-edit")
+    return repo
+
+
+@requires_pygit2
+def test_backends_agree(git_repos):
+    repo = make_repo(git_repos)
+    gitpython = GitPythonObjectBackend(repo)
+    pygit2 = open_backend(repo, "pygit2")
+    head = gitpython.head_sha()
+    assert head is not None
+    commits = list(gitpython.walk(head))
+
+    assert pygit2.head_sha() == head
+    assert list(pygit2.walk(head)) == commits
+    assert pygit2.branch_names() == gitpython.branch_names() == ["feature", "main"]
+    for rev in ["main", "feature", "HEAD~1", "HEAD^2", "missing"]:
+        assert pygit2.resolve(rev) == gitpython.resolve(rev)
+    assert len(gitpython.reflog("HEAD")) > 5
+    for ref in ["HEAD", "main", "feature", "missing"]:
+        assert pygit2.reflog(ref) == gitpython.reflog(ref)
+    for sha in commits:
+        assert pygit2.commit(sha) == gitpython.commit(sha)
+        assert pygit2.branches_containing(sha) == gitpython.branches_containing(sha)
+        assert pygit2.is_ancestor(commits[-1], sha) == gitpython.is_ancestor(
+            commits[-1], sha
+        )
+        for file_path in ["a.txt", "docs/b.txt", "docs", "missing.txt"]:
+            assert pygit2.read_blob(sha, file_path) == gitpython.read_blob(
+                sha, file_path
+            )
+    assert pygit2.changed_paths(commits[-1], head) == gitpython.changed_paths(
+        commits[-1], head
+    )
+    assert gitpython.changed_paths(commits[-1], head) == {
+        "a.txt": "M",
+        "c.txt": "A",
+        "docs/b.txt": "A",
+    }
+    pygit2.close()
+
+
+@pytest.mark.parametrize(
+    "backend", ["gitpython", pytest.param("pygit2", marks=requires_pygit2)]
+)
+def test_grading_results_match_without_backend(git_repos, backend):
+    repo = make_repo(git_repos)
+    autograder_repo = GitAutograderRepo("exercise", repo.working_dir, backend=backend)
+    assert autograder_repo.backend.name == backend
+
+    root = list(repo.iter_commits())[-1]
+    # A detached HEAD is listed by git branch --contains as well
+    repo.git.checkout("HEAD~1")
+    for head in repo.heads:
+        expected = GitAutograderBranch(head)
+        branch = autograder_repo.branches.branch(head.name)
+        assert branch.reflog == expected.reflog
+        assert [c.hexsha for c in branch.commits] == [
+            c.hexsha for c in expected.commits
+        ]
+        for branch_commit, expected_commit in zip(branch.commits, expected.commits):
+            assert branch_commit.branches == expected_commit.branches
+            assert branch_commit.is_child(root) == expected_commit.is_child(root)
+            for file_path in ["a.txt", "docs/b.txt", "docs", "missing.txt"]:
+                with branch_commit.file(file_path) as content:
+                    with expected_commit.file(file_path) as expected_content:
+                        assert content == expected_content
+    assert any(
+        "HEAD detached" in name
+        for name in autograder_repo.commits.commit("HEAD").branches
+    )
+
+    repo.git.checkout("main")
+    before = autograder_repo.commits.commit("main")
+    repo.git.mv("docs/b.txt", "docs/renamed.txt")
+    git_repos.commit(repo, {}, "Rename b")
+    after = autograder_repo.commits.commit("main")
+    # Renames from outside of the file are found through the backend too
+    file_diff = GitAutograderDiffHelper.get_file_diff(before, after, "docs/renamed.txt")
+    assert file_diff is not None and file_diff[1] == "R"
+    assert (
+        GitAutograderDiffHelper.get_file_diff(
+            before.commit, after.commit, "docs/renamed.txt"
+        )
+        == file_diff
+    )
+    tree_files = autograder_repo.trees.files("main~1")
+    assert tree_files == TreeHelper(repo).files("main~1")
+    autograder_repo.close()
+
+
+def test_pygit2_is_opt_in(git_repos, monkeypatch):
+    repo = make_repo(git_repos)
+    monkeypatch.delenv(BACKEND_ENV_VAR, raising=False)
+    assert open_backend(repo).name == "gitpython"
+    auto = open_backend(repo, "auto")
+    expected = (
+        "pygit2" if importlib.util.find_spec("pygit2") is not None else "gitpython"
+    )
+    assert auto.name == expected
+    auto.close()
+
+
+def test_unknown_backend(git_repos):
+    repo = make_repo(git_repos)
+    with pytest.raises(ValueError):
+        open_backend(repo, "libgit3")
+
+
+@requires_pygit2
+def test_walk_matches_rev_list_with_clock_skew(git_repos):
+    repo = git_repos.init()
+    a = git_repos.commit(repo, {"a.txt": "a"}, timestamp=1_700_000_000)
+    repo.git.checkout("-b", "feature")
+    e = git_repos.commit(repo, {"e.txt": "e"}, timestamp=1_700_000_500)
+    # Committed with a clock behind its parents'
+    b = git_repos.commit(repo, {"b.txt": "b"}, timestamp=1_699_000_000)
+    repo.git.checkout("main")
+    git_repos.commit(repo, {"c.txt": "c"}, timestamp=1_700_000_100)
+    git_repos.commit(repo, {"d.txt": "d"}, timestamp=1_700_000_900)
+    repo.git.merge("feature", "--no-edit")
+    head = repo.head.commit.hexsha
+    expected = repo.git.rev_list("--date-order", head).splitlines()
+    assert expected[0] == head
+    assert expected.index(b) < expected.index(e) < expected.index(a)
+
+    pygit2 = open_backend(repo, "pygit2")
+    assert list(pygit2.walk(head)) == expected
+    assert list(GitPythonObjectBackend(repo).walk(head)) == expected
+    pygit2.close()
+    branch = GitAutograderBranch(repo.heads["main"])
+    assert [c.hexsha for c in branch.commits] == expected
+
+
+@requires_pygit2
+def test_reflog_abbreviations_grow_with_the_repository(git_repos):
+    repo = make_repo(git_repos)
+    # Git lengthens abbreviations from 7 characters once 2^14 objects are packed
+    blobs = b"".join(
+        b"blob\ndata %d\n%s\n" % (len(data), data)
+        for data in (b"blob %d" % i for i in range(17_000))
+    )
+    subprocess.run(
+        ["git", "fast-import", "--quiet"],
+        cwd=repo.working_dir,
+        input=blobs,
+        check=True,
+    )
+    gitpython = GitPythonObjectBackend(repo)
+    pygit2 = open_backend(repo, "pygit2")
+    reflog = gitpython.reflog("HEAD")
+    assert len(reflog[0].short_sha) == 8
+    assert pygit2.reflog("HEAD") == reflog
+    pygit2.close()
+
+    repo.git.config("core.abbrev", "12")
+    pygit2 = open_backend(repo, "pygit2")
+    assert pygit2.reflog("main") == gitpython.reflog("main")
+    assert len(pygit2.reflog("main")[0].short_sha) == 12
+    pygit2.close()
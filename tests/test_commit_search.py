@@ -0,0 +1,50 @@
+from typing import TYPE_CHECKING
+
+from git import Repo
+
+from git_autograder.helpers.commit_helper import CommitHelper
+from git_autograder.search_hit import GitAutograderSearchHit
+
+if TYPE_CHECKING:
+    from conftest import GitRepos
+
+
+def make_repo(git_repos: "GitRepos") -> tuple[Repo, list[str]]:
+    repo = git_repos.init()
+    shas = [
+        git_repos.commit(
+            repo, {"notes.txt": "todo: write\nplain\n", "data.bin": b"\x00todo"}
+        ),
+        git_repos.commit(repo, {"docs/a:b.md": "TODO later\n", "notes.txt": "done\n"}),
+    ]
+    return repo, shas
+
+
+def test_search_many_commits(git_repos):
+    repo, shas = make_repo(git_repos)
+    commits = CommitHelper(repo)
+
+    assert commits.search("todo", shas) == [
+        GitAutograderSearchHit(shas[0], "notes.txt", 1, "todo: write")
+    ]
+    assert commits.search("todo", [commits.commit(shas[1])], ignore_case=True) == [
+        GitAutograderSearchHit(shas[1], "docs/a:b.md", 1, "TODO later")
+    ]
+    assert commits.search(r"^(plain|done)$", shas, regex=True) == [
+        GitAutograderSearchHit(shas[0], "notes.txt", 2, "plain"),
+        GitAutograderSearchHit(shas[1], "notes.txt", 1, "done"),
+    ]
+    assert commits.search("todo", shas, paths=["docs"], ignore_case=True) == [
+        GitAutograderSearchHit(shas[1], "docs/a:b.md", 1, "TODO later")
+    ]
+    assert commits.search("todo", []) == []
+
+
+def test_contains(git_repos, monkeypatch):
+    repo, shas = make_repo(git_repos)
+    commits = CommitHelper(repo)
+    monkeypatch.setattr(CommitHelper, "GREP_BATCH_SIZE", 1)
+
+    assert commits.contains("done", ["HEAD~1", "HEAD"])
+    assert not commits.contains("missing", shas)
+    assert not commits.contains("done", shas, paths=["docs"])
@@ -0,0 +1,166 @@
+import json
+import socket
+import tempfile
+import threading
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+from git import Repo
+
+from git_autograder.daemon import (
+    ExerciseCache,
+    GitAutograderClient,
+    GitAutograderServer,
+)
+from git_autograder.exception import GitAutograderInvalidStateException
+from git_autograder.exercise import GitAutograderExercise
+from git_autograder.output import GitAutograderOutput
+from git_autograder.status import GitAutograderStatus
+
+
+def grade(exercise: GitAutograderExercise) -> GitAutograderOutput:
+    branch = exercise.repo.branches.branch("main")
+    if len(branch.commits) < 2:
+        raise exercise.wrong_answer(["Make another commit"])
+    return exercise.to_output(["Great work!"], GitAutograderStatus.SUCCESSFUL)
+
+
+@pytest.fixture
+def socket_path() -> Iterator[Path]:
+    # Unix socket paths are limited to around 100 bytes, too short for tmp_path
+    with tempfile.TemporaryDirectory() as directory:
+        yield Path(directory) / "grader.sock"
+
+
+def test_invalid_requests_get_error_replies(tmp_path):
+    server = GitAutograderServer(grade, tmp_path / "grader.sock")
+    try:
+        for line in [b"not json", b"{}", b"[]"]:
+            assert json.loads(server.handle_request(line)) == {
+                "error": "Invalid request."
+            }
+    finally:
+        server._server.server_close()
+
+
+def test_cache_reuses_exercises_until_the_repo_changes(git_repos, tmp_path):
+    repo = git_repos.exercise()
+    cache = ExerciseCache()
+
+    exercise = cache.get(tmp_path / "exercise")
+    assert cache.get(tmp_path / "exercise" / ".." / "exercise") is exercise
+    git_repos.commit(repo, {"file.txt": "changed"}, "Second commit")
+    rebuilt = cache.get(tmp_path / "exercise")
+    assert rebuilt is not exercise
+    assert cache.get(tmp_path / "exercise") is rebuilt
+    cache.invalidate(tmp_path / "exercise")
+    assert cache.get(tmp_path / "exercise") is not rebuilt
+
+
+def test_run_reports_failures(git_repos, tmp_path):
+    git_repos.exercise()
+    server = GitAutograderServer(grade, tmp_path / "grader.sock")
+    try:
+        output = server.run(tmp_path / "exercise")
+        assert output.status == GitAutograderStatus.UNSUCCESSFUL
+        assert output.comments == ["Make another commit"]
+        assert output.exercise_name == "branch-out"
+
+        missing = server.run(tmp_path / "missing")
+        assert missing.status == GitAutograderStatus.ERROR
+        assert missing.comments == ["Missing .gitmastery-exercise.json"]
+
+        def crash(exercise: GitAutograderExercise) -> GitAutograderOutput:
+            raise RuntimeError("boom")
+
+        warm = server.cache.get(tmp_path / "exercise")
+        server.grade = crash
+        crashed = server.run(tmp_path / "exercise")
+        assert crashed.status == GitAutograderStatus.ERROR
+        assert crashed.comments is not None and "boom" in crashed.comments[0]
+        # The exercise may be in a bad state after an unexpected error
+        assert server.cache.get(tmp_path / "exercise") is not warm
+    finally:
+        server._server.server_close()
+
+
+def test_remote_refs_are_fetched_again_for_every_request(git_repos, tmp_path):
+    repo = git_repos.exercise()
+    git_repos.init("remote.git", bare=True)
+    repo.create_remote("origin", str(tmp_path / "remote.git"))
+    repo.git.push("origin", "main")
+    other = Repo.clone_from(tmp_path / "remote.git", tmp_path / "other")
+
+    seen: List[List[str]] = []
+
+    def grade_remote(exercise: GitAutograderExercise) -> GitAutograderOutput:
+        seen.append(exercise.repo.remote_refs.snapshot("origin").head_names)
+        return exercise.to_output([], GitAutograderStatus.SUCCESSFUL)
+
+    server = GitAutograderServer(grade_remote, tmp_path / "grader.sock")
+    try:
+        server.run(tmp_path / "exercise")
+        warm = server.cache.get(tmp_path / "exercise")
+        # Pushed from another clone, so the exercise repository is untouched
+        other.git.push("origin", "main:feature")
+        server.run(tmp_path / "exercise")
+        assert server.cache.get(tmp_path / "exercise") is warm
+    finally:
+        server._server.server_close()
+
+    assert seen == [["main"], ["feature", "main"]]
+
+
+def test_client_and_server_round_trip(git_repos, tmp_path, socket_path):
+    repo = git_repos.exercise()
+    server = GitAutograderServer(grade, socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with GitAutograderClient(socket_path, timeout=10) as client:
+            output = client.grade(tmp_path / "exercise")
+            assert output.status == GitAutograderStatus.UNSUCCESSFUL
+            assert output.comments == ["Make another commit"]
+            assert output.exercise_name == "branch-out"
+            assert output.started_at is not None and output.completed_at is not None
+
+            git_repos.commit(repo, {"file.txt": "changed"}, "Second commit")
+            # The same connection serves several requests
+            output = client.grade(tmp_path / "exercise")
+            assert output.status == GitAutograderStatus.SUCCESSFUL
+            assert output.comments == ["Great work!"]
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(10)
+            conn.connect(str(socket_path))
+            conn.sendall(b'{"path": "nowhere"}\n')
+            assert json.loads(conn.makefile("rb").readline()) == {
+                "error": "Invalid request."
+            }
+    finally:
+        server.shutdown()
+        thread.join(10)
+    assert not socket_path.exists()
+
+
+def test_client_raises_error_replies(socket_path):
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(socket_path))
+    listener.listen(1)
+
+    def reply() -> None:
+        conn, _ = listener.accept()
+        with conn:
+            conn.makefile("rb").readline()
+            conn.sendall(b'{"error": "Invalid request."}\n')
+
+    thread = threading.Thread(target=reply, daemon=True)
+    thread.start()
+    try:
+        with GitAutograderClient(socket_path, timeout=10) as client:
+            with pytest.raises(GitAutograderInvalidStateException):
+                client.grade("exercise")
+    finally:
+        thread.join(10)
+        listener.close()
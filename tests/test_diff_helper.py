@@ -0,0 +1,109 @@
+from typing import TYPE_CHECKING
+
+from git_autograder.branch import GitAutograderBranch
+from git_autograder.diff import GitAutograderDiffHelper
+
+if TYPE_CHECKING:
+    from conftest import GitRepos
+
+
+def make_branch(git_repos: "GitRepos") -> GitAutograderBranch:
+    repo = git_repos.init()
+    start = git_repos.commit(
+        repo,
+        {
+            "a[1].txt": "bracket",
+            "a1.txt": "one",
+            "docs/guide.md": "guide",
+            "docs/deep/notes.md": "notes",
+            "old.txt": "a file long enough to be detected as renamed\n" * 5,
+        },
+    )
+    repo.create_tag(f"git-mastery-start-{start[:7]}", ref=start)
+    git_repos.commit(repo, {"a1.txt": "one!", "docs/deep/notes.md": "more notes"})
+    git_repos.commit(
+        repo,
+        {
+            "src/new.py": "print()",
+            "old.txt": None,
+            "renamed.txt": "a file long enough to be detected as renamed\n" * 5,
+        },
+    )
+    return GitAutograderBranch(repo.heads.main)
+
+
+def changed_paths(diff_helper: GitAutograderDiffHelper) -> set[str]:
+    return {
+        path
+        for diff in diff_helper.diff_index
+        if (path := diff.b_path or diff.a_path) is not None
+    }
+
+
+def test_to_pathspecs():
+    assert GitAutograderDiffHelper.to_pathspecs() is None
+    assert GitAutograderDiffHelper.to_pathspecs(["a.txt"]) == ("a.txt",)
+    assert GitAutograderDiffHelper.to_pathspecs(["a.txt"], ["**/*.md"]) == (
+        "a.txt",
+        ":(glob)**/*.md",
+    )
+    assert GitAutograderDiffHelper.to_pathspecs(globs=[]) == ()
+
+
+def test_literal_pathspecs_ignore_wildcards(git_repos):
+    branch = make_branch(git_repos)
+    literal = GitAutograderDiffHelper.literal_pathspec("a[1].txt")
+
+    assert changed_paths(branch.user_diff(pathspecs=["a[1].txt"])) == {"a1.txt"}
+    assert changed_paths(branch.user_diff(pathspecs=[literal])) == set()
+    assert not branch.has_edited_file("a[1].txt")
+    assert branch.has_edited_file("a1.txt")
+
+
+def test_globs(git_repos):
+    branch = make_branch(git_repos)
+
+    assert changed_paths(branch.user_diff(globs=["docs/**/*.md"])) == {
+        "docs/deep/notes.md"
+    }
+    assert changed_paths(branch.user_diff(globs=["*.py"])) == set()
+    assert changed_paths(branch.user_diff(globs=["**/*.py", "*.txt"])) == {
+        "src/new.py",
+        "a1.txt",
+        "renamed.txt",
+    }
+
+
+def test_renames_are_not_added_files(git_repos):
+    branch = make_branch(git_repos)
+
+    # Restricted to the new path, the rename looks like an added file
+    restricted = branch.user_diff(
+        pathspecs=[GitAutograderDiffHelper.literal_pathspec("renamed.txt")]
+    )
+    assert restricted.has_path_change("A", "renamed.txt")
+    assert branch.user_diff().has_path_change("R", "renamed.txt")
+    assert not branch.has_added_file("renamed.txt")
+    assert branch.has_added_file("src/new.py")
+    assert not branch.has_added_file("a1.txt")
+
+    # Only the file and the deleted files it may have been renamed from are diffed
+    for_file = GitAutograderDiffHelper.for_file(
+        branch.start_commit, branch.latest_commit, "renamed.txt"
+    )
+    assert [(d.a_path, d.b_path) for d in for_file.diff_index] == [
+        ("old.txt", "renamed.txt")
+    ]
+    for_new_file = GitAutograderDiffHelper.for_file(
+        branch.start_commit, branch.latest_commit, "src/new.py"
+    )
+    assert changed_paths(for_new_file) == {"src/new.py", "old.txt"}
+    assert for_new_file.has_path_change("A", "src/new.py")
+
+    file_diff = GitAutograderDiffHelper.get_file_diff(
+        branch.start_commit, branch.latest_commit, "renamed.txt"
+    )
+    assert file_diff is not None
+    change, change_type = file_diff
+    assert change_type == "R"
+    assert change.original_file_path == "old.txt"
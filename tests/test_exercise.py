@@ -0,0 +1,61 @@
+from git_autograder.exercise import GitAutograderExercise
+from git_autograder.output_sinks import MemoryOutputSink
+from git_autograder.repo.repo import GitAutograderRepo
+from git_autograder.status import GitAutograderStatus
+
+
+def test_concurrent_checks_close_their_handles(git_repos, tmp_path):
+    git_repos.exercise()
+    exercise = GitAutograderExercise(tmp_path / "exercise")
+    assert isinstance(exercise.repo, GitAutograderRepo)
+
+    def check(exercise: GitAutograderExercise) -> list[str]:
+        exercise.repo.branches.branch("main").latest_commit
+        return []
+
+    for _ in range(5):
+        output = exercise.run_checks_concurrently([check] * 8, max_workers=4)
+        assert output.status == GitAutograderStatus.SUCCESSFUL
+        assert exercise.repo.opened_handles_count == 0
+    exercise.repo.close()
+
+
+def test_concurrent_checks_inside_a_config_batch(git_repos, tmp_path):
+    git_repos.exercise()
+    exercise = GitAutograderExercise(tmp_path / "exercise")
+
+    def check(exercise: GitAutograderExercise) -> list[str]:
+        exercise_name = exercise.read_config("exercise_name")
+        assert exercise_name is not None
+        return [exercise_name]
+
+    with exercise.config_store.batch():
+        exercise.write_config("exercise_name", "branch-bender")
+        output = exercise.run_checks_concurrently([check] * 4, max_workers=4)
+    assert output.comments == ["branch-bender"] * 4
+    exercise.repo.close()
+
+
+def test_outputs_go_to_the_exercise_sink(git_repos, tmp_path):
+    git_repos.exercise()
+    sink = MemoryOutputSink()
+    exercise = GitAutograderExercise(tmp_path / "exercise", output_sink=sink)
+
+    def passing(exercise: GitAutograderExercise) -> list[str]:
+        return ["Branch created"]
+
+    def failing(exercise: GitAutograderExercise) -> list[str]:
+        raise exercise.wrong_answer(["Missing commit"])
+
+    exercise.emit_comment("Checking branches")
+    output = exercise.run_checks_concurrently([passing, failing])
+    output.save()
+
+    assert sink.comments == [
+        ("branch-out", "Checking branches"),
+        ("branch-out", "Branch created"),
+        ("branch-out", "Missing commit"),
+    ]
+    assert sink.outputs == [output]
+    assert output.status == GitAutograderStatus.UNSUCCESSFUL
+    exercise.repo.close()
@@ -0,0 +1,74 @@
+import json
+import os
+import threading
+from pathlib import Path
+
+from git_autograder.exercise_config_store import ExerciseConfigStore
+
+CONFIG = {
+    "exercise_name": "branch-out",
+    "tags": [],
+    "requires_git": True,
+    "requires_github": False,
+    "base_files": {},
+    "exercise_repo": {"repo_type": "ignore", "repo_name": "repo"},
+    "downloaded_at": None,
+}
+
+
+def make_config(tmp_path: Path) -> Path:
+    path = tmp_path / ".gitmastery-exercise.json"
+    path.write_text(json.dumps(CONFIG))
+    os.chmod(path, 0o640)
+    return path
+
+
+def test_config_is_cached_until_the_file_changes(tmp_path):
+    path = make_config(tmp_path)
+    store = ExerciseConfigStore(path)
+    config = store.config()
+    assert config.exercise_name == "branch-out"
+    assert store.config() is config
+
+    path.write_text(json.dumps({**CONFIG, "exercise_name": "branch-bender"}))
+    assert store.config() is not config
+    assert store.config().exercise_name == "branch-bender"
+
+
+def test_writes_replace_the_file_atomically(tmp_path):
+    path = make_config(tmp_path)
+    store = ExerciseConfigStore(path)
+    store.write("exercise_name", "branch-bender")
+
+    assert json.loads(path.read_text())["exercise_name"] == "branch-bender"
+    assert store.config().exercise_name == "branch-bender"
+    assert os.stat(path).st_mode & 0o777 == 0o640
+    assert os.listdir(tmp_path) == [path.name]
+
+
+def test_reads_are_copies(tmp_path):
+    store = ExerciseConfigStore(make_config(tmp_path))
+    store.read("tags").append("changed")
+    assert store.read("tags") == []
+
+
+def test_batch_flushes_once_without_blocking_readers(tmp_path):
+    path = make_config(tmp_path)
+    store = ExerciseConfigStore(path)
+    names = []
+    with store.batch():
+        store.write("exercise_name", "branch-bender")
+        with store.batch():
+            store.write("tags", ["a"])
+        assert json.loads(path.read_text()) == CONFIG
+
+        reader = threading.Thread(target=lambda: names.append(store.read("tags")))
+        reader.start()
+        reader.join(timeout=5)
+        assert not reader.is_alive()
+    assert names == [["a"]]
+    assert json.loads(path.read_text()) == {
+        **CONFIG,
+        "exercise_name": "branch-bender",
+        "tags": ["a"],
+    }
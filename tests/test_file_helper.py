@@ -0,0 +1,145 @@
+import os
+from typing import TYPE_CHECKING
+
+from git import Repo
+
+from git_autograder.helpers.file_helper import FileHelper
+
+if TYPE_CHECKING:
+    from conftest import GitRepos
+
+
+def make_repo(git_repos: "GitRepos") -> Repo:
+    repo = git_repos.init()
+    git_repos.commit(
+        repo, {"notes/todo.txt": "buy milk\n", "README.md": "hello\n"}, "Initial commit"
+    )
+    return repo
+
+
+def test_blob_sha_matches_git(git_repos):
+    repo = make_repo(git_repos)
+    files = FileHelper(repo)
+
+    assert files.blob_sha("notes/todo.txt") == repo.git.hash_object("notes/todo.txt")
+    assert files.blob_sha("missing.txt") is None
+    assert files.blob_sha("notes") is None
+    assert files.blob_shas(["README.md", "./notes/todo.txt"]).keys() == {
+        "README.md",
+        "notes/todo.txt",
+    }
+
+
+def test_is_unchanged_since(git_repos, tmp_path):
+    repo = make_repo(git_repos)
+    files = FileHelper(repo)
+    head = repo.head.commit
+
+    assert files.is_unchanged_since("README.md", head)
+    assert files.is_unchanged_since("notes/todo.txt", head.hexsha)
+    (tmp_path / "repo" / "README.md").write_text("changed\n")
+    assert not files.is_unchanged_since("README.md", head)
+    (tmp_path / "repo" / "new.txt").write_text("new\n")
+    assert not files.is_unchanged_since("new.txt", head)
+
+
+def test_hashes_are_cached_on_stat_data(git_repos, tmp_path):
+    repo = make_repo(git_repos)
+    files = FileHelper(repo)
+    path = tmp_path / "repo" / "README.md"
+    os.utime(path, ns=(1_600_000_000_000_000_000, 1_600_000_000_000_000_000))
+
+    sha = files.blob_sha("README.md")
+    assert files._blob_shas["README.md"][1] == sha
+    path.write_text("changed\n")
+    assert files.blob_sha("README.md") == FileHelper.hash_blob(b"changed\n")
+
+
+def test_matches_content(git_repos):
+    repo = make_repo(git_repos)
+    files = FileHelper(repo)
+
+    assert files.matches_content("README.md", "hello\n")
+    assert not files.matches_content("README.md", "hello")
+    assert not files.matches_content("missing.txt", "hello\n")
+
+
+def test_filtered_repos_hash_through_git(git_repos, tmp_path):
+    repo = make_repo(git_repos)
+    (tmp_path / "repo" / ".gitattributes").write_text("*.txt text eol=crlf\n")
+    (tmp_path / "repo" / "crlf.txt").write_bytes(b"one\r\ntwo\r\n")
+    files = FileHelper(repo)
+
+    assert files.blob_sha("crlf.txt") == repo.git.hash_object("crlf.txt")
+    assert files.blob_sha("crlf.txt") == FileHelper.hash_blob(b"one\ntwo\n")
+    assert files.matches_content("crlf.txt", b"one\r\ntwo\r\n")
+
+
+def test_attributes_anywhere_hash_through_git(git_repos, tmp_path):
+    repo = make_repo(git_repos)
+    git_repos.commit(repo, {"notes/.gitattributes": "*.txt text\n"}, "Add attributes")
+    files = FileHelper(repo)
+
+    assert files.is_unchanged_since("notes/todo.txt", "HEAD")
+    (tmp_path / "repo" / "notes" / "todo.txt").write_bytes(b"buy milk\r\n")
+    assert files.is_unchanged_since("notes/todo.txt", "HEAD")
+    assert files.matches_content("notes/todo.txt", b"buy milk\r\n")
+
+    (tmp_path / "attributes").write_text("*.md text\n")
+    repo.git.config("core.attributesFile", str(tmp_path / "attributes"))
+    (tmp_path / "repo" / "README.md").write_bytes(b"hello\r\n")
+    assert FileHelper(repo).is_unchanged_since("README.md", "HEAD")
+
+
+def test_symlinks_hash_their_target_path(git_repos, tmp_path):
+    repo = make_repo(git_repos)
+    (tmp_path / "repo" / ".gitattributes").write_text("* text=auto\n")
+    os.symlink("notes/todo.txt", tmp_path / "repo" / "link")
+    repo.index.add([".gitattributes", "link"])
+    git_repos.commit(repo, {}, "Add link")
+    files = FileHelper(repo)
+
+    assert files.blob_sha("link") == FileHelper.hash_blob(b"notes/todo.txt")
+    assert files.blob_sha("link") == repo.head.commit.tree["link"].hexsha
+    assert files.is_unchanged_since("link", "HEAD")
+
+
+def test_vanished_files_do_not_fail_the_batch(git_repos, tmp_path):
+    repo = make_repo(git_repos)
+    (tmp_path / "repo" / ".gitattributes").write_text("* text=auto\n")
+    gone = tmp_path / "repo" / "gone.txt"
+    gone.write_text("gone\n")
+    files = FileHelper(repo)
+    stamps = {}
+    for file_path in ["README.md", "gone.txt"]:
+        st = os.lstat(tmp_path / "repo" / file_path)
+        stamps[file_path] = (
+            st.st_mtime_ns,
+            st.st_ctime_ns,
+            st.st_size,
+            st.st_ino,
+            st.st_mode,
+        )
+    gone.unlink()
+
+    assert files._FileHelper__hash_files(stamps) == {
+        "README.md": repo.git.hash_object("README.md"),
+        "gone.txt": None,
+    }
+
+
+def test_attribute_changes_are_picked_up(git_repos, tmp_path):
+    repo = make_repo(git_repos)
+    path = tmp_path / "repo" / "notes" / "todo.txt"
+    path.write_bytes(b"buy milk\r\n")
+    os.utime(path, ns=(1_600_000_000_000_000_000, 1_600_000_000_000_000_000))
+    files = FileHelper(repo)
+
+    assert not files.is_unchanged_since("notes/todo.txt", "HEAD")
+    (tmp_path / "repo" / "notes" / ".gitattributes").write_text("*.txt text\n")
+    assert files.is_unchanged_since("notes/todo.txt", "HEAD")
+    (tmp_path / "repo" / "notes" / ".gitattributes").unlink()
+    assert not files.is_unchanged_since("notes/todo.txt", "HEAD")
+
+    repo.git.config("core.autocrlf", "true")
+    assert files.is_unchanged_since("notes/todo.txt", "HEAD")
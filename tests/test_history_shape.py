@@ -0,0 +1,87 @@
+from typing import TYPE_CHECKING
+
+import pytest
+from git import Repo
+
+from git_autograder.exception import GitAutograderInvalidStateException
+from git_autograder.helpers.history_shape_helper import HistoryShapeHelper
+
+if TYPE_CHECKING:
+    from conftest import GitRepos
+
+
+def make_repo(git_repos: "GitRepos") -> Repo:
+    repo = git_repos.init()
+    git_repos.commit(repo, {"README.md": "hello"})
+    return repo
+
+
+def test_merges_and_fast_forwards(git_repos):
+    repo = make_repo(git_repos)
+    repo.git.checkout("-b", "fast")
+    fast = git_repos.commit(repo, {"fast.txt": "fast"})
+    repo.git.checkout("main")
+    repo.git.merge("fast")
+
+    repo.git.checkout("-b", "feature")
+    git_repos.commit(repo, {"feature.txt": "feature"})
+    repo.git.checkout("main")
+    git_repos.commit(repo, {"main.txt": "main"})
+    repo.git.merge("--no-ff", "feature")
+    merge = repo.head.commit.hexsha
+
+    helper = HistoryShapeHelper(repo)
+    shape = helper.shape(["main", "feature"])
+    assert shape.merge_commits == [merge]
+    assert shape.fast_forwards == {"main": [fast], "feature": []}
+    assert shape.was_fast_forwarded("main")
+    assert shape.rebased_branches == []
+    assert shape.squash_candidates == {}
+    assert helper.shape(["feature", "main"]) is shape
+
+    git_repos.commit(repo, {"later.txt": "later"})
+    assert helper.shape(["main", "feature"]) is not shape
+
+    with pytest.raises(GitAutograderInvalidStateException):
+        helper.shape(["missing"])
+
+
+def test_rebases(git_repos):
+    repo = make_repo(git_repos)
+    repo.git.checkout("-b", "feature")
+    first = git_repos.commit(repo, {"a.txt": "a"})
+    second = git_repos.commit(repo, {"b.txt": "b"})
+    repo.git.checkout("main")
+    git_repos.commit(repo, {"main.txt": "main"})
+    repo.git.checkout("feature")
+    repo.git.rebase("main")
+
+    shape = HistoryShapeHelper(repo).shape(["main", "feature"])
+    rebased = repo.head.commit
+    assert shape.rebased_commits == {
+        rebased.hexsha: second,
+        rebased.parents[0].hexsha: first,
+    }
+    assert shape.was_rebased("feature")
+    assert not shape.was_rebased("main")
+
+
+def test_squashes(git_repos):
+    repo = make_repo(git_repos)
+    repo.git.checkout("-b", "feature")
+    first = git_repos.commit(repo, {"a.txt": "a"})
+    second = git_repos.commit(repo, {"b.txt": "b"})
+    repo.git.checkout("main")
+    repo.git.merge("--squash", "feature")
+    repo.git.commit("-m", "Squash feature")
+    squash = repo.head.commit.hexsha
+
+    repo.git.checkout("-b", "manual", "feature")
+    repo.git.reset("--soft", "HEAD~2")
+    repo.git.commit("-m", "Squash by hand")
+    manual = repo.head.commit.hexsha
+
+    shape = HistoryShapeHelper(repo).shape(["main", "feature", "manual"])
+    assert shape.squash_candidates == {squash: [first, second], manual: [first, second]}
+    assert shape.is_squash(squash)
+    assert not shape.is_squash(second)
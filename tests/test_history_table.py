@@ -0,0 +1,100 @@
+from typing import TYPE_CHECKING
+
+from git import Repo
+
+from git_autograder.history import GitAutograderHistoryTable
+
+if TYPE_CHECKING:
+    from conftest import GitRepos
+
+
+def make_repo(git_repos: "GitRepos", name: str, messages: list[str]) -> Repo:
+    repo = git_repos.init(name)
+    for i, message in enumerate(messages):
+        git_repos.commit(
+            repo, {"file.txt": str(i)}, message, timestamp=1_700_000_000 + i * 60
+        )
+    return repo
+
+
+def test_extract_history(git_repos):
+    repo = make_repo(git_repos, "alice", ["First", "[ROLE:bob] Second"])
+    repo.git.checkout("-b", "feature", "HEAD~1")
+    git_repos.commit(repo, {"other.txt": "other"}, "Feature")
+    repo.git.checkout("main")
+    repo.git.merge("feature", "--no-edit")
+
+    table = GitAutograderHistoryTable.extract(repo)
+    assert len(table) == 4
+    assert table.repo_names == ["alice"]
+    merge = table.row_of(repo.head.commit.hexsha)
+    assert merge is not None
+    assert [table.sha(row) for row in table.parents(merge)] == [
+        parent.hexsha for parent in repo.head.commit.parents
+    ]
+    assert table.merge_rows() == [merge]
+    first = table.row_of(repo.commit("HEAD~1~1").hexsha)
+    assert first is not None
+    assert table.message(first) == "First"
+    assert table.parents(first) == []
+    assert table.author_times[first] == 1_700_000_000
+    assert table.role_markers_per_repo() == {"alice": 1}
+    assert table.files_touched(first) == ["file.txt"]
+    assert table.files_touched(merge) == []
+    feature = table.row_of(repo.commit("feature").hexsha)
+    assert feature is not None
+    assert table.files_touched(feature) == ["other.txt"]
+
+
+def test_save_load_and_concat(git_repos, tmp_path):
+    alice = GitAutograderHistoryTable.extract(
+        make_repo(git_repos, "alice", ["One", "Two"])
+    )
+    bob = GitAutograderHistoryTable.extract(
+        make_repo(git_repos, "bob", ["[ROLE:alice] Three", "Four", "Five"])
+    )
+    alice.save(tmp_path / "alice.table")
+    bob.save(tmp_path / "bob.table")
+
+    with GitAutograderHistoryTable.load(tmp_path / "bob.table") as loaded:
+        assert [loaded.sha(row) for row in range(len(loaded))] == [
+            bob.sha(row) for row in range(len(bob))
+        ]
+        assert list(loaded.commit_times) == list(bob.commit_times)
+        assert loaded.message(2) == "[ROLE:alice] Three"
+        assert loaded.files_touched(2) == ["file.txt"]
+
+    cohort = GitAutograderHistoryTable.load_many(
+        [tmp_path / "alice.table", tmp_path / "bob.table"]
+    )
+    assert cohort.commits_per_repo() == {"alice": 2, "bob": 3}
+    assert cohort.role_markers_per_repo() == {"alice": 0, "bob": 1}
+    assert list(cohort.repo_rows("bob")) == [2, 3, 4]
+    assert cohort.parents(2) == [3]
+    assert cohort.parents(1) == []
+    assert list(cohort.message_lengths()) == [3, 3, 4, 4, 18]
+    assert list(cohort.files_touched_counts()) == [1, 1, 1, 1, 1]
+    assert cohort.files_touched(4) == ["file.txt"]
+
+
+def test_files_touched_are_listed_in_the_same_pass(git_repos):
+    repo = make_repo(git_repos, "alice", ["First"])
+    git_repos.commit(
+        repo, {"docs/a b.txt": "a", "file.txt": "changed"}, "Second\n\nWith a body\n"
+    )
+    repo.git.mv("file.txt", "moved.txt")
+    git_repos.commit(repo, {}, "Move")
+
+    table = GitAutograderHistoryTable.extract(repo)
+    assert table.files_touched(0) == ["file.txt", "moved.txt"]
+    assert table.files_touched(1) == ["docs/a b.txt", "file.txt"]
+    assert table.message(1).startswith("Second\n\nWith a body")
+    assert list(table.files_touched_counts()) == [2, 2, 1]
+
+
+def test_extract_empty_repo(tmp_path):
+    table = GitAutograderHistoryTable.extract(Repo.init(tmp_path / "empty"))
+    assert len(table) == 0
+    table.save(tmp_path / "empty.table")
+    with GitAutograderHistoryTable.load(tmp_path / "empty.table") as loaded:
+        assert loaded.commits_per_repo() == {"empty": 0}
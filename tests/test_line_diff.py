@@ -0,0 +1,133 @@
+import random
+
+import pytest
+from difflib_parser import DifflibParser
+
+from git_autograder.diff import (
+    GitAutograderDiff,
+    DifflibLineDiffBackend,
+    LineDiffBackend,
+    MyersLineDiffBackend,
+)
+
+BACKENDS = [DifflibLineDiffBackend(), MyersLineDiffBackend()]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_added_line(backend: LineDiffBackend):
+    diff = backend.diff(["a", "b"], ["a", "new line", "b"])
+    assert diff.added_lines == ("new line",)
+    assert diff.has_added_line
+    assert not diff.has_deleted_line
+    assert not diff.has_edited_line
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_deleted_line(backend: LineDiffBackend):
+    diff = backend.diff(["a", "old line", "b"], ["a", "b"])
+    assert diff.deleted_lines == ("old line",)
+    assert not diff.has_added_line
+    assert diff.has_deleted_line
+    assert not diff.has_edited_line
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_edited_line(backend: LineDiffBackend):
+    diff = backend.diff(["a", "hello world", "b"], ["a", "hello world!", "b"])
+    assert diff.edited_lines == ("hello world",)
+    assert not diff.has_added_line
+    assert not diff.has_deleted_line
+    assert diff.has_edited_line
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_blank_lines_are_ignored(backend: LineDiffBackend):
+    diff = backend.diff(["a", "b"], ["a", "", "b"])
+    assert diff.added_lines == ("",)
+    assert not diff.has_added_line
+
+
+def test_myers_keeps_unchanged_lines():
+    rng = random.Random(0)
+    backend = MyersLineDiffBackend()
+    for _ in range(200):
+        original = [rng.choice("abcd") for _ in range(rng.randint(0, 30))]
+        edited = [rng.choice("abcd") for _ in range(rng.randint(0, 30))]
+        diff = backend.diff(original, edited)
+        # Single character lines are never similar enough to count as edits
+        assert diff.edited_lines == ()
+        kept = len(original) - len(diff.deleted_lines)
+        assert kept == len(edited) - len(diff.added_lines)
+
+
+def test_myers_falls_back_after_max_edits():
+    diff = MyersLineDiffBackend(max_edits=2).diff(["a", "b", "c"], ["x", "y", "z"])
+    assert diff.deleted_lines == ("a", "b", "c")
+    assert diff.added_lines == ("x", "y", "z")
+
+
+def test_backends_agree_when_no_line_moves():
+    rng = random.Random(0)
+    words = ["alpha", "beta", "print(x)", "return 1", "if x:", "else:", "pass", ""]
+    difflib_backend, myers_backend = DifflibLineDiffBackend(), MyersLineDiffBackend()
+    for _ in range(1000):
+        original = rng.sample(words, rng.randint(0, len(words)))
+        edited = list(original)
+        for k in range(rng.randint(0, 5)):
+            op = rng.random()
+            if op < 0.33 and edited:
+                del edited[rng.randrange(len(edited))]
+            elif op < 0.66:
+                edited.insert(rng.randint(0, len(edited)), f"added line {k}")
+            elif edited:
+                i = rng.randrange(len(edited))
+                edited[i] += f" #{k}"
+
+        expected = difflib_backend.diff(original, edited)
+        diff = myers_backend.diff(original, edited)
+        assert sorted(diff.added_lines) == sorted(expected.added_lines)
+        assert sorted(diff.deleted_lines) == sorted(expected.deleted_lines)
+        assert sorted(diff.edited_lines) == sorted(expected.edited_lines)
+
+
+@pytest.mark.parametrize(
+    "original, edited",
+    [
+        # The most similar pair is the edited line, not the first one
+        (["x", "beta"], ["x", "beca"]),
+        (["foo bar"], ["print(x)", "coo bar", "deltc"]),
+        (["hello world", "print(x)"], ["gamma", "hello worbd", "print(x)"]),
+        # Ratios just above 0.74 count as similar, like ndiff
+        (["abcd"], ["abce"]),
+    ],
+)
+def test_backends_pair_edited_lines_alike(original, edited):
+    expected = DifflibLineDiffBackend().diff(original, edited)
+    diff = MyersLineDiffBackend().diff(original, edited)
+    assert diff == expected
+
+
+def test_myers_compares_large_runs_in_order():
+    original, edited = ["hello world", "unrelated"], ["something else", "hello world!"]
+    assert MyersLineDiffBackend().diff(original, edited).edited_lines == (
+        "hello world",
+    )
+    diff = MyersLineDiffBackend(max_pairs=3).diff(original, edited)
+    assert diff.edited_lines == ()
+    assert diff.deleted_lines == tuple(original)
+
+
+def test_diff_parser_can_be_given_or_parsed_lazily():
+    parser = DifflibParser(["a"], ["b"])
+    given = GitAutograderDiff(None, "M", "f.txt", "f.txt", "a", "b", parser)
+    assert given.diff_parser is parser
+    assert given.difflib_parser is parser
+
+    lazy = GitAutograderDiff(None, "M", "f.txt", "f.txt", "hello world", "hello world!")
+    assert lazy.diff_parser is None
+    assert "difflib_parser" not in vars(lazy)
+    assert lazy.difflib_parser is not None
+    assert lazy.difflib_parser is lazy.difflib_parser
+    assert isinstance(lazy.line_diff_backend, MyersLineDiffBackend)
+    assert lazy.has_edited_line()
+    assert GitAutograderDiff(None, "A", None, "f.txt", None, "b").difflib_parser is None
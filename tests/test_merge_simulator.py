@@ -0,0 +1,75 @@
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from git import Repo
+
+from git_autograder.exception import GitAutograderInvalidStateException
+from git_autograder.helpers.branch_helper import BranchHelper
+
+if TYPE_CHECKING:
+    from conftest import GitRepos
+
+
+def make_repo(git_repos: "GitRepos") -> Repo:
+    repo = git_repos.init()
+    git_repos.commit(
+        repo, {"story.txt": "1\n2\n3\n4\n5\n", "notes.txt": "notes"}, "Base"
+    )
+    repo.git.branch("clean")
+    repo.git.branch("conflict")
+
+    git_repos.commit(
+        repo, {"story.txt": "1\n2\n3\n4\n5 main\n", "notes.txt": None}, "Main"
+    )
+    repo.git.checkout("clean")
+    git_repos.commit(repo, {"story.txt": "1 clean\n2\n3\n4\n5\n"}, "Clean")
+    repo.git.checkout("conflict")
+    git_repos.commit(
+        repo, {"story.txt": "1\n2\n3\n4\n5 other\n", "notes.txt": "more notes"}, "Other"
+    )
+    repo.git.checkout("main")
+    return repo
+
+
+def test_merge_without_touching_the_repo(git_repos):
+    repo = make_repo(git_repos)
+    branches = BranchHelper(repo)
+    head, index = repo.head.commit.hexsha, (Path(repo.git_dir) / "index").read_bytes()
+
+    clean = branches.merges.merge(branches.branch("main"), "clean")
+    assert clean.is_clean
+    assert repo.git.show(f"{clean.tree_sha}:story.txt") == "1 clean\n2\n3\n4\n5 main"
+
+    result = branches.merges.merge("main", branches.branch("conflict"))
+    assert not result.is_clean
+    assert result.conflicts == ["notes.txt", "story.txt"]
+    assert result.conflict_kinds("notes.txt") == ["CONFLICT (modify/delete)"]
+    assert result.conflict_kinds("story.txt") == ["CONFLICT (contents)"]
+    assert branches.merges.merge("main", "conflict") is result
+
+    assert repo.head.commit.hexsha == head
+    assert (Path(repo.git_dir) / "index").read_bytes() == index
+    assert not repo.is_dirty(untracked_files=True)
+
+
+def test_unrelated_histories(git_repos):
+    repo = make_repo(git_repos)
+    repo.git.checkout("--orphan", "unrelated")
+    git_repos.commit(repo, {"other.txt": "other"}, "Unrelated")
+    branches = BranchHelper(repo)
+
+    with pytest.raises(GitAutograderInvalidStateException):
+        branches.merges.merge("main", "unrelated")
+    with pytest.raises(GitAutograderInvalidStateException):
+        branches.merges.merge("main", "missing")
+
+
+def test_old_git_is_reported(git_repos, monkeypatch):
+    repo = make_repo(git_repos)
+    monkeypatch.setattr(
+        type(repo.git), "version_info", property(lambda self: (2, 37, 1))
+    )
+
+    with pytest.raises(GitAutograderInvalidStateException, match="git 2.38"):
+        BranchHelper(repo).merges.merge("main", "clean")
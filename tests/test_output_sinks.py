@@ -0,0 +1,93 @@
+import io
+import json
+import os
+from datetime import datetime
+
+import pytz
+
+from git_autograder.output import GitAutograderOutput
+from git_autograder.output_sinks import (
+    BinaryStreamOutputSink,
+    FileOutputSink,
+    JsonLinesOutputSink,
+    MemoryOutputSink,
+)
+from git_autograder.status import GitAutograderStatus
+
+
+def make_output(name: str) -> GitAutograderOutput:
+    return GitAutograderOutput(
+        status=GitAutograderStatus.SUCCESSFUL,
+        started_at=datetime(2025, 1, 1, tzinfo=pytz.UTC),
+        completed_at=datetime(2025, 1, 1, 0, 1, tzinfo=pytz.UTC),
+        comments=["Great work!"],
+        exercise_name=name,
+    )
+
+
+def test_file_sink_writes_output_and_removes_partial(tmp_path):
+    sink = FileOutputSink(tmp_path)
+    sink.emit_comment("Checking branches", "ex")
+    assert os.path.exists(sink.partial_file_path)
+
+    make_output("ex").save(sink=sink)
+
+    assert not os.path.exists(sink.partial_file_path)
+    with open(tmp_path / GitAutograderOutput.OUTPUT_FILE_NAME) as f:
+        saved = json.load(f)
+    assert saved["status"] == "SUCCESSFUL"
+    assert saved["exercise_name"] == "ex"
+    assert saved["completed_at"] == 1735689660.0
+    assert os.listdir(tmp_path) == [GitAutograderOutput.OUTPUT_FILE_NAME]
+
+
+def test_file_sink_respects_the_umask(tmp_path):
+    umask = os.umask(0o027)
+    try:
+        make_output("ex").save(sink=FileOutputSink(tmp_path))
+    finally:
+        os.umask(umask)
+    mode = os.stat(tmp_path / GitAutograderOutput.OUTPUT_FILE_NAME).st_mode
+    assert mode & 0o777 == 0o640
+
+
+def test_save_defaults_to_file_sink(tmp_path):
+    make_output("ex").save(tmp_path)
+    assert os.path.exists(tmp_path / GitAutograderOutput.OUTPUT_FILE_NAME)
+
+
+def test_json_lines_sink_appends_events(tmp_path):
+    path = tmp_path / "results.jsonl"
+    with JsonLinesOutputSink(path) as sink:
+        sink.emit_comment("Checking branches", "a")
+        make_output("a").save(sink=sink)
+        make_output("b").save(sink=sink)
+
+    with open(path) as f:
+        records = [json.loads(line) for line in f]
+    assert [r["event"] for r in records] == ["comment", "output", "output"]
+    assert [r["exercise_name"] for r in records] == ["a", "a", "b"]
+
+
+def test_binary_stream_sink_round_trips_frames():
+    stream = io.BytesIO()
+    sink = BinaryStreamOutputSink(stream)
+    sink.emit_comment("Checking branches", "a")
+    make_output("a").save(sink=sink)
+
+    stream.seek(0)
+    frames = list(BinaryStreamOutputSink.read_frames(stream))
+    assert [kind for kind, _ in frames] == [
+        BinaryStreamOutputSink.COMMENT,
+        BinaryStreamOutputSink.OUTPUT,
+    ]
+    assert frames[1][1]["comments"] == ["Great work!"]
+
+
+def test_memory_sink_collects_outputs():
+    sink = MemoryOutputSink()
+    sink.emit_comment("Checking branches")
+    output = make_output("a")
+    output.save(sink=sink)
+    assert sink.comments == [(None, "Checking branches")]
+    assert sink.outputs == [output]
@@ -0,0 +1,55 @@
+import subprocess
+from typing import TYPE_CHECKING
+
+from git import Repo
+
+from git_autograder.helpers.patch_id_helper import PatchIdHelper
+
+if TYPE_CHECKING:
+    from conftest import GitRepos
+
+
+def make_repo(git_repos: "GitRepos") -> Repo:
+    repo = git_repos.init()
+    git_repos.commit(repo, {"README.md": "hello"})
+    return repo
+
+
+def test_patch_ids_match_git(git_repos):
+    repo = make_repo(git_repos)
+    shas = [git_repos.commit(repo, {f"{i}.txt": str(i)}) for i in range(3)]
+    repo.git.commit("--allow-empty", "-m", "Empty")
+    empty = repo.head.commit.hexsha
+
+    log = repo.git.log("-p", "--format=commit %H", "main")
+    output = subprocess.run(
+        ["git", "patch-id", "--stable"],
+        cwd=repo.working_dir,
+        input=log.encode("utf-8") + b"\n",
+        capture_output=True,
+        check=True,
+    ).stdout.decode("utf-8")
+    expected = {}
+    for line in output.splitlines():
+        patch_id, sha = line.split()
+        expected[sha] = patch_id
+
+    patch_ids = PatchIdHelper(repo)
+    assert patch_ids.range_patch_ids("main") == expected
+    assert patch_ids.patch_ids(shas + [empty]) == {sha: expected[sha] for sha in shas}
+    assert patch_ids.patch_id(empty) is None
+
+
+def test_equivalent_commits(git_repos):
+    repo = make_repo(git_repos)
+    repo.git.checkout("-b", "feature")
+    picked = git_repos.commit(repo, {"picked.txt": "picked"})
+    git_repos.commit(repo, {"other.txt": "other"})
+    repo.git.checkout("main")
+    git_repos.commit(repo, {"main.txt": "main"})
+    repo.git.cherry_pick(picked)
+    copy = repo.head.commit.hexsha
+
+    patch_ids = PatchIdHelper(repo)
+    assert patch_ids.equivalent_commits("main", "feature") == {copy: picked}
+    assert patch_ids.equivalent_commits("feature", "main") == {picked: copy}
@@ -0,0 +1,60 @@
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from git import Repo
+
+from git_autograder.remote import GitAutograderRemote
+
+if TYPE_CHECKING:
+    from conftest import GitRepos
+
+
+def make_clone(git_repos: "GitRepos") -> Repo:
+    origin = git_repos.init("origin")
+    git_repos.commit(origin, {"file.txt": "hello"}, "Initial commit")
+    for branch in ["feature", "docs"]:
+        origin.git.checkout("-b", branch)
+        git_repos.commit(origin, {f"{branch}.txt": branch}, f"Add {branch}")
+        origin.git.checkout("main")
+    clone = Repo.clone_from(git_repos.root / "origin", git_repos.root / "clone")
+    with clone.config_writer() as config:
+        config.set_value("user", "name", git_repos.author.name)
+        config.set_value("user", "email", git_repos.author.email)
+    return clone
+
+
+def test_track_branches(git_repos):
+    repo = make_clone(git_repos)
+    remote = GitAutograderRemote(repo.remote("origin"))
+    head_reflog = repo.git.reflog("HEAD")
+
+    remote.track_branches(["feature", "docs", "missing", "main", "feature"])
+
+    assert sorted(head.name for head in repo.heads) == ["docs", "feature", "main"]
+    assert repo.active_branch.name == "main"
+    assert repo.git.reflog("HEAD") == head_reflog
+    for branch in ["feature", "docs"]:
+        assert repo.heads[branch].commit == repo.remote().refs[branch].commit
+        assert repo.git.rev_parse("--abbrev-ref", f"{branch}@{{upstream}}") == (
+            f"origin/{branch}"
+        )
+        assert repo.git.config(f"branch.{branch}.merge") == f"refs/heads/{branch}"
+        # Same reflog as git branch --track
+        assert repo.git.log("-g", "--format=%gs", branch) == (
+            f"branch: Created from origin/{branch}"
+        )
+        entry = repo.heads[branch].log()[0]
+        assert entry.actor.email == git_repos.author.email
+
+    remote.track_branches(["feature"])
+    assert len(repo.heads.feature.log()) == 1
+
+
+def test_track_branches_without_reflogs(git_repos):
+    repo = make_clone(git_repos)
+    repo.git.config("core.logAllRefUpdates", "false")
+
+    GitAutograderRemote(repo.remote("origin")).track_branches(["feature"])
+
+    assert repo.heads.feature.commit == repo.remote().refs.feature.commit
+    assert not Path(repo.git_dir, "logs", "refs", "heads", "feature").exists()
@@ -0,0 +1,75 @@
+from typing import TYPE_CHECKING
+
+from git import Repo
+
+from git_autograder.helpers.remote_refs_helper import (
+    RemoteRefsHelper,
+    RemoteRefsSnapshot,
+)
+from git_autograder.helpers.tag_helper import TagHelper
+
+if TYPE_CHECKING:
+    from conftest import GitRepos
+
+
+def make_repo_with_remote(git_repos: "GitRepos") -> Repo:
+    git_repos.init("remote.git", bare=True)
+    repo = git_repos.init("local")
+    git_repos.commit(repo, {"file.txt": "hello"}, "Initial commit")
+    repo.create_tag("v1.0")
+    repo.create_tag("v2.0", message="Annotated")
+    repo.create_head("feature")
+    repo.create_remote("origin", str(git_repos.root / "remote.git"))
+    repo.git.push("origin", "--all")
+    repo.git.push("origin", "--tags")
+    return repo
+
+
+def test_parse_peeled_tags():
+    raw = "\n".join(
+        [
+            "aaa\tHEAD",
+            "bbb\trefs/heads/main",
+            "ccc\trefs/tags/v1.0",
+            "ddd\trefs/tags/v2.0",
+            "bbb\trefs/tags/v2.0^{}",
+        ]
+    )
+    snapshot = RemoteRefsSnapshot.parse("origin", raw)
+    assert snapshot.heads == {"main": "bbb"}
+    assert snapshot.tag_names == ["v1.0", "v2.0"]
+    assert snapshot.tag_commit_sha("v1.0") == "ccc"
+    assert snapshot.tag_commit_sha("v2.0") == "bbb"
+    assert snapshot.refs["HEAD"] == "aaa"
+    assert TagHelper._parse_remote_tag_names(raw) == ["v1.0", "v2.0"]
+
+
+def test_snapshot_from_local_bare_remote(git_repos):
+    repo = make_repo_with_remote(git_repos)
+    head_sha = repo.head.commit.hexsha
+
+    snapshot = RemoteRefsHelper(repo).snapshot("origin")
+    assert snapshot.heads == {"feature": head_sha, "main": head_sha}
+    assert snapshot.tag_names == ["v1.0", "v2.0"]
+    assert snapshot.tags["v2.0"] != head_sha
+    assert snapshot.tag_commit_sha("v2.0") == head_sha
+
+
+def test_snapshot_is_cached_until_invalidated(git_repos):
+    repo = make_repo_with_remote(git_repos)
+    remote_refs = RemoteRefsHelper(repo, ttl=None)
+    tags = TagHelper(repo, remote_refs)
+    assert tags.remote_tag_names() == ["v1.0", "v2.0"]
+
+    repo.create_tag("v3.0")
+    repo.git.push("origin", "v3.0")
+    assert tags.remote_tag_names() == ["v1.0", "v2.0"]
+
+    remote_refs.invalidate("origin")
+    assert tags.remote_tag_names() == ["v1.0", "v2.0", "v3.0"]
+
+
+def test_missing_remote(git_repos):
+    repo = make_repo_with_remote(git_repos)
+    assert RemoteRefsHelper(repo).snapshot_or_none("upstream") is None
+    assert TagHelper(repo).remote_tag_names_or_none("upstream") is None
@@ -0,0 +1,55 @@
+from pathlib import Path
+
+import pytest
+from git import Repo
+
+from git_autograder.helpers.remote_helper import RemoteHelper
+from git_autograder.remote_url import GitAutograderRemoteUrl
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://github.com/git-mastery/exercise.git",
+        "https://github.com/git-mastery/exercise",
+        "https://github.com/git-mastery/exercise/",
+        "https://user@GitHub.com/Git-Mastery/Exercise.git",
+        "ssh://git@github.com/git-mastery/exercise.git",
+        "ssh://git@github.com:22/git-mastery/exercise.git",
+        "git@github.com:git-mastery/exercise.git",
+        "github.com:git-mastery/exercise",
+    ],
+)
+def test_parse_github_urls(url: str):
+    parsed = GitAutograderRemoteUrl.parse(url)
+    assert parsed is not None
+    assert parsed.key == ("github.com", "git-mastery", "exercise")
+
+
+@pytest.mark.parametrize(
+    "url",
+    ["/tmp/git-mastery/exercise.git", "file:///tmp/git-mastery/exercise.git"],
+)
+def test_parse_local_urls(url: str):
+    parsed = GitAutograderRemoteUrl.parse(url)
+    assert parsed is not None
+    assert parsed.key == ("", "git-mastery", "exercise")
+
+
+@pytest.mark.parametrize("url", ["", "https://github.com/git-mastery", "exercise"])
+def test_parse_invalid_urls(url: str):
+    assert GitAutograderRemoteUrl.parse(url) is None
+
+
+def test_remote_for_repo(tmp_path: Path):
+    repo = Repo.init(tmp_path)
+    repo.create_remote("origin", "git@github.com:student/exercise.git")
+    remotes = RemoteHelper(repo)
+    assert remotes.remote("origin").is_for_repo("student", "exercise")
+    assert not remotes.remote("origin").is_for_repo("git-mastery", "exercise")
+    assert remotes.remote_for_repo_or_none("git-mastery", "exercise") is None
+
+    repo.create_remote("upstream", "https://github.com/git-mastery/exercise")
+    upstream = remotes.remote_for_repo_or_none("git-mastery", "exercise")
+    assert upstream is not None
+    assert upstream.name == "upstream"
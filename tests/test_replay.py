@@ -0,0 +1,74 @@
+from typing import TYPE_CHECKING, List
+
+from git_autograder.exercise import GitAutograderExercise
+from git_autograder.output import GitAutograderOutput
+from git_autograder.replay import (
+    GitAutograderReplayHarness,
+    GitAutograderReplayReport,
+    ReplayResult,
+)
+from git_autograder.snapshot import GitAutograderSnapshotStore
+from git_autograder.status import GitAutograderStatus
+
+if TYPE_CHECKING:
+    from conftest import GitRepos
+
+
+def make_exercise(git_repos: "GitRepos", name: str, branches: List[str]) -> None:
+    repo = git_repos.exercise(name)
+    for branch in branches:
+        repo.create_head(branch)
+
+
+def grade(exercise: GitAutograderExercise) -> GitAutograderOutput:
+    if not exercise.repo.branches.has_branch("feature"):
+        raise exercise.wrong_answer(["Missing feature branch"])
+    return exercise.to_output(["Great work!"], GitAutograderStatus.SUCCESSFUL)
+
+
+def test_replay_reports_results_and_timings(git_repos, tmp_path):
+    store = GitAutograderSnapshotStore(tmp_path / "store")
+    make_exercise(git_repos, "a", ["feature"])
+    make_exercise(git_repos, "b", [])
+    passing = store.capture(tmp_path / "a")
+    failing = store.capture(tmp_path / "b")
+
+    report = GitAutograderReplayHarness(grade, store, max_workers=2).run()
+
+    statuses = {result.snapshot_id: result.status for result in report.results}
+    assert statuses == {
+        passing: GitAutograderStatus.SUCCESSFUL,
+        failing: GitAutograderStatus.UNSUCCESSFUL,
+    }
+    assert report.throughput > 0
+    assert report.helper_calls["BranchHelper.has_branch"] == 2
+    assert report.latencies["p50"] <= report.latencies["p99"]
+
+    report.save(str(tmp_path / "report.json"))
+    loaded = GitAutograderReplayReport.load(str(tmp_path / "report.json"))
+    assert not loaded.compare(report).has_correctness_changes
+
+
+def test_percentile_interpolates():
+    values = [1.0, 2.0, 3.0, 4.0]
+    assert GitAutograderReplayReport.percentile(values, 50) == 2.5
+    assert GitAutograderReplayReport.percentile(values, 100) == 4.0
+
+
+def test_compare_reports_status_changes_and_slowdowns():
+    previous = GitAutograderReplayReport(
+        results=[ReplayResult("a", "SUCCESSFUL", [], 0.1, 1)],
+        wall_time=0.1,
+        max_workers=1,
+    )
+    current = GitAutograderReplayReport(
+        results=[ReplayResult("a", "ERROR", ["boom"], 0.3, 1)],
+        wall_time=0.3,
+        max_workers=1,
+    )
+
+    comparison = current.compare(previous)
+    assert comparison.status_changes == {"a": ("SUCCESSFUL", "ERROR")}
+    assert "p50" in comparison.slowdowns()
+    assert "throughput" in comparison.slowdowns()
+    assert comparison.has_regressions()
@@ -0,0 +1,96 @@
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from git import Repo
+
+from git_autograder.helpers.commit_helper import CommitHelper
+from git_autograder.pr import GitAutograderPr
+from git_autograder.pr_comment import GitAutograderPrComment
+from git_autograder.pr_review import GitAutograderPrReview
+from git_autograder.role_marker import RoleMarker
+
+if TYPE_CHECKING:
+    from conftest import GitRepos
+
+
+def make_repo(git_repos: "GitRepos", messages: list[str]) -> Repo:
+    repo = git_repos.init()
+    for i, message in enumerate(messages):
+        git_repos.commit(repo, {"file.txt": str(i)}, message)
+    return repo
+
+
+def test_partition_by_role(git_repos):
+    repo = make_repo(
+        git_repos, ["Initial", "[ROLE:bot] Setup", "Fix bug", "[role:bot] Done"]
+    )
+    user_commits, non_user_commits = CommitHelper(repo).partition_by_role()
+
+    assert [c.message for c in user_commits] == ["Fix bug", "Initial"]
+    assert [c.message for c in non_user_commits] == [
+        "[role:bot] Done",
+        "[ROLE:bot] Setup",
+    ]
+    assert all(c.is_from_user() for c in user_commits)
+    assert not any(c.is_from_user() for c in non_user_commits)
+
+    user_commits, non_user_commits = CommitHelper(repo).partition_by_role(
+        "HEAD~2..HEAD"
+    )
+    assert len(user_commits) == len(non_user_commits) == 1
+
+
+def test_user_commit_is_cached_by_sha():
+    reads = []
+
+    def read_message() -> str:
+        reads.append(1)
+        return "[ROLE:bot] Setup"
+
+    sha = "f" * 40
+    assert not RoleMarker.is_user_commit(sha, read_message)
+    assert not RoleMarker.is_user_commit(sha, read_message)
+    assert len(reads) == 1
+
+
+def test_user_commit_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(RoleMarker, "MAX_CACHED_COMMITS", 2)
+    monkeypatch.setattr(RoleMarker, "_user_commits", OrderedDict())
+    reads = []
+
+    def read_message() -> str:
+        reads.append(1)
+        return "Fix bug"
+
+    for sha in ["a" * 40, "b" * 40, "a" * 40, "c" * 40]:
+        assert RoleMarker.is_user_commit(sha, read_message)
+    assert list(RoleMarker._user_commits) == ["a" * 40, "c" * 40]
+    assert len(reads) == 3
+
+
+def test_pr_user_partitions():
+    pr = GitAutograderPr(
+        number=1,
+        repo_full_name="git-mastery/exercise",
+        title="Title",
+        body="",
+        state="OPEN",
+        author_login="student",
+        base_branch="main",
+        head_branch="feature",
+        is_draft=False,
+        merged_at=None,
+        merged_by_login=None,
+        created_at=None,
+        commits=[],
+        reviews=[GitAutograderPrReview("bot", "COMMENTED", "[ROLE:bot] Nice")],
+        comments=[
+            GitAutograderPrComment("student", "Done"),
+            GitAutograderPrComment("bot", "[ROLE:bot] Thanks"),
+            GitAutograderPrComment("student", None),
+        ],
+    )
+
+    assert pr.user_reviews == []
+    assert [c.body for c in pr.user_comments] == ["Done", None]
+    assert pr.last_user_comment.body is None
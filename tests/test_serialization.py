@@ -0,0 +1,73 @@
+from datetime import datetime
+from enum import Enum
+
+import pytest
+import pytz
+
+from git_autograder import serialization
+from git_autograder.status import GitAutograderStatus
+
+
+def test_dumps_matches_encoder_types():
+    started_at = datetime(2025, 1, 1, tzinfo=pytz.UTC)
+    data = serialization.dumps(
+        {"status": GitAutograderStatus.ERROR, "started_at": started_at}
+    )
+    assert serialization.loads(data) == {
+        "status": "ERROR",
+        "started_at": started_at.timestamp(),
+    }
+
+
+@pytest.fixture(params=["msgpack", "marshal"])
+def packer(request, monkeypatch):
+    if request.param == "msgpack":
+        pytest.importorskip("msgpack")
+    else:
+        monkeypatch.setattr(serialization, "msgpack", None)
+    return request.param
+
+
+class Color(Enum):
+    RED = 1
+
+
+def test_pack_round_trips(packer):
+    value = {
+        "sha": "abc",
+        "parents": ("a", "b"),
+        "size": 3,
+        "at": datetime(2025, 1, 1, tzinfo=pytz.UTC),
+        "status": GitAutograderStatus.SUCCESSFUL,
+        "color": Color.RED,
+        "paths": {"a.txt"},
+        "data": b"\x00",
+        "missing": None,
+    }
+    packed = serialization.pack(value)
+    assert packed[:1] == (
+        serialization.MSGPACK_FORMAT
+        if packer == "msgpack"
+        else serialization.MARSHAL_FORMAT
+    )
+    assert serialization.unpack(packed) == {
+        "sha": "abc",
+        "parents": ["a", "b"],
+        "size": 3,
+        "at": 1735689600.0,
+        "status": "SUCCESSFUL",
+        "color": 1,
+        "paths": ["a.txt"],
+        "data": b"\x00",
+        "missing": None,
+    }
+
+
+def test_pack_rejects_unknown_types(packer):
+    with pytest.raises(TypeError):
+        serialization.pack({"value": object()})
+
+
+def test_unpack_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        serialization.unpack(b"X123")
@@ -0,0 +1,57 @@
+from typing import TYPE_CHECKING
+
+from git import Repo
+
+from git_autograder.snapshot import GitAutograderSnapshotStore
+
+if TYPE_CHECKING:
+    from conftest import GitRepos
+
+
+def make_exercise(git_repos: "GitRepos") -> Repo:
+    repo = git_repos.exercise(exercise_name="undo-commit")
+    (git_repos.root / "exercise" / "answers.txt").write_text("Q: Why?\nA: Because\n")
+    for content in ["one", "two"]:
+        git_repos.commit(repo, {"file.txt": content}, content)
+    repo.git.reset("--hard", "HEAD~1")
+    git_repos.write(repo, "untracked.txt", "untracked")
+    return repo
+
+
+def test_capture_and_restore(git_repos, tmp_path):
+    repo = make_exercise(git_repos)
+    store = GitAutograderSnapshotStore(tmp_path / "store")
+    snapshot_id = store.capture(tmp_path / "exercise")
+
+    restored = Repo(store.restore(snapshot_id, tmp_path / "restored") / "repo")
+    assert restored.head.commit == repo.head.commit
+    assert restored.active_branch.name == "main"
+    assert restored.git.reflog() == repo.git.reflog()
+    # The reset commit is only reachable from the reflog
+    assert restored.commit("HEAD@{1}").message == "two"
+    assert restored.untracked_files == ["untracked.txt"]
+    assert not restored.is_dirty()
+    assert (tmp_path / "restored" / "answers.txt").read_text().startswith("Q: Why?")
+
+
+def test_identical_exercises_are_deduplicated(git_repos, tmp_path):
+    make_exercise(git_repos)
+    store = GitAutograderSnapshotStore(tmp_path / "store")
+    snapshot_id = store.capture(tmp_path / "exercise")
+    digests = list(store.content.digests())
+
+    assert store.capture(tmp_path / "exercise") == snapshot_id
+    assert list(store.content.digests()) == digests
+    assert store.ids() == [snapshot_id]
+
+
+def test_export_and_import(git_repos, tmp_path):
+    make_exercise(git_repos)
+    store = GitAutograderSnapshotStore(tmp_path / "store")
+    snapshot_id = store.capture(tmp_path / "exercise")
+    store.export(tmp_path / "snapshots.tar")
+
+    other = GitAutograderSnapshotStore(tmp_path / "other")
+    assert other.import_archive(tmp_path / "snapshots.tar") == [snapshot_id]
+    restored = Repo(other.restore(snapshot_id, tmp_path / "restored") / "repo")
+    assert restored.head.commit.message == "one"
@@ -0,0 +1,156 @@
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from git import GitCommandError, Repo
+
+from git_autograder.helpers.staging_helper import StagingHelper
+from git_autograder.index import GitAutograderIndex
+
+if TYPE_CHECKING:
+    from conftest import GitRepos
+
+
+def make_repo(git_repos: "GitRepos") -> Repo:
+    repo = git_repos.init()
+    for file_path in ["README.md", "docs/guide.md", "docs/deep/" + "x" * 40 + ".md"]:
+        git_repos.write(repo, file_path, file_path)
+    git_repos.write(repo, "old.txt", "old")
+    repo.git.add("--all")
+    repo.git.commit("-m", "Initial commit")
+
+    git_repos.write(repo, "README.md", "changed")
+    git_repos.write(repo, "new.txt", "new")
+    repo.git.add("README.md", "new.txt")
+    repo.git.rm("old.txt")
+    git_repos.write(repo, "later.txt", "later")
+    repo.git.add("-N", "later.txt")
+    git_repos.write(repo, "docs/guide.md", "unstaged")
+    return repo
+
+
+def ls_files(repo: Repo) -> set[tuple[str, int, int, str]]:
+    entries = set()
+    for line in repo.git.ls_files("-s").splitlines():
+        info, path = line.split("\t", 1)
+        mode, sha, stage = info.split()
+        entries.add((path, int(stage), int(mode, 8), sha))
+    return entries
+
+
+@pytest.mark.parametrize("version", [2, 3, 4])
+def test_index_matches_ls_files(git_repos, version):
+    repo = make_repo(git_repos)
+    repo.git.update_index("--index-version", str(version))
+
+    index = GitAutograderIndex.read(os.path.join(repo.git_dir, "index"))
+    # The intent to add entry needs extended flags, which git upgrades v2 to v3 for
+    assert index.version == max(version, 3)
+    assert {
+        (entry.path, entry.stage, entry.mode, entry.sha)
+        for entry in index.entries.values()
+    } == ls_files(repo)
+    later = index.entry("later.txt")
+    assert later is not None and later.is_intent_to_add
+
+
+def test_staged_and_modified_paths(git_repos):
+    repo = make_repo(git_repos)
+    staging = StagingHelper(repo)
+
+    expected = {}
+    for line in repo.git.diff("--cached", "--name-status").splitlines():
+        status, path = line.split("\t", 1)
+        expected[path] = status
+    assert staging.staged_changes() == expected
+    assert staging.is_staged("README.md")
+    assert not staging.is_staged("docs/guide.md")
+    assert not staging.is_index_clean()
+    assert staging.is_tracked("./docs/guide.md")
+    assert not staging.is_tracked("old.txt")
+
+    assert set(staging.modified_paths()) == set(
+        repo.git.diff("--name-only").splitlines()
+    )
+
+
+def test_conflicts(git_repos):
+    repo = make_repo(git_repos)
+    repo.git.reset("--hard")
+    repo.git.checkout("-b", "other")
+    git_repos.write(repo, "README.md", "other")
+    repo.git.commit("-am", "Other")
+    repo.git.checkout("main")
+    git_repos.write(repo, "README.md", "main")
+    repo.git.commit("-am", "Main")
+    with pytest.raises(GitCommandError):
+        repo.git.merge("other")
+
+    staging = StagingHelper(repo)
+    assert staging.has_conflicts()
+    assert staging.index.stages("README.md") == [1, 2, 3]
+    assert {
+        (entry.path, entry.stage, entry.mode, entry.sha)
+        for entry in staging.index.entries.values()
+    } == ls_files(repo)
+
+
+def test_index_is_cached_until_it_changes(git_repos):
+    repo = make_repo(git_repos)
+    staging = StagingHelper(repo)
+    index = staging.index
+    assert staging.index is index
+
+    repo.git.add("docs/guide.md")
+    assert staging.index is not index
+    assert staging.is_staged("docs/guide.md")
+
+
+def test_submodules_are_not_staged_changes(git_repos):
+    repo = make_repo(git_repos)
+    head = repo.head.commit.hexsha
+    repo.git.update_index("--add", "--cacheinfo", f"160000,{head},lib")
+    repo.git.commit("-m", "Add submodule")
+    staging = StagingHelper(repo)
+    assert staging.staged_changes() == {}
+
+    repo.git.update_index("--add", "--cacheinfo", f"160000,{head},vendor")
+    assert staging.staged_changes() == {}
+    assert staging.is_tracked("vendor")
+
+
+def test_mode_changes_are_modifications(git_repos):
+    repo = make_repo(git_repos)
+    repo.git.reset("--hard")
+    os.chmod(Path(repo.working_dir) / "README.md", 0o755)
+    os.remove(Path(repo.working_dir) / "docs/guide.md")
+    os.symlink("../README.md", Path(repo.working_dir) / "docs/guide.md")
+    staging = StagingHelper(repo)
+
+    assert staging.is_modified("README.md")
+    assert staging.is_modified("docs/guide.md")
+    assert set(staging.modified_paths()) == set(
+        repo.git.diff("--name-only").splitlines()
+    )
+
+    repo.git.config("core.fileMode", "false")
+    assert not StagingHelper(repo).is_modified("README.md")
+
+
+def test_same_size_rewrites_are_modifications(git_repos):
+    repo = make_repo(git_repos)
+    repo.git.reset("--hard")
+    path = Path(repo.working_dir) / "README.md"
+    # An old mtime recorded in the index keeps the entry from being racily clean
+    os.utime(path, ns=(1_000_000_000_000_000_000, 1_000_000_000_000_000_000))
+    repo.git.update_index("--refresh")
+    before = os.stat(path)
+    path.write_text("readme.md")
+    os.utime(path, ns=(before.st_atime_ns, before.st_mtime_ns))
+    assert os.stat(path).st_ino == before.st_ino
+
+    assert StagingHelper(repo).is_modified("README.md")
+
+    repo.git.config("core.trustctime", "false")
+    assert not StagingHelper(repo).is_modified("README.md")
@@ -0,0 +1,89 @@
+from typing import TYPE_CHECKING
+
+from git import Git, Repo
+
+from git_autograder.helpers.commit_helper import CommitHelper
+from git_autograder.helpers.tree_helper import TreeHelper
+
+if TYPE_CHECKING:
+    from conftest import GitRepos
+
+
+def make_repo(git_repos: "GitRepos") -> tuple[Repo, list[str]]:
+    repo = git_repos.init()
+    shas = [
+        git_repos.commit(repo, {"README.md": "hello", "docs/guide.md": "guide"}),
+        git_repos.commit(repo, {"src/app.py": "print()"}),
+        git_repos.commit(repo, {"README.md": None}),
+    ]
+    return repo, shas
+
+
+def test_bulk_queries(git_repos):
+    repo, shas = make_repo(git_repos)
+    trees = TreeHelper(repo)
+
+    assert trees.exists_in(shas, "README.md") == [True, True, False]
+    assert trees.exists_in_all(shas, "docs/guide.md")
+    assert not trees.exists_in_all(shas, "src/app.py")
+    assert trees.exists_in(shas, "docs") == [False, False, False]
+    assert trees.blob_sha_at(shas, "./docs/guide.md") == [
+        repo.commit(sha).tree["docs/guide.md"].hexsha for sha in shas
+    ]
+    commits = [CommitHelper(repo).commit(sha) for sha in shas]
+    assert trees.exists_in(commits, "src/app.py") == [False, True, True]
+
+
+def test_files_match_ls_tree_and_share_subtrees(git_repos):
+    repo, shas = make_repo(git_repos)
+    trees = TreeHelper(repo)
+
+    for sha in shas:
+        expected = {}
+        for line in repo.git.ls_tree("-r", sha).splitlines():
+            info, file_path = line.split("\t", 1)
+            expected[file_path] = info.split()[2]
+        assert trees.files(sha) == expected
+
+    # The docs tree is unchanged in every commit, so it is only listed once
+    docs_tree = repo.commit(shas[0]).tree["docs"].hexsha
+    assert all(repo.commit(sha).tree["docs"].hexsha == docs_tree for sha in shas)
+    assert len(trees._entries) == len(shas) + 2
+
+
+def test_each_tree_is_listed_with_one_ls_tree(git_repos, monkeypatch):
+    repo, shas = make_repo(git_repos)
+    trees = TreeHelper(repo)
+    listed = []
+
+    def counting_ls_tree(git: Git, *args: str) -> str:
+        listed.append(args[-1])
+        return str(git._call_process("ls_tree", *args))
+
+    monkeypatch.setattr(Git, "ls_tree", counting_ls_tree, raising=False)
+    for _ in range(2):
+        assert trees.exists_in(shas, "docs/guide.md") == [True, True, True]
+        assert trees.blob_sha_at(shas, "src/app.py")[0] is None
+    assert listed == [repo.commit(sha).tree.hexsha for sha in shas]
+    # Subtrees were cached by the listings of the commits they appear in
+    docs_tree = repo.commit(shas[0]).tree["docs"].hexsha
+    assert trees.entries(docs_tree) == {
+        "guide.md": ("blob", repo.commit(shas[0]).tree["docs/guide.md"].hexsha)
+    }
+    assert len(listed) == len(shas)
+
+
+def test_submodules_are_listed_as_commits(git_repos):
+    repo, shas = make_repo(git_repos)
+    repo.git.update_index("--add", "--cacheinfo", f"160000,{shas[0]},docs/lib")
+    sha = git_repos.commit(repo, {}, "Add submodule")
+    trees = TreeHelper(repo)
+
+    docs_tree = repo.commit(sha).tree["docs"].hexsha
+    assert trees.entries(docs_tree)["lib"] == ("commit", shas[0])
+    assert trees.files(sha) == {
+        "docs/guide.md": repo.commit(sha).tree["docs/guide.md"].hexsha,
+        "src/app.py": repo.commit(sha).tree["src/app.py"].hexsha,
+    }
+    assert trees.blob_sha(sha, "docs/lib") is None
+    assert trees.exists_in([shas[2], sha], "docs/guide.md") == [True, True]